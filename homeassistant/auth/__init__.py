@@ -5,6 +5,7 @@ import asyncio
 from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import timedelta
+import hashlib
 import time
 from typing import Any, cast
 
@@ -23,6 +24,11 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Verified access tokens are trusted without verifying them again for
+# a short time, or until their refresh token is removed
+ACCESS_TOKEN_CACHE_TIME = 60
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 _MfaModuleDict = dict[str, MultiFactorAuthModule]
 _ProviderKey = tuple[str, str | None]
 _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -158,6 +164,9 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        self._verified_access_tokens: dict[
+            bytes, tuple[models.RefreshToken, float]
+        ] = {}
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -475,6 +484,12 @@ class AuthManager:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
 
+        for token_digest, (verified_refresh_token, _) in list(
+            self._verified_access_tokens.items()
+        ):
+            if verified_refresh_token.id == refresh_token.id:
+                del self._verified_access_tokens[token_digest]
+
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
             revoke_callback()
@@ -556,6 +571,19 @@ class AuthManager:
         self, token: str
     ) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        token_digest = hashlib.sha256(token.encode("utf-8")).digest()
+        now = time.time()
+        if (verified := self._verified_access_tokens.get(token_digest)) is not None:
+            verified_refresh_token, cache_expire = verified
+            if (
+                now < cache_expire
+                and verified_refresh_token.user.is_active
+                and await self.async_get_refresh_token(verified_refresh_token.id)
+                is verified_refresh_token
+            ):
+                return verified_refresh_token
+            del self._verified_access_tokens[token_digest]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -573,7 +601,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -582,6 +610,13 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if len(self._verified_access_tokens) >= ACCESS_TOKEN_CACHE_SIZE:
+            del self._verified_access_tokens[next(iter(self._verified_access_tokens))]
+        self._verified_access_tokens[token_digest] = (
+            refresh_token,
+            min(now + ACCESS_TOKEN_CACHE_TIME, claims["exp"]),
+        )
+
         return refresh_token
 
     @callback
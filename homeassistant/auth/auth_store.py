@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
+import hashlib
 import hmac
 from logging import getLogger
 from typing import Any
@@ -31,6 +32,11 @@ GROUP_NAME_USER = "Users"
 GROUP_NAME_READ_ONLY = "Read Only"
 
 
+def _token_hash(token: str) -> bytes:
+    """Return the hash a refresh token is indexed by."""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
 class AuthStore:
     """Stores authentication info.
 
@@ -46,6 +52,8 @@ class AuthStore:
         self._users: dict[str, models.User] | None = None
         self._groups: dict[str, models.Group] | None = None
         self._perm_lookup: PermissionLookup | None = None
+        self._refresh_tokens: dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_token: dict[bytes, models.RefreshToken] = {}
         self._store = Store[dict[str, list[dict[str, Any]]]](
             hass, STORAGE_VERSION, STORAGE_KEY, private=True, atomic_writes=True
         )
@@ -150,6 +158,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._async_unindex_refresh_token(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -238,6 +248,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._async_index_refresh_token(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -250,10 +261,12 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        if (stored := self._refresh_tokens.get(refresh_token.id)) is None:
+            return
+
+        self._async_unindex_refresh_token(stored)
+        stored.user.refresh_tokens.pop(stored.id, None)
+        self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -263,12 +276,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -278,14 +286,25 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        refresh_token = self._refresh_tokens_by_token.get(_token_hash(token))
+        # The index is keyed by a hash, compare the tokens themselves
+        # in constant time as well
+        if refresh_token is None or not hmac.compare_digest(refresh_token.token, token):
+            return None
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        return refresh_token
 
-        return found
+    @callback
+    def _async_index_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_token[_token_hash(refresh_token.token)] = refresh_token
+
+    @callback
+    def _async_unindex_refresh_token(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        self._refresh_tokens_by_token.pop(_token_hash(refresh_token.token), None)
 
     @callback
     def async_log_refresh_token_usage(
@@ -490,6 +509,7 @@ class AuthStore:
             if "credential_id" in rt_dict:
                 token.credential = credentials.get(rt_dict["credential_id"])
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._async_index_refresh_token(token)
 
         self._groups = groups
         self._users = users
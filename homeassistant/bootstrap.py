@@ -39,6 +39,7 @@ from .helpers import (
 from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
+    BASE_PLATFORMS,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -544,6 +545,48 @@ async def async_setup_multi_components(
             )
 
 
+@core.callback
+def _async_get_platforms_to_preimport(
+    hass: core.HomeAssistant,
+    integration_cache: dict[str, loader.Integration],
+    domains: set[str],
+) -> dict[loader.Integration, set[str]]:
+    """Return the integrations and platforms to import ahead of setup.
+
+    Dependencies and after dependencies come before the integrations
+    depending on them, a circular dependency is cut where it is found. The
+    platforms of integrations with config entries are likely to be forwarded
+    to, so all entity platforms they have are imported.
+    """
+    platforms_by_integration: dict[loader.Integration, set[str]] = {}
+    visiting: set[str] = set()
+
+    def _add_integration(domain: str) -> None:
+        if (
+            domain in visiting
+            or domain not in domains
+            or (integration := integration_cache.get(domain)) is None
+            or integration in platforms_by_integration
+        ):
+            return
+        visiting.add(domain)
+        for dependency in (
+            *integration.dependencies,
+            *integration.after_dependencies,
+        ):
+            _add_integration(dependency)
+        visiting.discard(domain)
+        platforms = {"config"}
+        if hass.config_entries.async_entries(domain):
+            platforms.add("config_flow")
+            platforms.update(BASE_PLATFORMS)
+        platforms_by_integration[integration] = platforms
+
+    for domain in sorted(domains):
+        _add_integration(domain)
+    return platforms_by_integration
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -664,6 +707,17 @@ async def _async_set_up_integrations(
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
+        # Stage 1 may have updated requirements, so stage 2 integrations
+        # are only imported ahead of their setup from here on
+        hass.async_create_background_task(
+            loader.async_preimport_integrations(
+                hass,
+                _async_get_platforms_to_preimport(
+                    hass, integration_cache, stage_2_domains
+                ),
+            ),
+            "bootstrap preimport integrations",
+        )
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
             async with hass.timeout.async_timeout(
@@ -11,5 +11,9 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    "backups/*.snapshot",
     "OZW_Log.txt",
 ]
+
+# Files replaced by a snapshot are left out with their SQLite journal files
+SNAPSHOT_REPLACED_SUFFIXES = ("", "-journal", "-wal", "-shm")
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import asdict, dataclass
+import functools as ft
 import hashlib
 import json
 from pathlib import Path
+import shutil
 import tarfile
 from tarfile import TarError
 from tempfile import TemporaryDirectory
@@ -21,7 +23,7 @@ from homeassistant.helpers.json import save_json
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER, SNAPSHOT_REPLACED_SUFFIXES
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
@@ -51,6 +53,24 @@ class BackupPlatformProtocol(Protocol):
         """Perform operations after a backup finishes."""
 
 
+class BackupSnapshotPlatformProtocol(BackupPlatformProtocol, Protocol):
+    """Define the format of backup platforms that can snapshot their files.
+
+    A platform implementing async_snapshot_backup copies its files while
+    the pre backup operations are in effect. The post backup operations of
+    the platform are performed right after the snapshot, and the copies
+    replace the original files in the backup.
+    """
+
+    async def async_snapshot_backup(
+        self, hass: HomeAssistant, snapshot_dir: Path
+    ) -> dict[str, Path]:
+        """Copy files to snapshot_dir.
+
+        Returns the copies by their path relative to the config directory.
+        """
+
+
 class BackupManager:
     """Backup manager for the Backup integration."""
 
@@ -162,6 +182,8 @@ class BackupManager:
         if not self.loaded_platforms:
             await self.load_platforms()
 
+        post_backup_platforms = dict(self.platforms)
+        snapshot_dir: Path | None = None
         try:
             self.backing_up = True
             pre_backup_results = await asyncio.gather(
@@ -179,6 +201,27 @@ class BackupManager:
             date_str = dt_util.now().isoformat()
             slug = _generate_slug(date_str, backup_name)
 
+            snapshots: dict[str, Path] = {}
+            for domain, platform in self.platforms.items():
+                if not asyncio.iscoroutinefunction(
+                    getattr(platform, "async_snapshot_backup", None)
+                ):
+                    continue
+                if snapshot_dir is None:
+                    snapshot_dir = Path(self.backup_dir, f"{slug}.snapshot")
+                    await self.hass.async_add_executor_job(
+                        ft.partial(snapshot_dir.mkdir, parents=True, exist_ok=True)
+                    )
+                snapshots.update(
+                    await cast(
+                        BackupSnapshotPlatformProtocol, platform
+                    ).async_snapshot_backup(self.hass, snapshot_dir)
+                )
+                # The platform does not need to hold off changes for the
+                # rest of the backup anymore
+                del post_backup_platforms[domain]
+                await platform.async_post_backup(self.hass)
+
             backup_data = {
                 "slug": slug,
                 "name": backup_name,
@@ -193,6 +236,7 @@ class BackupManager:
                 self._mkdir_and_generate_backup_contents,
                 tar_file_path,
                 backup_data,
+                snapshots,
             )
             backup = Backup(
                 slug=slug,
@@ -207,10 +251,14 @@ class BackupManager:
             return backup
         finally:
             self.backing_up = False
+            if snapshot_dir is not None:
+                await self.hass.async_add_executor_job(
+                    ft.partial(shutil.rmtree, snapshot_dir, ignore_errors=True)
+                )
             post_backup_results = await asyncio.gather(
                 *(
                     platform.async_post_backup(self.hass)
-                    for platform in self.platforms.values()
+                    for platform in post_backup_platforms.values()
                 ),
                 return_exceptions=True,
             )
@@ -222,8 +270,22 @@ class BackupManager:
         self,
         tar_file_path: Path,
         backup_data: dict[str, Any],
+        snapshots: dict[str, Path],
     ) -> int:
-        """Generate backup contents and return the size."""
+        """Generate backup contents and return the size.
+
+        Files with a snapshot are replaced by their snapshot, including the
+        journal files of a SQLite database.
+        """
+        origin_path = Path(self.hass.config.path())
+        excludes = [
+            *EXCLUDE_FROM_BACKUP,
+            *(
+                f"{origin_path.joinpath(relative_path).as_posix()}{suffix}"
+                for relative_path in snapshots
+                for suffix in SNAPSHOT_REPLACED_SUFFIXES
+            ),
+        ]
         if not self.backup_dir.exists():
             LOGGER.debug("Creating backup directory")
             self.backup_dir.mkdir()
@@ -243,10 +305,16 @@ class BackupManager:
             ) as core_tar:
                 atomic_contents_add(
                     tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
+                    origin_path=origin_path,
+                    excludes=excludes,
                     arcname="data",
                 )
+                for relative_path, snapshot_path in snapshots.items():
+                    core_tar.add(
+                        snapshot_path.as_posix(),
+                        arcname=f"data/{relative_path}",
+                        recursive=False,
+                    )
             tar_file.add(tmp_dir_path, arcname=".")
         return tar_file_path.stat().st_size
 
@@ -55,6 +55,8 @@ class BuienradarCam(Camera):
     """
 
     _attr_entity_registry_enabled_default = False
+    # The radar image is cached until it expires
+    _attr_image_cache_ttl = 0
     _attr_name = "Buienradar"
 
     def __init__(
@@ -5,7 +5,6 @@ import asyncio
 import collections
 from collections.abc import Awaitable, Callable, Iterable
 from contextlib import suppress
-from dataclasses import asdict
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import partial
@@ -66,7 +65,11 @@ from .const import (  # noqa: F401
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
+    DEFAULT_IMAGE_CACHE_TTL,
     DOMAIN,
+    IMAGE_CACHE_MAX_SIZES,
+    MAX_IMAGE_CACHE_TTL,
+    PREF_IMAGE_CACHE_TTL,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
     SERVICE_RECORD,
@@ -74,6 +77,7 @@ from .const import (  # noqa: F401
     STREAM_TYPE_WEB_RTC,
     StreamType,
 )
+from .image_cache import CameraImageCache
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
@@ -193,6 +197,35 @@ async def _async_get_image(
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_get_snapshot(camera: Camera, timeout: int = 10) -> Image:
+    """Fetch a full size snapshot to scale the images served to the frontend from.
+
+    The keyframes of a running stream are decoded instead of fetching
+    a new image from the camera.
+    """
+    if (
+        not camera.use_stream_for_stills
+        and (stream := camera.stream)
+        and stream.outputs()
+    ):
+        with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+            async with asyncio.timeout(timeout):
+                if image_bytes := await stream.async_get_image():
+                    return Image(DEFAULT_CONTENT_TYPE, image_bytes)
+    return await _async_get_image(camera, timeout)
+
+
+def _scale_image(image: Image, width: int | None, height: int | None) -> Image:
+    """Scale a snapshot to a requested size on a best effort basis."""
+    if (
+        width is None
+        or height is None
+        or not ("jpeg" in image.content_type or "jpg" in image.content_type)
+    ):
+        return image
+    return Image(image.content_type, scale_jpeg_camera_image(image, width, height))
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -456,6 +489,7 @@ class Camera(Entity):
     _attr_brand: str | None = None
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     _attr_frontend_stream_type: StreamType | None
+    _attr_image_cache_ttl: float = DEFAULT_IMAGE_CACHE_TTL
     _attr_is_on: bool = True
     _attr_is_recording: bool = False
     _attr_is_streaming: bool = False
@@ -475,6 +509,7 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._image_cache: CameraImageCache | None = None
 
     @property
     def entity_picture(self) -> str:
@@ -523,6 +558,14 @@ class Camera(Entity):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @property
+    def image_cache_ttl(self) -> float:
+        """Return for how many seconds a snapshot served to the frontend is reused.
+
+        Users can override this in the camera preferences.
+        """
+        return self._attr_image_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -693,6 +736,25 @@ class Camera(Entity):
 
         return attrs
 
+    @final
+    async def async_get_cached_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> Image:
+        """Fetch an image to serve to the frontend, scaled from a recent snapshot."""
+        if self._image_cache is None:
+            self._image_cache = CameraImageCache(self.hass, IMAGE_CACHE_MAX_SIZES)
+        prefs: CameraPreferences = self.hass.data[DATA_CAMERA_PREFS]
+        if (
+            ttl := (await prefs.async_get_image_cache_ttls()).get(self.entity_id)
+        ) is None:
+            ttl = self.image_cache_ttl
+        return await self._image_cache.async_get(
+            (width, height),
+            ttl,
+            partial(_async_get_snapshot, self, CAMERA_IMAGE_TIMEOUT),
+            _scale_image,
+        )
+
     @callback
     def async_update_token(self) -> None:
         """Update the used token."""
@@ -781,9 +843,7 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
-                camera,
-                CAMERA_IMAGE_TIMEOUT,
+            image = await camera.async_get_cached_image(
                 int(width) if width else None,
                 int(height) if height else None,
             )
@@ -907,8 +967,7 @@ async def websocket_get_prefs(
 ) -> None:
     """Handle request for account info."""
     prefs: CameraPreferences = hass.data[DATA_CAMERA_PREFS]
-    stream_prefs = await prefs.get_dynamic_stream_settings(msg["entity_id"])
-    connection.send_result(msg["id"], asdict(stream_prefs))
+    connection.send_result(msg["id"], await prefs.async_get_prefs(msg["entity_id"]))
 
 
 @websocket_api.websocket_command(
@@ -917,6 +976,10 @@ async def websocket_get_prefs(
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional(PREF_PRELOAD_STREAM): bool,
         vol.Optional(PREF_ORIENTATION): vol.Coerce(Orientation),
+        vol.Optional(PREF_IMAGE_CACHE_TTL): vol.Any(
+            None,
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_IMAGE_CACHE_TTL)),
+        ),
     }
 )
 @websocket_api.async_response
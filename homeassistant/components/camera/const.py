@@ -9,6 +9,7 @@ DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
+PREF_IMAGE_CACHE_TTL: Final = "image_cache_ttl"
 
 SERVICE_RECORD: Final = "record"
 
@@ -18,6 +19,14 @@ CONF_DURATION: Final = "duration"
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
 
+# Seconds a snapshot served to the frontend is reused for other requests.
+# The frontend refreshes camera images every 10 seconds, clients viewing the
+# same camera share the snapshots for half of that.
+DEFAULT_IMAGE_CACHE_TTL: Final = 5.0
+MAX_IMAGE_CACHE_TTL: Final = 60.0
+# Number of requested image sizes to cache per camera
+IMAGE_CACHE_MAX_SIZES: Final = 8
+
 
 class StreamType(StrEnum):
     """Camera stream type.
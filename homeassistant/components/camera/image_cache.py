@@ -0,0 +1,85 @@
+"""Cache of the camera images served to the frontend."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import Image
+
+ImageSize = tuple[int | None, int | None]
+
+
+class CameraImageCache:
+    """Snapshot of a camera and the variants scaled from it.
+
+    Concurrent requests share a single fetch of the snapshot, and the
+    snapshot is served for ttl seconds. The requested sizes are scaled from
+    the snapshot, the variants of the least recently requested sizes are
+    dropped when more than max_sizes are cached.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_sizes: int) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._max_sizes = max_sizes
+        self._snapshot: tuple[float, Image] | None = None
+        self._fetch: asyncio.Task[Image] | None = None
+        self._variants: OrderedDict[ImageSize, Image] = OrderedDict()
+
+    async def async_get(
+        self,
+        size: ImageSize,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Image]],
+        scale: Callable[[Image, int | None, int | None], Image],
+    ) -> Image:
+        """Return the image of a size, scaled from the cached snapshot."""
+        snapshot = await self._async_get_snapshot(ttl, fetch)
+        if size == (None, None):
+            return snapshot
+        if (variant := self._variants.get(size)) is not None:
+            self._variants.move_to_end(size)
+            return variant
+        variant = scale(snapshot, *size)
+        # The snapshot may have been replaced while waiting for the fetch
+        if self._snapshot is not None and self._snapshot[1] is snapshot:
+            self._variants[size] = variant
+            while len(self._variants) > self._max_sizes:
+                self._variants.popitem(last=False)
+        return variant
+
+    async def _async_get_snapshot(
+        self, ttl: float, fetch: Callable[[], Awaitable[Image]]
+    ) -> Image:
+        """Return the cached snapshot or fetch a new one."""
+        if self._snapshot is not None:
+            if time.monotonic() - self._snapshot[0] < ttl:
+                return self._snapshot[1]
+            self._snapshot = None
+            self._variants.clear()
+        if self._fetch is None:
+            self._fetch = self._hass.async_create_task(
+                self._async_fetch(ttl, fetch), "camera image fetch"
+            )
+        # A waiting request that is cancelled must not cancel the fetch
+        # other requests are waiting for
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(
+        self, ttl: float, fetch: Callable[[], Awaitable[Image]]
+    ) -> Image:
+        """Fetch a snapshot and cache it."""
+        try:
+            image = await fetch()
+        finally:
+            self._fetch = None
+        if ttl > 0:
+            self._snapshot = (time.monotonic(), image)
+            self._variants.clear()
+        return image
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import asdict, dataclass
-from typing import Final, cast
+from typing import Any, Final, cast
 
 from homeassistant.components.stream import Orientation
 from homeassistant.core import HomeAssistant
@@ -12,7 +12,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 
-from .const import DOMAIN, PREF_ORIENTATION, PREF_PRELOAD_STREAM
+from .const import DOMAIN, PREF_IMAGE_CACHE_TTL, PREF_ORIENTATION, PREF_PRELOAD_STREAM
 
 STORAGE_KEY: Final = DOMAIN
 STORAGE_VERSION: Final = 1
@@ -33,13 +33,14 @@ class CameraPreferences:
         """Initialize camera prefs."""
         self._hass = hass
         # The orientation prefs are stored in in the entity registry options
-        # The preload_stream prefs are stored in this Store
-        self._store = Store[dict[str, dict[str, bool | Orientation]]](
+        # The preload_stream and image_cache_ttl prefs are stored in this Store
+        self._store = Store[dict[str, dict[str, bool | float | None]]](
             hass, STORAGE_VERSION, STORAGE_KEY
         )
         self._dynamic_stream_settings_by_entity_id: dict[
             str, DynamicStreamSettings
         ] = {}
+        self._image_cache_ttls: dict[str, float | None] | None = None
 
     async def async_update(
         self,
@@ -47,11 +48,12 @@ class CameraPreferences:
         *,
         preload_stream: bool | UndefinedType = UNDEFINED,
         orientation: Orientation | UndefinedType = UNDEFINED,
-    ) -> dict[str, bool | Orientation]:
+        image_cache_ttl: float | None | UndefinedType = UNDEFINED,
+    ) -> dict[str, Any]:
         """Update camera preferences.
 
         Also update the DynamicStreamSettings if they exist.
-        preload_stream is stored in a Store
+        preload_stream and image_cache_ttl are stored in a Store
         orientation is stored in the Entity Registry
 
         Returns a dict with the preferences on success.
@@ -64,7 +66,9 @@ class CameraPreferences:
             if dynamic_stream_settings:
                 dynamic_stream_settings.preload_stream = preload_stream
             preload_prefs = await self._store.async_load() or {}
-            preload_prefs[entity_id] = {PREF_PRELOAD_STREAM: preload_stream}
+            preload_prefs.setdefault(entity_id, {})[
+                PREF_PRELOAD_STREAM
+            ] = preload_stream
             await self._store.async_save(preload_prefs)
 
         if orientation is not UNDEFINED:
@@ -79,7 +83,36 @@ class CameraPreferences:
                 )
             if dynamic_stream_settings:
                 dynamic_stream_settings.orientation = orientation
-        return asdict(await self.get_dynamic_stream_settings(entity_id))
+
+        if image_cache_ttl is not UNDEFINED:
+            image_cache_ttls = await self.async_get_image_cache_ttls()
+            image_cache_ttls[entity_id] = image_cache_ttl
+            stored_prefs = await self._store.async_load() or {}
+            stored_prefs.setdefault(entity_id, {})[
+                PREF_IMAGE_CACHE_TTL
+            ] = image_cache_ttl
+            await self._store.async_save(stored_prefs)
+        return await self.async_get_prefs(entity_id)
+
+    async def async_get_prefs(self, entity_id: str) -> dict[str, Any]:
+        """Get all preferences of a camera."""
+        return {
+            **asdict(await self.get_dynamic_stream_settings(entity_id)),
+            PREF_IMAGE_CACHE_TTL: (await self.async_get_image_cache_ttls()).get(
+                entity_id
+            ),
+        }
+
+    async def async_get_image_cache_ttls(self) -> dict[str, float | None]:
+        """Get the image cache ttls users set, None uses the camera default."""
+        if self._image_cache_ttls is None:
+            stored_prefs = await self._store.async_load() or {}
+            self._image_cache_ttls = {
+                entity_id: cast(float | None, prefs[PREF_IMAGE_CACHE_TTL])
+                for entity_id, prefs in stored_prefs.items()
+                if PREF_IMAGE_CACHE_TTL in prefs
+            }
+        return self._image_cache_ttls
 
     async def get_dynamic_stream_settings(
         self, entity_id: str
@@ -371,7 +371,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ("frontend_latest", not is_dev),
         ("frontend_es5", not is_dev),
     ):
-        hass.http.register_static_path(f"/{path}", str(root_path / path), should_cache)
+        # The files of a built frontend don't change while running
+        hass.http.register_static_path(
+            f"/{path}", str(root_path / path), should_cache, in_memory=should_cache
+        )
 
     hass.http.register_static_path(
         "/auth/authorize", str(root_path / "authorize.html"), False
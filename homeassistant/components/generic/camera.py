@@ -128,6 +128,8 @@ def generate_auth(device_info: Mapping[str, Any]) -> httpx.Auth | None:
 class GenericCamera(Camera):
     """A generic implementation of an IP camera."""
 
+    # Refetching is limited with the limit_refetch_to_url_change option
+    _attr_image_cache_ttl = 0
     _last_image: bytes | None
 
     def __init__(
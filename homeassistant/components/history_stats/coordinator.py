@@ -37,6 +37,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         self._subscriber_count = 0
         self._at_start_listener: CALLBACK_TYPE | None = None
         self._track_events_listener: CALLBACK_TYPE | None = None
+        self._track_history_listener: CALLBACK_TYPE | None = None
         super().__init__(
             hass,
             _LOGGER,
@@ -67,6 +68,9 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
         if self._track_events_listener:
             self._track_events_listener()
             self._track_events_listener = None
+        if self._track_history_listener:
+            self._track_history_listener()
+            self._track_history_listener = None
         if self._at_start_listener:
             self._at_start_listener()
             self._at_start_listener = None
@@ -82,6 +86,7 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
     def _async_add_events_listener(self, *_: Any) -> None:
         """Handle hass starting and start tracking events."""
         self._at_start_listener = None
+        self._track_history_listener = self._history_stats.async_track_history()
         self._track_events_listener = async_track_state_change_event(
             self.hass, [self._history_stats.entity_id], self._async_update_from_event
         )
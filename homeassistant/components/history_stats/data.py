@@ -1,12 +1,18 @@
 """Manage the history_stats data."""
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.event import EventStateChangedData
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
@@ -15,6 +21,8 @@ from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+DATA_ENTITY_HISTORY = "history_stats_entity_history"
+
 
 @dataclass
 class HistoryStatsState:
@@ -33,6 +41,155 @@ class HistoryState:
     last_changed: float
 
 
+_last_changed = attrgetter("last_changed")
+
+
+class EntityHistory:
+    """Shared history of the state changes of an entity.
+
+    While any history stats of the entity tracks state changes, the
+    history is kept up to date from the state changes, and periods
+    which start after the oldest loaded state are served from memory
+    instead of querying the database again.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the entity history."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self._states: list[HistoryState] = []
+        self._start_timestamp: float | None = None
+        self._consumer_starts: dict[int, float] = {}
+        self._load_lock = asyncio.Lock()
+        self._unsub_state_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_attach(self, consumer: object) -> CALLBACK_TYPE:
+        """Keep the history up to date while the consumer is attached."""
+        key = id(consumer)
+        self._consumer_starts.setdefault(key, float("inf"))
+        if self._unsub_state_listener is None:
+            self._unsub_state_listener = async_track_state_change_event(
+                self.hass, [self.entity_id], self._async_state_listener
+            )
+
+        @callback
+        def _async_detach() -> None:
+            self._consumer_starts.pop(key, None)
+            if self._consumer_starts:
+                self._async_prune()
+                return
+            if self._unsub_state_listener:
+                self._unsub_state_listener()
+                self._unsub_state_listener = None
+            self._states = []
+            self._start_timestamp = None
+            self.hass.data[DATA_ENTITY_HISTORY].pop(self.entity_id, None)
+
+        return _async_detach
+
+    @callback
+    def _async_state_listener(self, event: EventType[EventStateChangedData]) -> None:
+        """Add the new state to the history."""
+        if (new_state := event.data["new_state"]) is not None:
+            self.async_add_state(new_state)
+
+    @callback
+    def async_add_state(self, state: State) -> None:
+        """Add a state to the history if it is newer than the last one."""
+        if self._start_timestamp is None and not self._load_lock.locked():
+            return
+        last_changed = state.last_changed.timestamp()
+        if self._states and last_changed <= self._states[-1].last_changed:
+            return
+        self._states.append(HistoryState(state.state, last_changed))
+
+    async def async_get_history(
+        self, consumer: object, start_timestamp: float, end_timestamp: float
+    ) -> list[HistoryState]:
+        """Return the state at the start and the state changes during a period."""
+        if self._unsub_state_listener is None:
+            return await self._async_states_from_db(start_timestamp, end_timestamp)
+
+        if id(consumer) in self._consumer_starts:
+            self._consumer_starts[id(consumer)] = start_timestamp
+        async with self._load_lock:
+            if self._start_timestamp is None or start_timestamp < self._start_timestamp:
+                # Only the part of the period before the loaded history is
+                # missing, the state changes after it are already known
+                states = await self._async_states_from_db(
+                    start_timestamp, self._start_timestamp
+                )
+                last_changed = states[-1].last_changed if states else float("-inf")
+                states.extend(
+                    state for state in self._states if state.last_changed > last_changed
+                )
+                self._states = states
+                self._start_timestamp = start_timestamp
+        self._async_prune()
+
+        states = self._states
+        start = bisect_right(states, start_timestamp, key=_last_changed)
+        end = bisect_right(states, end_timestamp, key=_last_changed)
+        if start == 0:
+            return states[:end]
+        # The state at the start of the period as the database would return it
+        return [HistoryState(states[start - 1].state, start_timestamp)] + states[
+            start:end
+        ]
+
+    @callback
+    def _async_prune(self) -> None:
+        """Drop the state changes before the oldest period any consumer needs."""
+        if self._start_timestamp is None:
+            return
+        oldest_start = min(self._consumer_starts.values(), default=float("inf"))
+        if oldest_start <= self._start_timestamp:
+            return
+        if (start := bisect_right(self._states, oldest_start, key=_last_changed)) > 1:
+            del self._states[: start - 1]
+        self._start_timestamp = oldest_start
+
+    async def _async_states_from_db(
+        self, start_timestamp: float, end_timestamp: float | None
+    ) -> list[HistoryState]:
+        """Return the state changes during a period from the database."""
+        instance = get_instance(self.hass)
+        states = await instance.async_add_executor_job(
+            self._state_changes_during_period, start_timestamp, end_timestamp
+        )
+        return [
+            HistoryState(state.state, state.last_changed.timestamp())
+            for state in states
+        ]
+
+    def _state_changes_during_period(
+        self, start_ts: float, end_ts: float | None
+    ) -> list[State]:
+        """Return state changes during a period."""
+        start = dt_util.utc_from_timestamp(start_ts)
+        end = dt_util.utc_from_timestamp(end_ts) if end_ts is not None else None
+        return history.state_changes_during_period(
+            self.hass,
+            start,
+            end,
+            self.entity_id,
+            include_start_time_state=True,
+            no_attributes=True,
+        ).get(self.entity_id, [])
+
+
+@callback
+def async_get_entity_history(hass: HomeAssistant, entity_id: str) -> EntityHistory:
+    """Return the shared history of an entity."""
+    entity_histories: dict[str, EntityHistory] = hass.data.setdefault(
+        DATA_ENTITY_HISTORY, {}
+    )
+    if (entity_history := entity_histories.get(entity_id)) is None:
+        entity_history = entity_histories[entity_id] = EntityHistory(hass, entity_id)
+    return entity_history
+
+
 class HistoryStats:
     """Manage history stats."""
 
@@ -50,13 +207,24 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
+        self._history = async_get_entity_history(hass, entity_id)
+        # Running totals of the current period up to the last state change
+        self._has_history = False
+        self._seconds_until_last_change = 0.0
+        self._match_count = 0
+        self._last_change_matches = False
+        self._last_change_timestamp = 0.0
         self._previous_run_before_start = False
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
         self._end = end
 
+    @callback
+    def async_track_history(self) -> CALLBACK_TYPE:
+        """Keep the shared history of the entity up to date from state changes."""
+        return self._history.async_attach(self)
+
     async def async_update(
         self, event: EventType[EventStateChangedData] | None
     ) -> HistoryStatsState:
@@ -84,7 +252,7 @@ class HistoryStats:
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
+            self._async_reset_totals(current_period_start_timestamp, [])
             self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
@@ -109,12 +277,13 @@ class HistoryStats:
         ):
             new_data = False
             if event and (new_state := event.data["new_state"]) is not None:
+                self._history.async_add_state(new_state)
                 if (
                     current_period_start_timestamp
                     <= floored_timestamp(new_state.last_changed)
                     <= current_period_end_timestamp
                 ):
-                    self._history_current_period.append(
+                    self._async_add_to_totals(
                         HistoryState(
                             new_state.state, new_state.last_changed.timestamp()
                         )
@@ -125,84 +294,62 @@ class HistoryStats:
                 # Don't compute anything as the value cannot have changed
                 return self._state
         else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
+            self._async_reset_totals(
+                current_period_start_timestamp,
+                await self._history.async_get_history(
+                    self, current_period_start_timestamp, current_period_end_timestamp
+                ),
             )
             self._previous_run_before_start = False
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
-            now_timestamp,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
+            now_timestamp, current_period_end_timestamp
         )
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
-    async def _async_history_from_db(
-        self,
-        current_period_start_timestamp: float,
-        current_period_end_timestamp: float,
+    @callback
+    def _async_reset_totals(
+        self, start_timestamp: float, history_states: list[HistoryState]
     ) -> None:
-        """Update history data for the current period from the database."""
-        instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
-            self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
-        )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
-
-    def _state_changes_during_period(
-        self, start_ts: float, end_ts: float
-    ) -> list[State]:
-        """Return state changes during a period."""
-        start = dt_util.utc_from_timestamp(start_ts)
-        end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
-            self.hass,
-            start,
-            end,
-            self.entity_id,
-            include_start_time_state=True,
-            no_attributes=True,
-        ).get(self.entity_id, [])
-
-    def _async_compute_seconds_and_changes(
-        self, now_timestamp: float, start_timestamp: float, end_timestamp: float
-    ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
-        )
-        last_state_change_timestamp = start_timestamp
-        elapsed = 0.0
-        match_count = 1 if previous_state_matches else 0
+        """Compute the running totals of a period from its history."""
+        self._has_history = False
+        self._seconds_until_last_change = 0.0
+        self._match_count = 0
+        self._last_change_matches = False
+        self._last_change_timestamp = start_timestamp
+        for history_state in history_states:
+            self._async_add_to_totals(history_state)
 
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
+    @callback
+    def _async_add_to_totals(self, history_state: HistoryState) -> None:
+        """Add a state change to the running totals."""
+        current_state_matches = history_state.state in self._entity_states
+        if not self._has_history:
+            # state_changes_during_period is called with
+            # include_start_time_state=True which always provides
+            # the state at the start of the period
+            self._has_history = True
+            self._last_change_matches = current_state_matches
+            self._match_count = 1 if current_state_matches else 0
 
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
+        if self._last_change_matches:
+            self._seconds_until_last_change += (
+                history_state.last_changed - self._last_change_timestamp
+            )
+        elif current_state_matches:
+            self._match_count += 1
 
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = state_change_timestamp
+        self._last_change_matches = current_state_matches
+        self._last_change_timestamp = history_state.last_changed
 
+    def _async_compute_seconds_and_changes(
+        self, now_timestamp: float, end_timestamp: float
+    ) -> tuple[float, int]:
+        """Compute the seconds matched and changes from the running totals."""
+        seconds_matched = self._seconds_until_last_change
         # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
+        if self._last_change_matches:
             measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
+            seconds_matched += measure_end - self._last_change_timestamp
+        return seconds_matched, self._match_count
@@ -50,12 +50,31 @@ async def async_get_config_entry_diagnostics(
                 str(client): props for client, props in state.client_properties.items()
             },
             "config_version": state.config_version,
+            "connections": _get_connections_diagnostics(driver),
             "pairing_id": state.mac,
         }
     )
     return data
 
 
+def _get_connections_diagnostics(driver: AccessoryDriver) -> dict[str, Any]:
+    """Return the events queued on each HAP connection.
+
+    HAP-python coalesces the events of a connection and sends them when
+    its event timer fires.
+    """
+    now = driver.loop.time()
+    connections: dict[str, Any] = {}
+    for client, protocol in driver.http_server.connections.items():
+        # pylint: disable-next=protected-access
+        event_queue, event_timer = protocol._event_queue, protocol._event_timer
+        connections[str(client)] = {
+            "queued_events": len(event_queue),
+            "next_flush": max(event_timer.when() - now, 0.0) if event_timer else None,
+        }
+    return connections
+
+
 def _get_bridge_diagnostics(hass: HomeAssistant, bridge: HomeBridge) -> dict[int, Any]:
     """Return diagnostics for a bridge."""
     return {
@@ -51,9 +51,10 @@ from .cors import setup_cors
 from .decorators import require_admin  # noqa: F401
 from .forwarded import async_setup_forwarded
 from .headers import setup_headers
+from .middleware import MiddlewareTimings, setup_middleware_timings
 from .request_context import current_request, setup_request_context
 from .security_filter import setup_security_filter
-from .static import CACHE_HEADERS, CachingStaticResource
+from .static import CACHE_HEADERS, CachingStaticResource, InMemoryStaticResource
 from .view import HomeAssistantView
 from .web_runner import HomeAssistantTCPSite
 
@@ -72,6 +73,7 @@ CONF_TRUSTED_PROXIES: Final = "trusted_proxies"
 CONF_LOGIN_ATTEMPTS_THRESHOLD: Final = "login_attempts_threshold"
 CONF_IP_BAN_ENABLED: Final = "ip_ban_enabled"
 CONF_SSL_PROFILE: Final = "ssl_profile"
+CONF_MIDDLEWARE_TIMINGS: Final = "middleware_timings"
 
 SSL_MODERN: Final = "modern"
 SSL_INTERMEDIATE: Final = "intermediate"
@@ -118,6 +120,7 @@ HTTP_SCHEMA: Final = vol.All(
                 [SSL_INTERMEDIATE, SSL_MODERN]
             ),
             vol.Optional(CONF_USE_X_FRAME_OPTIONS, default=True): cv.boolean,
+            vol.Optional(CONF_MIDDLEWARE_TIMINGS, default=False): cv.boolean,
         }
     ),
 )
@@ -141,6 +144,7 @@ class ConfData(TypedDict, total=False):
     login_attempts_threshold: int
     ip_ban_enabled: bool
     ssl_profile: str
+    middleware_timings: bool
 
 
 @bind_hass
@@ -188,6 +192,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     is_ban_enabled = conf[CONF_IP_BAN_ENABLED]
     login_threshold = conf[CONF_LOGIN_ATTEMPTS_THRESHOLD]
     ssl_profile = conf[CONF_SSL_PROFILE]
+    middleware_timings = conf.get(CONF_MIDDLEWARE_TIMINGS, False)
 
     server = HomeAssistantHTTP(
         hass,
@@ -205,6 +210,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         login_threshold=login_threshold,
         is_ban_enabled=is_ban_enabled,
         use_x_frame_options=use_x_frame_options,
+        middleware_timings=middleware_timings,
     )
 
     async def stop_server(event: Event) -> None:
@@ -307,6 +313,7 @@ class HomeAssistantHTTP:
         self.trusted_proxies = trusted_proxies
         self.ssl_profile = ssl_profile
         self.runner: web.AppRunner | None = None
+        self.middleware_timings: MiddlewareTimings | None = None
         self.site: HomeAssistantTCPSite | None = None
         self.context: ssl.SSLContext | None = None
 
@@ -318,6 +325,7 @@ class HomeAssistantHTTP:
         login_threshold: int,
         is_ban_enabled: bool,
         use_x_frame_options: bool,
+        middleware_timings: bool = False,
     ) -> None:
         """Initialize the server."""
         self.app[KEY_HASS] = self.hass
@@ -338,6 +346,10 @@ class HomeAssistantHTTP:
         setup_headers(self.app, use_x_frame_options)
         setup_cors(self.app, cors_origins)
 
+        if middleware_timings:
+            self.middleware_timings = setup_middleware_timings(self.app)
+            self.register_view(MiddlewareTimingsView(self.middleware_timings))
+
         if self.ssl_certificate:
             self.context = await self.hass.async_add_executor_job(
                 self._create_ssl_context
@@ -390,14 +402,24 @@ class HomeAssistantHTTP:
         )
 
     def register_static_path(
-        self, url_path: str, path: str, cache_headers: bool = True
+        self,
+        url_path: str,
+        path: str,
+        cache_headers: bool = True,
+        in_memory: bool = False,
     ) -> None:
-        """Register a folder or file to serve as a static path."""
+        """Register a folder or file to serve as a static path.
+
+        Files of a folder registered with in_memory are kept in memory,
+        they must not change while Home Assistant is running.
+        """
         if os.path.isdir(path):
-            if cache_headers:
+            if cache_headers and in_memory:
                 resource: CachingStaticResource | web.StaticResource = (
-                    CachingStaticResource(url_path, path)
+                    InMemoryStaticResource(url_path, path)
                 )
+            elif cache_headers:
+                resource = CachingStaticResource(url_path, path)
             else:
                 resource = web.StaticResource(url_path, path)
             self.app.router.register_resource(resource)
@@ -545,6 +567,22 @@ class HomeAssistantHTTP:
             await self.runner.cleanup()
 
 
+class MiddlewareTimingsView(HomeAssistantView):
+    """View to get the time spent in the middlewares."""
+
+    url = "/api/http/middleware_timings"
+    name = "api:http:middleware_timings"
+
+    def __init__(self, timings: MiddlewareTimings) -> None:
+        """Initialize the view."""
+        self.timings = timings
+
+    @require_admin
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the middleware timing histograms."""
+        return self.json(self.timings.as_dict())
+
+
 async def start_http_server_and_save_config(
     hass: HomeAssistant, conf: dict, server: HomeAssistantHTTP
 ) -> None:
@@ -26,6 +26,7 @@ from homeassistant.helpers.storage import Store
 from homeassistant.util.network import is_local
 
 from .const import KEY_AUTHENTICATED, KEY_HASS_REFRESH_TOKEN_ID, KEY_HASS_USER
+from .middleware import skip_for_lightweight_routes
 from .request_context import current_request
 
 _LOGGER = logging.getLogger(__name__)
@@ -198,6 +199,7 @@ async def async_setup_auth(hass: HomeAssistant, app: Application) -> None:
         request[KEY_HASS_REFRESH_TOKEN_ID] = refresh_token.id
         return True
 
+    @skip_for_lightweight_routes
     @middleware
     async def auth_middleware(
         request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
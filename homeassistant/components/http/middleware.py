@@ -0,0 +1,120 @@
+"""Lightweight routes and middleware timings for the HTTP component."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Any, Final
+
+from aiohttp.typedefs import Handler, Middleware
+from aiohttp.web import Application, Request, StreamResponse, middleware
+
+# Upper bounds of the timing histogram buckets, in seconds
+TIMING_BUCKETS: Final = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    float("inf"),
+)
+
+ATTR_LIGHTWEIGHT: Final = "__ha_lightweight__"
+
+
+def skip_for_lightweight_routes(func: Middleware) -> Middleware:
+    """Skip a middleware for the requests of lightweight routes."""
+
+    @middleware
+    @wraps(func)
+    async def skip_middleware(request: Request, handler: Handler) -> StreamResponse:
+        """Call the middleware unless the route is lightweight."""
+        if getattr(request.match_info.handler, ATTR_LIGHTWEIGHT, False):
+            return await handler(request)
+        return await func(request, handler)
+
+    return skip_middleware
+
+
+def lightweight_route(handler: Handler) -> Handler:
+    """Mark a route handler as lightweight.
+
+    Lightweight routes don't require authentication and don't look at the
+    user of the request, the middlewares they don't need are skipped.
+    """
+    setattr(handler, ATTR_LIGHTWEIGHT, True)
+    return handler
+
+
+class MiddlewareTimings:
+    """Histograms of the time spent in each middleware.
+
+    The time of a middleware excludes the time spent in the handler
+    and the middlewares it calls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timings."""
+        self._counts: dict[str, list[int]] = {}
+        self._sums: dict[str, float] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        """Record the time spent in a middleware."""
+        if (counts := self._counts.get(name)) is None:
+            counts = self._counts[name] = [0] * len(TIMING_BUCKETS)
+            self._sums[name] = 0.0
+        counts[bisect_left(TIMING_BUCKETS, duration)] += 1
+        self._sums[name] += duration
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the cumulative histograms of the middlewares."""
+        result: dict[str, dict[str, Any]] = {}
+        for name, counts in self._counts.items():
+            buckets: dict[str, int] = {}
+            total = 0
+            for bound, count in zip(TIMING_BUCKETS, counts):
+                total += count
+                buckets["+Inf" if bound == float("inf") else str(bound)] = total
+            result[name] = {"count": total, "sum": self._sums[name], "buckets": buckets}
+        return result
+
+
+def _timed_middleware(
+    name: str, func: Middleware, timings: MiddlewareTimings
+) -> Middleware:
+    """Wrap a middleware to record the time spent in it."""
+
+    @middleware
+    async def timed_middleware(request: Request, handler: Handler) -> StreamResponse:
+        """Call the middleware and record its own time."""
+        inner = 0.0
+
+        async def timed_handler(request: Request) -> StreamResponse:
+            nonlocal inner
+            inner_start = perf_counter()
+            try:
+                return await handler(request)
+            finally:
+                inner = perf_counter() - inner_start
+
+        start = perf_counter()
+        try:
+            return await func(request, timed_handler)
+        finally:
+            timings.record(name, perf_counter() - start - inner)
+
+    return timed_middleware
+
+
+def setup_middleware_timings(app: Application) -> MiddlewareTimings:
+    """Record the time spent in the middlewares registered so far."""
+    timings = MiddlewareTimings()
+    app.middlewares[:] = [
+        _timed_middleware(func.__name__, func, timings) for func in app.middlewares
+    ]
+    return timings
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 import logging
 import re
 from typing import Final
@@ -37,45 +38,60 @@ FILTERS: Final = re.compile(
 
 # Unsafe bytes to be removed per WHATWG spec
 UNSAFE_URL_BYTES = ["\t", "\r", "\n"]
+UNSAFE_URL_BYTES_FILTER: Final = re.compile(f"[{''.join(UNSAFE_URL_BYTES)}]")
+
+# Most requests are made to the same few paths, like the API endpoints
+PATH_FILTER_CACHE_SIZE: Final = 512
+
+
+def _recursive_unquote(value: str) -> str:
+    """Handle values that are encoded multiple times."""
+    while "%" in value and (unquoted := unquote(value)) != value:
+        value = unquoted
+    return value
+
+
+def _is_harmful(value: str) -> bool:
+    """Return if a path or query string is a potential exploit attempt."""
+    return FILTERS.search(_recursive_unquote(value)) is not None
+
+
+_is_harmful_path = lru_cache(maxsize=PATH_FILTER_CACHE_SIZE)(_is_harmful)
 
 
 @callback
 def setup_security_filter(app: Application) -> None:
     """Create security filter middleware for the app."""
 
-    def _recursive_unquote(value: str) -> str:
-        """Handle values that are encoded multiple times."""
-        if (unquoted := unquote(value)) != value:
-            unquoted = _recursive_unquote(unquoted)
-        return unquoted
-
     @middleware
     async def security_filter_middleware(
         request: Request, handler: Callable[[Request], Awaitable[StreamResponse]]
     ) -> StreamResponse:
         """Process request and block commonly known exploit attempts."""
-        for unsafe_byte in UNSAFE_URL_BYTES:
-            if unsafe_byte in request.path:
-                _LOGGER.warning(
-                    "Filtered a request with an unsafe byte in path: %s",
-                    request.raw_path,
-                )
-                raise HTTPBadRequest
-
-            if unsafe_byte in request.query_string:
-                _LOGGER.warning(
-                    "Filtered a request with unsafe byte query string: %s",
-                    request.raw_path,
-                )
-                raise HTTPBadRequest
-
-        if FILTERS.search(_recursive_unquote(request.path)):
+        path = request.path
+        query_string = request.query_string
+
+        if UNSAFE_URL_BYTES_FILTER.search(path):
+            _LOGGER.warning(
+                "Filtered a request with an unsafe byte in path: %s",
+                request.raw_path,
+            )
+            raise HTTPBadRequest
+
+        if query_string and UNSAFE_URL_BYTES_FILTER.search(query_string):
+            _LOGGER.warning(
+                "Filtered a request with unsafe byte query string: %s",
+                request.raw_path,
+            )
+            raise HTTPBadRequest
+
+        if _is_harmful_path(path):
             _LOGGER.warning(
                 "Filtered a potential harmful request to: %s", request.raw_path
             )
             raise HTTPBadRequest
 
-        if FILTERS.search(_recursive_unquote(request.query_string)):
+        if query_string and _is_harmful(query_string):
             _LOGGER.warning(
                 "Filtered a request with a potential harmful query string: %s",
                 request.raw_path,
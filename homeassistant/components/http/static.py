@@ -1,13 +1,16 @@
 """Static file handling for HTTP component."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass
 import mimetypes
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.helpers import ETAG_ANY
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -21,6 +24,11 @@ CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {hdrs.CACHE_CONTROL: CACHE_HEADER}
 PATH_CACHE: LRU[tuple[str, Path, bool], tuple[Path | None, str | None]] = LRU(512)
 
+MEMORY_CACHE_MAX_SIZE: Final = 32 * 1024 * 1024
+MEMORY_CACHE_MAX_FILE_SIZE: Final = 1024 * 1024
+# Pre-built variants of a file, in order of preference
+ENCODING_EXTENSIONS: Final = (("br", ".br"), ("gzip", ".gz"))
+
 
 def _get_file_path(rel_url: str, directory: Path, follow_symlinks: bool) -> Path | None:
     """Return the path to file on disk or None."""
@@ -41,6 +49,92 @@ def _get_file_path(rel_url: str, directory: Path, follow_symlinks: bool) -> Path
     raise FileNotFoundError
 
 
+@dataclass(slots=True)
+class StaticFileVariant:
+    """The content of a file, or of a pre-built compressed variant of it."""
+
+    body: bytes
+    etag: str
+    last_modified: float
+
+
+@dataclass(slots=True)
+class StaticFile:
+    """A static file kept in memory with its pre-built variants."""
+
+    content_type: str
+    variants: dict[str | None, StaticFileVariant]
+    size: int
+
+
+class StaticFileCache:
+    """LRU cache of static files, limited by their total size."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.size = 0
+        self._files: OrderedDict[tuple[str, Path, bool], StaticFile] = OrderedDict()
+
+    def get(self, key: tuple[str, Path, bool]) -> StaticFile | None:
+        """Return a cached file and mark it as recently used."""
+        if (static_file := self._files.get(key)) is not None:
+            self._files.move_to_end(key)
+        return static_file
+
+    def set(self, key: tuple[str, Path, bool], static_file: StaticFile) -> None:
+        """Cache a file, dropping the least recently used files to fit it."""
+        if (old_file := self._files.pop(key, None)) is not None:
+            self.size -= old_file.size
+        self._files[key] = static_file
+        self.size += static_file.size
+        while self.size > self.max_size and len(self._files) > 1:
+            _, dropped_file = self._files.popitem(last=False)
+            self.size -= dropped_file.size
+
+
+MEMORY_CACHE = StaticFileCache(MEMORY_CACHE_MAX_SIZE)
+
+
+def _read_variant(path: Path) -> StaticFileVariant:
+    """Read a file and the validators aiohttp would use for it."""
+    stat = path.stat()
+    return StaticFileVariant(
+        path.read_bytes(), f"{stat.st_mtime_ns:x}-{stat.st_size:x}", stat.st_mtime
+    )
+
+
+def _load_static_file(
+    rel_url: str, directory: Path, follow_symlinks: bool
+) -> StaticFile | None:
+    """Load a file and its pre-built variants or None if it should not be cached."""
+    if (filepath := _get_file_path(rel_url, directory, follow_symlinks)) is None:
+        return None
+    if filepath.stat().st_size > MEMORY_CACHE_MAX_FILE_SIZE:
+        return None
+    variants: dict[str | None, StaticFileVariant] = {None: _read_variant(filepath)}
+    for encoding, extension in ENCODING_EXTENSIONS:
+        variant_path = filepath.with_name(filepath.name + extension)
+        if variant_path.is_file():
+            variants[encoding] = _read_variant(variant_path)
+    return StaticFile(
+        mimetypes.guess_type(rel_url)[0] or "application/octet-stream",
+        variants,
+        sum(len(variant.body) for variant in variants.values()),
+    )
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the content encodings accepted by a client."""
+    encodings = set()
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        encodings.add(name.strip())
+    return encodings
+
+
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
@@ -83,3 +177,78 @@ class CachingStaticResource(StaticResource):
             )
 
         return await super()._handle(request)
+
+
+class InMemoryStaticResource(CachingStaticResource):
+    """Static Resource handler that serves the files from memory.
+
+    Only use it for files which do not change while Home Assistant is
+    running, like the frontend. Pre-built brotli and gzip variants are
+    served to the clients accepting them. Conditional requests are
+    answered from memory. Files which are too large, range requests and
+    rarely used preconditions are handled by CachingStaticResource.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._uncacheable: set[str] = set()
+
+    async def _handle(self, request: Request) -> StreamResponse:
+        """Return requested file from memory."""
+        rel_url = request.match_info["filename"]
+        headers = request.headers
+        if (
+            rel_url in self._uncacheable
+            or hdrs.RANGE in headers
+            or hdrs.IF_MATCH in headers
+            or hdrs.IF_UNMODIFIED_SINCE in headers
+        ):
+            return await super()._handle(request)
+
+        key = (rel_url, self._directory, self._follow_symlinks)
+        if (static_file := MEMORY_CACHE.get(key)) is None:
+            hass: HomeAssistant = request.app[KEY_HASS]
+            try:
+                static_file = await hass.async_add_executor_job(_load_static_file, *key)
+            except (ValueError, OSError, HTTPForbidden):
+                # Let CachingStaticResource answer with the right error
+                return await super()._handle(request)
+            if static_file is None:
+                self._uncacheable.add(rel_url)
+                return await super()._handle(request)
+            MEMORY_CACHE.set(key, static_file)
+
+        encoding: str | None = None
+        if len(static_file.variants) > 1:
+            accepted = _accepted_encodings(headers.get(hdrs.ACCEPT_ENCODING, ""))
+            for candidate, _ in ENCODING_EXTENSIONS:
+                if candidate in static_file.variants and candidate in accepted:
+                    encoding = candidate
+                    break
+        variant = static_file.variants[encoding]
+
+        response_headers: dict[str, str] = {
+            hdrs.CACHE_CONTROL: CACHE_HEADER,
+            hdrs.ETAG: f'"{variant.etag}"',
+        }
+        if len(static_file.variants) > 1:
+            response_headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if (if_none_match := request.if_none_match) is not None:
+            not_modified = any(
+                etag.value in (variant.etag, ETAG_ANY) for etag in if_none_match
+            )
+        else:
+            not_modified = (
+                modified_since := request.if_modified_since
+            ) is not None and variant.last_modified <= modified_since.timestamp()
+        if not_modified:
+            response = Response(status=304, headers=response_headers)
+        else:
+            response_headers[hdrs.CONTENT_TYPE] = static_file.content_type
+            if encoding is not None:
+                response_headers[hdrs.CONTENT_ENCODING] = encoding
+            response = Response(body=variant.body, headers=response_headers)
+        response.last_modified = variant.last_modified  # type: ignore[assignment]
+        return response
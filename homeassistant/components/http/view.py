@@ -28,6 +28,7 @@ from homeassistant.helpers.json import (
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, format_unserializable_data
 
 from .const import KEY_AUTHENTICATED
+from .middleware import lightweight_route
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +41,9 @@ class HomeAssistantView:
     # Views inheriting from this class can override this
     requires_auth = True
     cors_allowed = False
+    # Lightweight views don't require auth and don't use the user of the
+    # request, the auth middleware is skipped for them
+    lightweight = False
 
     @staticmethod
     def context(request: web.Request) -> Context:
@@ -102,6 +106,8 @@ class HomeAssistantView:
                 continue
 
             handler = request_handler_factory(hass, self, handler)
+            if self.lightweight:
+                handler = lightweight_route(handler)
 
             for url in urls:
                 routes.append(router.add_route(method, url, handler))
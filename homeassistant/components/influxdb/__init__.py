@@ -12,8 +12,9 @@ import time
 from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -51,8 +52,10 @@ from homeassistant.helpers.typing import ConfigType
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
+    BATCH_TARGET_WRITE_TIME,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
+    CATCHING_UP_SPOOLED_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
     CODE_INVALID_INPUTS,
@@ -87,6 +90,8 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_BATCH_BUFFER_SIZE,
+    MIN_BATCH_BUFFER_SIZE,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
@@ -95,12 +100,18 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIR,
+    SPOOL_ERROR_MESSAGE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_SIZE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool, SpoolReadError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -328,6 +339,8 @@ class InfluxClient:
     write: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
+    write_lines: Callable[[list[str]], None]
+    to_lines: Callable[[list[dict[str, Any]]], list[str]]
 
 
 def get_influx_connection(  # noqa: C901
@@ -339,6 +352,10 @@ def get_influx_connection(  # noqa: C901
     }
     precision = conf.get(CONF_PRECISION)
 
+    def to_lines(json: list[dict[str, Any]]) -> list[str]:
+        """Serialize points to line protocol."""
+        return make_lines({"points": json}, precision).splitlines()
+
     if conf[CONF_API_VERSION] == API_VERSION_2:
         kwargs[CONF_TIMEOUT] = TIMEOUT * 1000
         kwargs[CONF_URL] = conf[CONF_URL]
@@ -348,10 +365,11 @@ def get_influx_connection(  # noqa: C901
         if CONF_SSL_CA_CERT in conf:
             kwargs[CONF_SSL_CA_CERT] = conf[CONF_SSL_CA_CERT]
         bucket = conf.get(CONF_BUCKET)
-        influx = InfluxDBClientV2(**kwargs)
+        influx = InfluxDBClientV2(enable_gzip=True, **kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are batched by the InfluxDB thread, they are synchronous so
+        # failed batches can be retried and spooled
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
         def write_v2(json):
             """Write data to V2 influx."""
@@ -390,7 +408,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -399,7 +416,14 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(
+            buckets,
+            write_v2,
+            query_v2,
+            close_v2,
+            write_lines=write_v2,
+            to_lines=to_lines,
+        )
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -428,12 +452,12 @@ def get_influx_connection(  # noqa: C901
     if CONF_SSL in conf:
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
-    influx = InfluxDBClient(**kwargs)
+    influx = InfluxDBClient(gzip=True, **kwargs)
 
-    def write_v1(json):
+    def write_v1(json, **write_kwargs):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, **write_kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -471,13 +495,35 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    def write_lines_v1(lines):
+        """Write line protocol to V1 influx."""
+        write_v1(lines, protocol="line")
+
+    return InfluxClient(
+        databases,
+        write_v1,
+        query_v1,
+        close_v1,
+        write_lines=write_lines_v1,
+        to_lines=to_lines,
+    )
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
     setup(hass, config)
 
 
+def _load_spool(hass: HomeAssistant) -> InfluxSpool | None:
+    """Load the spool of the batches that could not be written."""
+    spool = InfluxSpool(hass.config.path(SPOOL_DIR), SPOOL_MAX_SIZE)
+    try:
+        spool.load()
+    except OSError as exc:
+        _LOGGER.error("Can't load the spool, events will not be spooled: %s", exc)
+        return None
+    return spool
+
+
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the InfluxDB component."""
     conf = config[DOMAIN]
@@ -492,7 +538,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, _load_spool(hass)
+    )
     instance.start()
 
     def shutdown(event):
@@ -509,13 +557,16 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(self, hass, influx, event_to_json, max_tries, spool=None):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.spool: InfluxSpool | None = spool
+        self.batch_size = BATCH_BUFFER_SIZE
+        self.connected = True
         self.write_errors = 0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
@@ -539,9 +590,10 @@ class InfluxThread(threading.Thread):
         json = []
 
         dropped = 0
+        backlog = []
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(json) < self.batch_size and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -556,19 +608,76 @@ class InfluxThread(threading.Thread):
                         event_json = self.event_to_json(event)
                         if event_json:
                             json.append(event_json)
+                    elif self.spool is not None:
+                        # Spool old events so the live events are written first
+                        event_json = self.event_to_json(event)
+                        if event_json:
+                            backlog.append(event_json)
                     else:
                         dropped += 1
 
+        if backlog:
+            _LOGGER.warning(CATCHING_UP_SPOOLED_MESSAGE, len(backlog))
+            self.spool_json(backlog)
+
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
         return count, json
 
+    def adapt_batch_size(self, written: int, write_time: float) -> None:
+        """Adapt the batch size to the observed write latency."""
+        if write_time > BATCH_TARGET_WRITE_TIME:
+            self.batch_size = max(MIN_BATCH_BUFFER_SIZE, self.batch_size // 2)
+        elif written >= self.batch_size and write_time < BATCH_TARGET_WRITE_TIME / 2:
+            self.batch_size = min(MAX_BATCH_BUFFER_SIZE, self.batch_size * 2)
+
+    def spool_json(self, json) -> bool:
+        """Spool preprocessed events to disk to be written later."""
+        assert self.spool is not None
+        try:
+            if dropped := self.spool.put(self.influx.to_lines(json)):
+                _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+        except (OSError, ValueError) as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, len(json), err)
+            return False
+        return True
+
+    def write_spooled(self) -> None:
+        """Write the oldest spooled batch to influxdb."""
+        assert self.spool is not None
+        try:
+            if (lines := self.spool.peek()) is None:
+                return
+        except SpoolReadError as err:
+            # A batch which can't be read will never be written
+            _LOGGER.error("%s, dropping it", err)
+            self.spool.pop()
+            return
+        try:
+            self.influx.write_lines(lines)
+        except ConnectionError:
+            # Keep the batch and try again after the next successful write
+            self.connected = False
+            return
+        except ValueError as err:
+            _LOGGER.error(err)
+        else:
+            _LOGGER.debug(WROTE_MESSAGE, len(lines))
+        self.spool.pop()
+
     def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        """Write preprocessed events to influxdb, with retry.
+
+        If influxdb can't be reached the events are spooled to disk when a
+        spool is available.
+        """
         for retry in range(self.max_tries + 1):
             try:
+                start = time.monotonic()
                 self.influx.write(json)
+                self.adapt_batch_size(len(json), time.monotonic() - start)
+                self.connected = True
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
@@ -580,8 +689,12 @@ class InfluxThread(threading.Thread):
                 _LOGGER.error(err)
                 break
             except ConnectionError as err:
+                self.connected = False
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool is not None and self.spool_json(json):
+                    _LOGGER.error(err)
+                    _LOGGER.warning(SPOOLED_MESSAGE, len(json))
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
@@ -593,6 +706,8 @@ class InfluxThread(threading.Thread):
             count, json = self.get_events_json()
             if json:
                 self.write_to_influxdb(json)
+            if self.spool and self.connected and not self.shutdown:
+                self.write_spooled()
             for _ in range(count):
                 self.queue.task_done()
 
@@ -77,6 +77,11 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+MIN_BATCH_BUFFER_SIZE = 10
+MAX_BATCH_BUFFER_SIZE = 5000
+BATCH_TARGET_WRITE_TIME = 0.5  # seconds
+SPOOL_DIR = "influxdb_spool"
+SPOOL_MAX_SIZE = 50 * 1024 * 1024  # bytes
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,6 +122,12 @@ QUERY_ERROR = (
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
+CATCHING_UP_SPOOLED_MESSAGE = "Catching up, spooled %d old events to disk."
+SPOOLED_MESSAGE = (
+    "Spooled %d events to disk, they will be written once InfluxDB is back."
+)
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d old batches."
+SPOOL_ERROR_MESSAGE = "Could not spool %d events to disk due to '%s'."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
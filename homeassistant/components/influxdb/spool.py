@@ -0,0 +1,100 @@
+"""Size bounded on-disk spool of batches that could not be written to InfluxDB."""
+from __future__ import annotations
+
+from collections import deque
+import gzip
+import logging
+import os
+import time
+import zlib
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_FILE_SUFFIX = ".lp.gz"
+TEMP_FILE_SUFFIX = ".tmp"
+
+
+class SpoolReadError(Exception):
+    """A spooled batch can't be read."""
+
+
+class InfluxSpool:
+    """Spool of gzip compressed line protocol batches, oldest first.
+
+    The spool is only used from the InfluxDB thread. When the spool grows
+    over max_size, the oldest batches are dropped.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_size = max_size
+        self.size = 0
+        self._batches: deque[tuple[str, int]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of spooled batches."""
+        return len(self._batches)
+
+    def load(self) -> None:
+        """Load the batches spooled before the last restart."""
+        os.makedirs(self.path, exist_ok=True)
+        for name in sorted(os.listdir(self.path)):
+            if name.endswith(TEMP_FILE_SUFFIX):
+                # A batch which was not completely written before a crash
+                self._remove(name)
+                continue
+            if not name.endswith(SPOOL_FILE_SUFFIX):
+                continue
+            size = os.path.getsize(os.path.join(self.path, name))
+            self._batches.append((name, size))
+            self.size += size
+        if self._batches:
+            _LOGGER.debug("Loaded %d spooled batches", len(self._batches))
+
+    def put(self, lines: list[str]) -> int:
+        """Spool a batch and return the number of old batches dropped to fit it.
+
+        The batch is written to a temporary file first, so a batch file is
+        never left half written.
+        """
+        name = f"{time.time_ns():020d}{SPOOL_FILE_SUFFIX}"
+        path = os.path.join(self.path, name)
+        data = gzip.compress("\n".join(lines).encode("utf-8"))
+        with open(path + TEMP_FILE_SUFFIX, "wb") as file:
+            file.write(data)
+        os.replace(path + TEMP_FILE_SUFFIX, path)
+        self._batches.append((name, len(data)))
+        self.size += len(data)
+        dropped = 0
+        while self.size > self.max_size and len(self._batches) > 1:
+            self.pop()
+            dropped += 1
+        return dropped
+
+    def peek(self) -> list[str] | None:
+        """Return the lines of the oldest batch.
+
+        Raises SpoolReadError if the batch can't be read or is corrupt.
+        """
+        if not self._batches:
+            return None
+        name = self._batches[0][0]
+        try:
+            with open(os.path.join(self.path, name), "rb") as file:
+                return gzip.decompress(file.read()).decode("utf-8").split("\n")
+        except (OSError, EOFError, ValueError, zlib.error) as err:
+            raise SpoolReadError(f"Could not read spooled batch {name}: {err}") from err
+
+    def pop(self) -> None:
+        """Remove the oldest batch."""
+        name, size = self._batches.popleft()
+        self.size -= size
+        self._remove(name)
+
+    def _remove(self, name: str) -> None:
+        """Remove a file from the spool directory."""
+        try:
+            os.remove(os.path.join(self.path, name))
+        except OSError as err:
+            _LOGGER.warning("Can't remove spooled batch %s: %s", name, err)
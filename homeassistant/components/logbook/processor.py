@@ -20,10 +20,7 @@ from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
     process_timestamp_to_utc_isoformat,
 )
-from homeassistant.components.recorder.util import (
-    execute_stmt_lambda_element,
-    session_scope,
-)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import (
     ATTR_DOMAIN,
@@ -33,13 +30,23 @@ from homeassistant.const import (
     ATTR_SERVICE,
     EVENT_CALL_SERVICE,
     EVENT_LOGBOOK_ENTRY,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
 )
-from homeassistant.core import HomeAssistant, split_entity_id
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
 from .const import (
+    ALWAYS_CONTINUOUS_DOMAINS,
     ATTR_MESSAGE,
+    CONDITIONALLY_CONTINUOUS_DOMAINS,
     CONTEXT_DOMAIN,
     CONTEXT_ENTITY_ID,
     CONTEXT_ENTITY_ID_NAME,
@@ -67,6 +74,14 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of rows fetched from the database cursor and
+# humanified at a time when streaming logbook results
+LOGBOOK_PAGE_SIZE = 1024
+
+_POSSIBLE_CONTINUOUS_DOMAINS = (
+    ALWAYS_CONTINUOUS_DOMAINS | CONDITIONALLY_CONTINUOUS_DOMAINS
+)
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -115,7 +130,8 @@ class EventProcessor:
             context_lookup={None: None},
             external_events=logbook_config.external_events,
             event_cache=EventCache({}),
-            entity_name_cache=EntityNameCache(self.hass),
+            entity_name_cache=logbook_config.entity_name_cache
+            or EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             format_time=format_time,
         )
@@ -135,12 +151,41 @@ class EventProcessor:
         self.logbook_run.context_lookup.clear()
         self.logbook_run.memoize_new_contexts = False
 
+    @property
+    def states_need_continuous_filter(self) -> bool:
+        """Check if the states select has to filter continuous entities in SQL.
+
+        When the request is limited to entities that are not in a domain
+        that may be continuous we can skip matching the unit of measurement
+        in the state attributes, which is the most expensive part of the query.
+        """
+        return not self.entity_ids or any(
+            split_entity_id(entity_id)[0] in _POSSIBLE_CONTINUOUS_DOMAINS
+            for entity_id in self.entity_ids
+        )
+
     def get_events(
         self,
         start_day: dt,
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        events: list[dict[str, Any]] = []
+        for page in self.iter_events(start_day, end_day):
+            events.extend(page)
+        return events
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Stream humanified events for a period of time in pages.
+
+        Rows are read from the database cursor LOGBOOK_PAGE_SIZE rows at
+        a time so the full result never has to be held in memory.
+        Pages that humanify to nothing are not yielded.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -164,10 +209,26 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                self.states_need_continuous_filter,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
-            )
+            result = session.connection().execute(stmt)
+            for rows in result.yield_per(LOGBOOK_PAGE_SIZE).partitions():
+                if page := self.humanify_page(rows):
+                    yield page
+
+    def humanify_page(self, rows: Sequence[Row]) -> list[dict[str, Any]]:
+        """Humanify a page of database rows.
+
+        The context rows of the whole page are memoized before any
+        row is humanified so context lookups within the page never
+        depend on the order the rows were returned in.
+        """
+        logbook_run = self.logbook_run
+        if logbook_run.memoize_new_contexts:
+            memoize_context = logbook_run.context_lookup.setdefault
+            for row in rows:
+                memoize_context(row.context_id_bin, row)
+        return self.humanify(rows)
 
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
@@ -394,6 +455,13 @@ class EntityNameCache:
 
     This class should not be used to lookup attributes
     that are expected to change state.
+
+    The logbook keeps one shared instance that lives as long
+    as the integration. Only names of entities with a state are
+    cached. A name is dropped when the friendly name of the state
+    changes, the state is removed or the entity registry entry is
+    updated. Device registry updates clear the cache, the names
+    of entities can come from their device.
     """
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -403,16 +471,77 @@ class EntityNameCache:
 
     def get(self, entity_id: str) -> str:
         """Lookup an the friendly name."""
-        if entity_id in self._names:
-            return self._names[entity_id]
+        if (name := self._names.get(entity_id)) is not None:
+            return name
         if (current_state := self._hass.states.get(entity_id)) and (
             friendly_name := current_state.attributes.get(ATTR_FRIENDLY_NAME)
         ):
             self._names[entity_id] = friendly_name
-        else:
-            return split_entity_id(entity_id)[1].replace("_", " ")
-
-        return self._names[entity_id]
+            return self._names[entity_id]
+        return split_entity_id(entity_id)[1].replace("_", " ")
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Listen to the events which invalidate cached names."""
+        unsubs = [
+            self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,
+                event_filter=self._async_name_changed_filter,
+                run_immediately=True,
+            ),
+            self._hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self.async_registry_updated,  # type: ignore[arg-type]
+                run_immediately=True,
+            ),
+            self._hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_device_registry_updated,
+                run_immediately=True,
+            ),
+        ]
+
+        @callback
+        def _async_unsub() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _async_unsub
+
+    @callback
+    def _async_name_changed_filter(self, event: Event) -> bool:
+        """Return if the state change changes the name of a cached entity."""
+        if (name := self._names.get(event.data["entity_id"])) is None:
+            return False
+        return (
+            new_state := event.data.get("new_state")
+        ) is None or new_state.attributes.get(ATTR_FRIENDLY_NAME) != name
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Drop the cached name of an entity which was renamed or removed."""
+        self.async_invalidate(event.data["entity_id"])
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        """Drop all cached names."""
+        self._names.clear()
+
+    @callback
+    def async_invalidate(self, entity_id: str) -> None:
+        """Drop the cached name for an entity."""
+        self._names.pop(entity_id, None)
+
+    @callback
+    def async_registry_updated(
+        self, event: EventType[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Invalidate the names of entities touched by a registry event."""
+        data = event.data
+        self.async_invalidate(data["entity_id"])
+        if data["action"] == "update" and (old_entity_id := data.get("old_entity_id")):
+            self.async_invalidate(old_entity_id)
 
 
 class EventCache:
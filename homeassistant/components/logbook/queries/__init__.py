@@ -26,6 +26,7 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    states_need_continuous_filter: bool = True,
 ) -> StatementLambdaElement:
     """Generate the logbook statement for a logbook request."""
     start_day = dt_util.utc_to_timestamp(start_day_dt)
@@ -66,6 +67,7 @@ def statement_for_request(
             event_type_ids,
             states_metadata_ids or [],
             [json_dumps(entity_id) for entity_id in entity_ids],
+            states_need_continuous_filter,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
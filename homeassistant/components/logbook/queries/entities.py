@@ -60,6 +60,7 @@ def _apply_entities_context_union(
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
+    continuous_filter: bool = True,
 ) -> CompoundSelect:
     """Generate a CTE to find the entity and device context ids and a query to find linked row."""
     entities_cte: CTE = _select_entities_context_ids_sub_query(
@@ -75,7 +76,9 @@ def _apply_entities_context_union(
     # in the python code anyways since they will have context_only
     # set on them the impact is minimal.
     return sel.union_all(
-        states_select_for_entity_ids(start_day, end_day, states_metadata_ids),
+        states_select_for_entity_ids(
+            start_day, end_day, states_metadata_ids, continuous_filter
+        ),
         apply_events_context_hints(
             select_events_context_only()
             .select_from(entities_cte)
@@ -98,6 +101,7 @@ def entities_stmt(
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
     json_quoted_entity_ids: list[str],
+    continuous_filter: bool = True,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
     return lambda_stmt(
@@ -110,16 +114,21 @@ def entities_stmt(
             event_type_ids,
             states_metadata_ids,
             json_quoted_entity_ids,
-        ).order_by(Events.time_fired_ts)
+            continuous_filter,
+        ).order_by(Events.time_fired_ts),
+        track_on=[continuous_filter],
     )
 
 
 def states_select_for_entity_ids(
-    start_day: float, end_day: float, states_metadata_ids: Collection[int]
+    start_day: float,
+    end_day: float,
+    states_metadata_ids: Collection[int],
+    continuous_filter: bool = True,
 ) -> Select:
     """Generate a select for states from the States table for specific entities."""
     return apply_states_filters(
-        apply_entities_hints(select_states()), start_day, end_day
+        apply_entities_hints(select_states()), start_day, end_day, continuous_filter
     ).where(States.metadata_id.in_(states_metadata_ids))
 
 
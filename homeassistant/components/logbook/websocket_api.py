@@ -104,6 +104,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -126,6 +127,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -138,6 +140,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -159,6 +162,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -175,6 +179,9 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        lambda message: hass.loop.call_soon_threadsafe(
+            connection.send_message, message
+        ),
     )
 
 
@@ -196,9 +203,23 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
+    send_page: Callable[[str], Any],
 ) -> tuple[str, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    """Fetch events and convert them to json in the executor.
+
+    Events are read from the database in pages. Every page except
+    the last one is handed to send_page as soon as it is ready so
+    the client can start rendering while the rest is still streaming.
+    The last page is returned so the caller can decide if it
+    has to be sent.
+    """
+    events: list[dict[str, Any]] = []
+    for page in event_processor.iter_events(start_day, end_day):
+        if events:
+            message = _generate_stream_message(events, start_day, end_day)
+            message["partial"] = True
+            send_page(JSON_DUMP(formatter(msg_id, message)))
+        events = page
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
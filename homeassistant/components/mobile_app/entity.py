@@ -102,5 +102,11 @@ class MobileAppEntity(RestoreEntity):
     @callback
     def _handle_update(self, data: dict[str, Any]) -> None:
         """Handle async event updates."""
+        if all(
+            key in self._config and self._config[key] == value
+            for key, value in data.items()
+        ):
+            # Nothing changed, apps resend sensors which didn't change
+            return
         self._config.update(data)
         self.async_write_ha_state()
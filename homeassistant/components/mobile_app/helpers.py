@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
+from functools import lru_cache
 from http import HTTPStatus
 import logging
 from typing import Any
@@ -35,6 +36,20 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+SECRET_BOX_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=SECRET_BOX_CACHE_SIZE)
+def _secret_box(
+    key: bytes, key_encoder: type[RawEncoder] | type[HexEncoder]
+) -> SecretBox:
+    """Return the secret box of a key.
+
+    The key of a device is used for every webhook it sends, the boxes are
+    cached to not decode the key each time.
+    """
+    return SecretBox(key, encoder=key_encoder)
+
 
 def setup_decrypt(
     key_encoder: type[RawEncoder] | type[HexEncoder],
@@ -46,9 +61,7 @@ def setup_decrypt(
 
     def decrypt(ciphertext: bytes, key: bytes) -> bytes:
         """Decrypt ciphertext using key."""
-        return SecretBox(key, encoder=key_encoder).decrypt(
-            ciphertext, encoder=Base64Encoder
-        )
+        return _secret_box(key, key_encoder).decrypt(ciphertext, encoder=Base64Encoder)
 
     return decrypt
 
@@ -63,9 +76,7 @@ def setup_encrypt(
 
     def encrypt(ciphertext: bytes, key: bytes) -> bytes:
         """Encrypt ciphertext using key."""
-        return SecretBox(key, encoder=key_encoder).encrypt(
-            ciphertext, encoder=Base64Encoder
-        )
+        return _secret_box(key, key_encoder).encrypt(ciphertext, encoder=Base64Encoder)
 
     return encrypt
 
@@ -154,6 +154,37 @@ SENSOR_SCHEMA_FULL = vol.Schema(
     }
 )
 
+SENSOR_UPDATE_KEYS = frozenset(
+    (
+        ATTR_SENSOR_ATTRIBUTES,
+        ATTR_SENSOR_ICON,
+        ATTR_SENSOR_STATE,
+        ATTR_SENSOR_TYPE,
+        ATTR_SENSOR_UNIQUE_ID,
+    )
+)
+SENSOR_STATE_TYPES = frozenset((type(None), bool, int, float, str))
+
+
+def validate_sensor_update(sensor: dict[str, Any]) -> dict[str, Any]:
+    """Validate a sensor update like SENSOR_SCHEMA_FULL.
+
+    The updates as sent by the apps are checked inline, the others are
+    validated with the schema to get the same result and errors.
+    """
+    icon = sensor.get(ATTR_SENSOR_ICON, "mdi:cellphone")
+    if (
+        sensor.keys() <= SENSOR_UPDATE_KEYS
+        and ATTR_SENSOR_STATE in sensor
+        and type(sensor[ATTR_SENSOR_STATE]) in SENSOR_STATE_TYPES
+        and isinstance(attributes := sensor.get(ATTR_SENSOR_ATTRIBUTES, {}), dict)
+        and (icon is None or (isinstance(icon, str) and ":" in icon))
+        and sensor.get(ATTR_SENSOR_TYPE) in SENSOR_TYPES
+        and isinstance(sensor.get(ATTR_SENSOR_UNIQUE_ID), str)
+    ):
+        return {**sensor, ATTR_SENSOR_ATTRIBUTES: attributes, ATTR_SENSOR_ICON: icon}
+    return SENSOR_SCHEMA_FULL(sensor)
+
 
 def validate_schema(schema):
     """Decorate a webhook function with a schema."""
@@ -647,7 +678,11 @@ async def webhook_update_sensor_states(
 ) -> Response:
     """Handle an update sensor states webhook."""
     device_name: str = config_entry.data[ATTR_DEVICE_NAME]
+    webhook_id: str = config_entry.data[CONF_WEBHOOK_ID]
     resp: dict[str, Any] = {}
+    # The last update of each sensor, the entities are updated once all
+    # sensors are validated
+    updates: dict[str, dict[str, Any]] = {}
     entity_registry = er.async_get(hass)
 
     for sensor in data:
@@ -655,7 +690,7 @@ async def webhook_update_sensor_states(
 
         unique_id: str = sensor[ATTR_SENSOR_UNIQUE_ID]
 
-        unique_store_key = _gen_unique_id(config_entry.data[CONF_WEBHOOK_ID], unique_id)
+        unique_store_key = _gen_unique_id(webhook_id, unique_id)
 
         if not (
             entity_id := entity_registry.async_get_entity_id(
@@ -675,7 +710,7 @@ async def webhook_update_sensor_states(
             continue
 
         try:
-            sensor = SENSOR_SCHEMA_FULL(sensor)
+            sensor = validate_sensor_update(sensor)
         except vol.Invalid as err:
             err_msg = vol.humanize.humanize_error(sensor, err)
             _LOGGER.error(
@@ -690,12 +725,8 @@ async def webhook_update_sensor_states(
             }
             continue
 
-        sensor[CONF_WEBHOOK_ID] = config_entry.data[CONF_WEBHOOK_ID]
-        async_dispatcher_send(
-            hass,
-            f"{SIGNAL_SENSOR_UPDATE}-{unique_store_key}",
-            sensor,
-        )
+        sensor[CONF_WEBHOOK_ID] = webhook_id
+        updates[unique_store_key] = sensor
 
         resp[unique_id] = {"success": True}
 
@@ -705,6 +736,11 @@ async def webhook_update_sensor_states(
         if entry and entry.disabled_by:
             resp[unique_id]["is_disabled"] = True
 
+    for unique_store_key, sensor in updates.items():
+        async_dispatcher_send(
+            hass, f"{SIGNAL_SENSOR_UPDATE}-{unique_store_key}", sensor
+        )
+
     return webhook_response(resp, registration=config_entry.data)
 
 
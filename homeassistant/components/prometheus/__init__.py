@@ -40,7 +40,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
@@ -49,6 +49,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import ExpositionClient, ExpositionMetric
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -62,12 +64,15 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECTOR_MODE = "collector_mode"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
 
 DEFAULT_NAMESPACE = "homeassistant"
 
+IGNORED_STATES = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -77,6 +82,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_REQUIRES_AUTH, default=True): cv.boolean,
                 vol.Optional(CONF_DEFAULT_METRIC): cv.string,
                 vol.Optional(CONF_OVERRIDE_METRIC): cv.string,
+                vol.Optional(CONF_COLLECTOR_MODE, default=False): cv.boolean,
                 vol.Optional(CONF_COMPONENT_CONFIG, default={}): vol.Schema(
                     {cv.entity_id: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
@@ -95,10 +101,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(
-        PrometheusView(prometheus_client, config[DOMAIN][CONF_REQUIRES_AUTH])
-    )
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -111,8 +113,10 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
+    collector_mode = conf[CONF_COLLECTOR_MODE]
+
     metrics = PrometheusMetrics(
-        prometheus_client,
+        ExpositionClient() if collector_mode else prometheus_client,
         entity_filter,
         namespace,
         climate_units,
@@ -121,6 +125,24 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(
+        PrometheusView(
+            prometheus_client,
+            conf[CONF_REQUIRES_AUTH],
+            metrics if collector_mode else None,
+        )
+    )
+
+    if collector_mode:
+        # Gauges are derived from the latest states when they are scraped,
+        # so the events only have to be handled on the event loop
+        hass.bus.listen(EVENT_STATE_CHANGED, metrics.async_handle_state_changed_event)
+        hass.bus.listen(
+            EVENT_ENTITY_REGISTRY_UPDATED, metrics.async_handle_entity_registry_updated
+        )
+        hass.add_job(metrics.async_handle_initial_states, hass.states.all())
+        return True
+
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_entity_registry_updated
@@ -167,48 +189,97 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self._pending_states: dict[str, State] = {}
 
-    def handle_state_changed_event(self, event):
-        """Handle new messages from the bus."""
+    def _filtered_new_state(self, event):
+        """Return the new state of an event if it should be exported."""
         if (state := event.data.get("new_state")) is None:
-            return
+            return None
 
         if not self._filter(state.entity_id):
             _LOGGER.debug("Filtered out entity %s", state.entity_id)
-            return
+            return None
 
         if (old_state := event.data.get("old_state")) is not None and (
             old_friendly_name := old_state.attributes.get(ATTR_FRIENDLY_NAME)
         ) != state.attributes.get(ATTR_FRIENDLY_NAME):
             self._remove_labelsets(old_state.entity_id, old_friendly_name)
 
-        self.handle_state(state)
+        return state
+
+    def handle_state_changed_event(self, event):
+        """Handle new messages from the bus."""
+        if (state := self._filtered_new_state(event)) is not None:
+            self.handle_state(state)
+
+    @callback
+    def async_handle_state_changed_event(self, event: Event) -> None:
+        """Handle new messages from the bus in collector mode.
+
+        Only the counters are updated right away, the gauges of the
+        entity are derived from its latest state at the next scrape.
+        """
+        if (state := self._filtered_new_state(event)) is not None:
+            self._handle_state_counters(state)
+            self._pending_states[state.entity_id] = state
+
+    @callback
+    def async_handle_initial_states(self, states: list[State]) -> None:
+        """Handle the states which existed before setup in collector mode."""
+        for state in states:
+            if self._filter(state.entity_id) and (
+                state.entity_id not in self._pending_states
+            ):
+                self._handle_state_counters(state)
+                self._pending_states[state.entity_id] = state
+
+    @callback
+    def async_handle_entity_registry_updated(self, event: Event) -> None:
+        """Handle entity registry updates in collector mode."""
+        self.handle_entity_registry_updated(event)
+
+    @callback
+    def async_render(self) -> str:
+        """Update the gauges of the changed entities and render the metrics."""
+        pending_states = self._pending_states
+        self._pending_states = {}
+        for state in pending_states.values():
+            self._handle_state_gauges(state)
+        return self.prometheus_cli.REGISTRY.render()
 
     def handle_state(self, state):
         """Add/update a state in Prometheus."""
+        self._handle_state_counters(state)
+        self._handle_state_gauges(state)
+
+    def _handle_state_counters(self, state):
+        """Update the counters of a state."""
+        if state.domain == "automation" and state.state not in IGNORED_STATES:
+            self._handle_automation_triggered(state)
+
+        state_change = self._metric(
+            "state_change", self.prometheus_cli.Counter, "The number of state changes"
+        )
+        state_change.labels(**self._labels(state)).inc()
+
+    def _handle_state_gauges(self, state):
+        """Update the gauges of a state."""
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
         domain, _ = hacore.split_entity_id(entity_id)
 
-        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
-
         handler = f"_handle_{domain}"
 
-        if hasattr(self, handler) and state.state not in ignored_states:
+        if hasattr(self, handler) and state.state not in IGNORED_STATES:
             getattr(self, handler)(state)
 
         labels = self._labels(state)
-        state_change = self._metric(
-            "state_change", self.prometheus_cli.Counter, "The number of state changes"
-        )
-        state_change.labels(**labels).inc()
-
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
-        entity_available.labels(**labels).set(float(state.state not in ignored_states))
+        entity_available.labels(**labels).set(float(state.state not in IGNORED_STATES))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
@@ -238,11 +309,15 @@ class PrometheusMetrics:
                 metrics_entity_id = entity_id
 
         if metrics_entity_id:
+            self._pending_states.pop(metrics_entity_id, None)
             self._remove_labelsets(metrics_entity_id)
 
     def _remove_labelsets(self, entity_id, friendly_name=None):
         """Remove labelsets matching the given entity id from all metrics."""
         for _, metric in self._metrics.items():
+            if isinstance(metric, ExpositionMetric):
+                metric.remove_entity(entity_id, friendly_name)
+                continue
             for sample in metric.collect()[0].samples:
                 if sample.labels["entity"] == entity_id and (
                     not friendly_name or sample.labels["friendly_name"] == friendly_name
@@ -661,7 +736,7 @@ class PrometheusMetrics:
     def _handle_zwave(self, state):
         self._battery(state)
 
-    def _handle_automation(self, state):
+    def _handle_automation_triggered(self, state):
         metric = self._metric(
             "automation_triggered_count",
             self.prometheus_cli.Counter,
@@ -695,16 +770,26 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli, requires_auth: bool) -> None:
+    def __init__(
+        self,
+        prometheus_cli,
+        requires_auth: bool,
+        metrics: PrometheusMetrics | None = None,
+    ) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
         self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        body = self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY)
+        if self.metrics is not None:
+            body += self.metrics.async_render().encode("utf-8")
+
         return web.Response(
-            body=self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
+            body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
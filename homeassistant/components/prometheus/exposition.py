@@ -0,0 +1,234 @@
+"""Metrics rendered to the Prometheus text format with a per entity cache."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from prometheus_client.utils import floatToGoString
+
+
+def _escape(value: str) -> str:
+    """Escape a label value or documentation string."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class ExpositionRegistry:
+    """Registry of metrics rendered in the order they were created."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._metrics: list[ExpositionMetric] = []
+
+    def register(self, metric: ExpositionMetric) -> None:
+        """Register a metric."""
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        """Return the text exposition of all metrics."""
+        return "".join(metric.render() for metric in self._metrics)
+
+
+class ExpositionMetric:
+    """Metric which caches its rendered samples per entity.
+
+    Only the samples of entities which changed since the last render
+    are rendered again, the text of the other entities is reused.
+    """
+
+    _type = "untyped"
+    _suffix = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+        registry: ExpositionRegistry,
+    ) -> None:
+        """Initialize the metric."""
+        self.name = name
+        self._labelnames = tuple(labelnames)
+        self._sorted_labelnames = sorted(labelnames)
+        self._documentation = _escape(documentation)
+        self._values: dict[str, dict[tuple[str, ...], float]] = {}
+        self._lines: dict[str, str] = {}
+        self._changed: set[str] = set()
+        self._text: str | None = None
+        registry.register(self)
+
+    def labels(self, **labels: Any) -> ExpositionSample:
+        """Return the sample of a labelset."""
+        labelvalues = tuple(str(labels[name]) for name in self._labelnames)
+        entity_id = labelvalues[0]
+        values = self._values.setdefault(entity_id, {})
+        if labelvalues not in values:
+            values[labelvalues] = 0.0
+            self._labelset_added(labelvalues)
+            self._changed.add(entity_id)
+        return ExpositionSample(self, entity_id, labelvalues)
+
+    def _labelset_added(self, labelvalues: tuple[str, ...]) -> None:
+        """Handle a new labelset."""
+
+    def _labelset_removed(self, labelvalues: tuple[str, ...]) -> None:
+        """Handle a removed labelset."""
+
+    def set_value(
+        self, entity_id: str, labelvalues: tuple[str, ...], value: float
+    ) -> None:
+        """Set the value of a sample."""
+        self._values[entity_id][labelvalues] = value
+        self._changed.add(entity_id)
+
+    def get_value(self, entity_id: str, labelvalues: tuple[str, ...]) -> float:
+        """Return the value of a sample."""
+        return self._values[entity_id][labelvalues]
+
+    def remove_entity(self, entity_id: str, friendly_name: str | None = None) -> None:
+        """Remove the samples of an entity, optionally only with a friendly name."""
+        if (values := self._values.get(entity_id)) is None:
+            return
+        for labelvalues in list(values):
+            if not friendly_name or labelvalues[1] == friendly_name:
+                del values[labelvalues]
+                self._labelset_removed(labelvalues)
+        if not values:
+            del self._values[entity_id]
+        self._changed.add(entity_id)
+
+    def _render_sample(
+        self, name: str, labelvalues: tuple[str, ...], value: float
+    ) -> str:
+        """Render a sample line."""
+        labels = dict(zip(self._labelnames, labelvalues))
+        labelstr = ",".join(
+            f'{labelname}="{_escape(labels[labelname])}"'
+            for labelname in self._sorted_labelnames
+        )
+        return f"{name}{{{labelstr}}} {floatToGoString(value)}\n"
+
+    def _render_header(self, name: str, metric_type: str) -> str:
+        """Render the help and type lines."""
+        return f"# HELP {name} {self._documentation}\n# TYPE {name} {metric_type}\n"
+
+    def _render_entity(self, entity_id: str) -> None:
+        """Render the samples of an entity."""
+        if not (values := self._values.get(entity_id)):
+            self._lines.pop(entity_id, None)
+            return
+        name = f"{self.name}{self._suffix}"
+        self._lines[entity_id] = "".join(
+            self._render_sample(name, labelvalues, value)
+            for labelvalues, value in values.items()
+        )
+
+    def _render(self) -> str:
+        """Render the whole metric from the cached entity samples."""
+        name = f"{self.name}{self._suffix}"
+        return self._render_header(name, self._type) + "".join(self._lines.values())
+
+    def render(self) -> str:
+        """Return the text exposition of the metric."""
+        if self._changed:
+            for entity_id in self._changed:
+                self._render_entity(entity_id)
+            self._changed.clear()
+            self._text = None
+        if self._text is None:
+            self._text = self._render()
+        return self._text
+
+
+class ExpositionSample:
+    """Sample of a metric for one labelset."""
+
+    __slots__ = ("_metric", "_entity_id", "_labelvalues")
+
+    def __init__(
+        self,
+        metric: ExpositionMetric,
+        entity_id: str,
+        labelvalues: tuple[str, ...],
+    ) -> None:
+        """Initialize the sample."""
+        self._metric = metric
+        self._entity_id = entity_id
+        self._labelvalues = labelvalues
+
+    def set(self, value: Any) -> None:
+        """Set the value of a gauge."""
+        self._metric.set_value(self._entity_id, self._labelvalues, float(value))
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment a counter."""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        self._metric.set_value(
+            self._entity_id,
+            self._labelvalues,
+            self._metric.get_value(self._entity_id, self._labelvalues) + amount,
+        )
+
+
+class Gauge(ExpositionMetric):
+    """Gauge metric."""
+
+    _type = "gauge"
+
+
+class Counter(ExpositionMetric):
+    """Counter metric, rendered with _total and _created samples."""
+
+    _type = "counter"
+    _suffix = "_total"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+        registry: ExpositionRegistry,
+    ) -> None:
+        """Initialize the counter."""
+        super().__init__(name, documentation, labelnames, registry)
+        self._created: dict[tuple[str, ...], float] = {}
+        self._created_lines: dict[str, str] = {}
+
+    def _labelset_added(self, labelvalues: tuple[str, ...]) -> None:
+        """Record when a labelset was created."""
+        self._created[labelvalues] = time.time()
+
+    def _labelset_removed(self, labelvalues: tuple[str, ...]) -> None:
+        """Forget when a labelset was created."""
+        del self._created[labelvalues]
+
+    def _render_entity(self, entity_id: str) -> None:
+        """Render the samples of an entity."""
+        super()._render_entity(entity_id)
+        if not (values := self._values.get(entity_id)):
+            self._created_lines.pop(entity_id, None)
+            return
+        name = f"{self.name}_created"
+        self._created_lines[entity_id] = "".join(
+            self._render_sample(name, labelvalues, self._created[labelvalues])
+            for labelvalues in values
+        )
+
+    def _render(self) -> str:
+        """Render the whole metric from the cached entity samples."""
+        return (
+            super()._render()
+            + self._render_header(f"{self.name}_created", "gauge")
+            + "".join(self._created_lines.values())
+        )
+
+
+class ExpositionClient:
+    """The parts of prometheus_client used by the exporter, rendered with a cache."""
+
+    Counter = Counter
+    Gauge = Gauge
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        self.REGISTRY = ExpositionRegistry()  # pylint: disable=invalid-name
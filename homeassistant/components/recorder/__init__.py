@@ -36,6 +36,7 @@ from .const import (  # noqa: F401
     SupportedDialect,
 )
 from .core import Recorder
+from .read_replica import ReadReplica
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -49,16 +50,22 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_DB_READ_POOL_SIZE = 4
+DEFAULT_DB_READ_MAX_LAG = 30
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_READ_URL = "db_read_url"
+CONF_DB_READ_POOL_SIZE = "db_read_pool_size"
+CONF_DB_READ_MAX_LAG = "db_read_max_lag"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_PROFILE_QUERIES = "profile_queries"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -99,6 +106,13 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(
+                        CONF_DB_READ_POOL_SIZE, default=DEFAULT_DB_READ_POOL_SIZE
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DB_READ_MAX_LAG, default=DEFAULT_DB_READ_MAX_LAG
+                    ): cv.positive_int,
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -111,6 +125,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_PROFILE_QUERIES, default=False): cv.boolean,
                 }
             ),
         )
@@ -144,6 +159,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    read_replica = None
+    if db_read_url := conf.get(CONF_DB_READ_URL):
+        read_replica = ReadReplica(
+            db_read_url, conf[CONF_DB_READ_POOL_SIZE], conf[CONF_DB_READ_MAX_LAG]
+        )
     exclude = conf[CONF_EXCLUDE]
     exclude_event_types: set[str] = set(exclude.get(CONF_EVENT_TYPES, []))
     if EVENT_STATE_CHANGED in exclude_event_types:
@@ -160,6 +180,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        read_replica=read_replica,
+        profile_queries=conf[CONF_PROFILE_QUERIES],
     )
     instance.async_initialize()
     instance.async_register()
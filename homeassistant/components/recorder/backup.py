@@ -1,9 +1,14 @@
 """Backup platform for the Recorder integration."""
 from logging import getLogger
+from pathlib import Path
+import sqlite3
+
+from sqlalchemy.engine.url import make_url
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
+from .const import SupportedDialect
 from .util import async_migration_in_progress, get_instance
 
 _LOGGER = getLogger(__name__)
@@ -24,3 +29,40 @@ async def async_post_backup(hass: HomeAssistant) -> None:
     _LOGGER.info("Backup end notification, releasing write lock")
     if not instance.unlock_database():
         raise HomeAssistantError("Could not release database write lock")
+
+
+async def async_snapshot_backup(
+    hass: HomeAssistant, snapshot_dir: Path
+) -> dict[str, Path]:
+    """Copy the database while it is locked for writes.
+
+    The copy is made with the SQLite online backup API, so the lock only has
+    to be held for the time it takes to copy the database instead of for the
+    whole backup.
+    """
+    instance = get_instance(hass)
+    if instance.dialect_name != SupportedDialect.SQLITE:
+        return {}
+    if not (database := make_url(instance.db_url).database):
+        return {}
+    db_path = Path(database)
+    config_path = Path(hass.config.path())
+    if not db_path.is_relative_to(config_path):
+        return {}
+    snapshot_path = snapshot_dir / db_path.name
+    _LOGGER.info("Copying database for backup to %s", snapshot_path)
+    await hass.async_add_executor_job(_copy_database, db_path, snapshot_path)
+    return {db_path.relative_to(config_path).as_posix(): snapshot_path}
+
+
+def _copy_database(db_path: Path, snapshot_path: Path) -> None:
+    """Copy a SQLite database with the online backup API."""
+    source = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    try:
+        destination = sqlite3.connect(snapshot_path)
+        try:
+            source.backup(destination)
+        finally:
+            destination.close()
+    finally:
+        source.close()
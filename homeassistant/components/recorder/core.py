@@ -49,15 +49,12 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     KEEPALIVE_TIME,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
-    MARIADB_PYMYSQL_URL_PREFIX,
-    MARIADB_URL_PREFIX,
     MAX_QUEUE_BACKLOG_MIN_VALUE,
-    MYSQLDB_PYMYSQL_URL_PREFIX,
-    MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     STATISTICS_ROWS_SCHEMA_VERSION,
     SupportedDialect,
 )
@@ -85,6 +82,8 @@ from .queries import (
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
 )
+from .query_stats import QueryStats
+from .read_replica import ReadQueryTimings, ReadReplica
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -110,8 +109,10 @@ from .tasks import (
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
+    QueryStatsTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupsRebuildTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -120,7 +121,7 @@ from .tasks import (
     WaitTask,
 )
 from .util import (
-    build_mysqldb_conv,
+    build_dialect_engine_kwargs,
     dburl_to_path,
     end_incomplete_runs,
     execute_stmt_lambda_element,
@@ -178,6 +179,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        read_replica: ReadReplica | None = None,
+        profile_queries: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -193,6 +196,9 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.read_replica = read_replica
+        self.read_query_timings = ReadQueryTimings()
+        self.query_stats = QueryStats(profile_queries)
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -231,6 +237,7 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.statistics_rollups_active = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -278,6 +285,25 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for reading history and statistics.
+
+        The session reads from the read replica if one is configured and it
+        is not too far behind, otherwise from the database the recorder
+        writes to.
+        """
+        if (read_replica := self.read_replica) and read_replica.is_current(
+            self.states_manager.newest_committed_ts
+        ):
+            return read_replica.get_session()
+        return self.get_session()
+
+    @callback
+    def async_set_query_stats_enabled(self, enabled: bool) -> None:
+        """Enable or disable profiling the statements run on the database."""
+        self.query_stats.enabled = enabled
+        self.queue_task(QueryStatsTask())
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -788,6 +814,11 @@ class Recorder(threading.Thread):
             if self.schema_version >= STATISTICS_ROWS_SCHEMA_VERSION:
                 self.statistics_meta_manager.load(session)
 
+            # Reads can only be routed to the read replica once it is known
+            # how far it is behind the states already in the database
+            if self.read_replica:
+                self.states_manager.load_newest_committed_ts(session)
+
             if (
                 self.schema_version < CONTEXT_ID_AS_BINARY_SCHEMA_VERSION
                 or execute_stmt_lambda_element(
@@ -844,6 +875,15 @@ class Recorder(threading.Thread):
                         self.queue_task(EventIdMigrationTask())
                         self.use_legacy_events_index = True
 
+            if (
+                self.schema_version < STATISTICS_ROLLUPS_SCHEMA_VERSION
+                or not statistics.statistics_rollups_are_current(session)
+            ):
+                self.queue_task(StatisticsRollupsRebuildTask())
+            else:
+                _LOGGER.debug("Activating statistics rollups as they are current")
+                self.statistics_rollups_active = True
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -1362,9 +1402,18 @@ class Recorder(threading.Thread):
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
 
+    def _setup_read_replica_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings of the read replica."""
+        assert self.read_replica is not None and self.read_replica.engine is not None
+        setup_connection_for_dialect(
+            self, self.read_replica.engine.dialect.name, dbapi_connection, False
+        )
+
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
-        kwargs: dict[str, Any] = {}
+        kwargs = build_dialect_engine_kwargs(self.db_url)
         self._completed_first_database_setup = False
 
         if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
@@ -1374,45 +1423,46 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
-        elif self.db_url.startswith(
-            (
-                MARIADB_URL_PREFIX,
-                MARIADB_PYMYSQL_URL_PREFIX,
-                MYSQLDB_URL_PREFIX,
-                MYSQLDB_PYMYSQL_URL_PREFIX,
-            )
-        ):
-            kwargs["connect_args"] = {"charset": "utf8mb4"}
-            if self.db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
-                # If they have configured MySQLDB but don't have
-                # the MySQLDB module installed this will throw
-                # an ImportError which we suppress here since
-                # sqlalchemy will give them a better error when
-                # it tried to import it below.
-                with contextlib.suppress(ImportError):
-                    kwargs["connect_args"]["conv"] = build_mysqldb_conv()
-
-        # Disable extended logging for non SQLite databases
-        if not self.db_url.startswith(SQLITE_URL_PREFIX):
-            kwargs["echo"] = False
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        if self.query_stats.enabled:
+            self.query_stats.attach(self.engine)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        if self.read_replica:
+            self.read_replica.setup(
+                build_dialect_engine_kwargs(self.read_replica.db_url),
+                self._setup_read_replica_connection,
+            )
+            if self.query_stats.enabled:
+                self._update_query_stats_listeners()
 
     def _close_connection(self) -> None:
         """Close the connection."""
+        self.query_stats.detach_all()
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_replica:
+            self.read_replica.close()
+
+    def _update_query_stats_listeners(self) -> None:
+        """Listen to the statements of the engines while profiling is enabled."""
+        query_stats = self.query_stats
+        if not query_stats.enabled:
+            query_stats.detach_all()
+            return
+        for engine in (self.engine, self.read_replica and self.read_replica.engine):
+            if engine:
+                query_stats.attach(engine)
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 43
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +84,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -105,6 +107,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -719,6 +723,55 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Statistics rollup base class."""
+
+    # Number of hourly means averaged in the mean of the rollup
+    mean_count: Mapped[int | None] = mapped_column(SmallInteger)
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Daily rollup of the long term statistics.
+
+    Days start at local midnight in the time zone the rollup was built in,
+    so the actual duration of a row may differ on DST transitions.
+    """
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Monthly rollup of the long term statistics.
+
+    Months start at local midnight on the first day of the month in the
+    time zone the rollup was built in.
+    """
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Iterable, MutableMapping
 from datetime import datetime
 from typing import Any
 
@@ -91,17 +91,31 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    attribute_keys: Iterable[str] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    attribute_keys limits the returned attributes, it is ignored
+    before the states have been migrated to the current schema.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states as _legacy_get_significant_states,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+        return _legacy_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -112,6 +126,7 @@ def get_significant_states(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        attribute_keys,
     )
 
 
@@ -127,17 +142,32 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    attribute_keys: Iterable[str] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
+    """Return a dict of significant states during a time period.
+
+    attribute_keys limits the returned attributes, it is ignored
+    before the states have been migrated to the current schema.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             get_significant_states_with_session as _legacy_get_significant_states_with_session,
         )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+        return _legacy_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+    return _modern_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -149,6 +179,7 @@ def get_significant_states_with_session(
         minimal_response,
         no_attributes,
         compressed_state_format,
+        attribute_keys,
     )
 
 
@@ -161,17 +192,29 @@ def state_changes_during_period(
     descending: bool = False,
     limit: int | None = None,
     include_start_time_state: bool = True,
+    attribute_keys: Iterable[str] | None = None,
 ) -> MutableMapping[str, list[State]]:
-    """Return a list of states that changed during a time period."""
+    """Return a list of states that changed during a time period.
+
+    attribute_keys limits the returned attributes, it is ignored
+    before the states have been migrated to the current schema.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             state_changes_during_period as _legacy_state_changes_during_period,
         )
 
-        _target = _legacy_state_changes_during_period
-    else:
-        _target = _modern_state_changes_during_period
-    return _target(
+        return _legacy_state_changes_during_period(
+            hass,
+            start_time,
+            end_time,
+            entity_id,
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        )
+    return _modern_state_changes_during_period(
         hass,
         start_time,
         end_time,
@@ -180,4 +223,5 @@ def state_changes_during_period(
         descending,
         limit,
         include_start_time_state,
+        attribute_keys,
     )
@@ -3,14 +3,18 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby
 from operator import itemgetter
 from typing import Any, cast
 
 from sqlalchemy import (
+    JSON,
+    ColumnElement,
     CompoundSelect,
+    Label,
     Select,
     Subquery,
+    Text,
     and_,
     func,
     lambda_stmt,
@@ -26,6 +30,7 @@ from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
 from ... import recorder
+from ..const import SupportedDialect
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
@@ -50,20 +55,68 @@ _FIELD_MAP = {
 }
 
 
+def _attributes_column(
+    instance: recorder.Recorder, attribute_keys: tuple[str, ...] | None
+) -> Label[Any]:
+    """Return the attributes column, projected to the attribute keys if possible.
+
+    The projection is done by the database when it can extract JSON
+    values while keeping their types, otherwise the full attributes
+    are selected and projected when they are decoded.
+    """
+    if (
+        not attribute_keys
+        or (database_engine := instance.database_engine) is None
+        or not database_engine.optimizer.json_projection
+        or any('"' in key or "\\" in key for key in attribute_keys)
+    ):
+        return SHARED_ATTR_OR_LEGACY_ATTRIBUTES
+    attributes = SHARED_ATTR_OR_LEGACY_ATTRIBUTES.element
+    projection: ColumnElement[Any]
+    if database_engine.dialect == SupportedDialect.POSTGRESQL:
+        json_attributes = attributes.cast(JSON)
+        # json_build_object returns the json type which the driver decodes,
+        # select it as text like the attributes of the other dialects
+        projection = func.json_build_object(
+            *chain.from_iterable(
+                (key, func.json_extract_path(json_attributes, key))
+                for key in attribute_keys
+            )
+        ).cast(Text)
+    elif database_engine.dialect == SupportedDialect.SQLITE:
+        projection = func.json_object(
+            *chain.from_iterable(
+                (key, attributes.op("->")(f'$."{key}"')) for key in attribute_keys
+            )
+        )
+    else:
+        projection = func.JSON_OBJECT(
+            *chain.from_iterable(
+                (key, func.JSON_EXTRACT(attributes, f'$."{key}"'))
+                for key in attribute_keys
+            )
+        )
+    return projection.label("attributes")
+
+
 def _stmt_and_join_attributes(
-    no_attributes: bool, include_last_changed: bool
+    no_attributes: bool,
+    include_last_changed: bool,
+    attributes_column: Label[Any] = SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
 ) -> Select:
     """Return the statement and if StateAttributes should be joined."""
     _select = select(States.metadata_id, States.state, States.last_updated_ts)
     if include_last_changed:
         _select = _select.add_columns(States.last_changed_ts)
     if not no_attributes:
-        _select = _select.add_columns(SHARED_ATTR_OR_LEGACY_ATTRIBUTES)
+        _select = _select.add_columns(attributes_column)
     return _select
 
 
 def _stmt_and_join_attributes_for_start_state(
-    no_attributes: bool, include_last_changed: bool
+    no_attributes: bool,
+    include_last_changed: bool,
+    attributes_column: Label[Any] = SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
 ) -> Select:
     """Return the statement and if StateAttributes should be joined."""
     _select = select(States.metadata_id, States.state)
@@ -71,7 +124,7 @@ def _stmt_and_join_attributes_for_start_state(
     if include_last_changed:
         _select = _select.add_columns(literal(value=0).label("last_changed_ts"))
     if not no_attributes:
-        _select = _select.add_columns(SHARED_ATTR_OR_LEGACY_ATTRIBUTES)
+        _select = _select.add_columns(attributes_column)
     return _select
 
 
@@ -102,6 +155,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    attribute_keys: Iterable[str] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -117,6 +171,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            attribute_keys,
         )
 
 
@@ -130,10 +185,13 @@ def _significant_states_stmt(
     no_attributes: bool,
     include_start_time_state: bool,
     run_start_ts: float | None,
+    attributes_column: Label[Any],
 ) -> Select | CompoundSelect:
     """Query the database for significant state changes."""
     include_last_changed = not significant_changes_only
-    stmt = _stmt_and_join_attributes(no_attributes, include_last_changed)
+    stmt = _stmt_and_join_attributes(
+        no_attributes, include_last_changed, attributes_column
+    )
     if significant_changes_only:
         # Since we are filtering on entity_id (metadata_id) we can avoid
         # the join of the states_meta table since we already know which
@@ -170,6 +228,7 @@ def _significant_states_stmt(
                 metadata_ids,
                 no_attributes,
                 include_last_changed,
+                attributes_column,
             ).subquery(),
             no_attributes,
             include_last_changed,
@@ -195,6 +254,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    attribute_keys: Iterable[str] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -203,6 +263,9 @@ def get_significant_states_with_session(
     filters is an optional SQLAlchemy filter which will be applied to the database
     queries unless entity_ids is given, in which case its ignored.
 
+    attribute_keys is an optional iterable of the attributes to return, the
+    other attributes are not decoded and left out.
+
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
@@ -236,6 +299,8 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    keys = tuple(attribute_keys) if attribute_keys is not None else None
+    attributes_column = _attributes_column(instance, keys)
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -247,6 +312,7 @@ def get_significant_states_with_session(
             no_attributes,
             include_start_time_state,
             run_start_ts,
+            attributes_column,
         ),
         track_on=[
             bool(single_metadata_id),
@@ -255,6 +321,7 @@ def get_significant_states_with_session(
             significant_changes_only,
             no_attributes,
             include_start_time_state,
+            attributes_column,
         ],
     )
     return _sorted_states_to_dict(
@@ -265,6 +332,7 @@ def get_significant_states_with_session(
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        attribute_keys=keys,
     )
 
 
@@ -307,11 +375,13 @@ def _state_changed_during_period_stmt(
     single_metadata_id: int,
     no_attributes: bool,
     limit: int | None,
+    descending: bool,
     include_start_time_state: bool,
     run_start_ts: float | None,
+    attributes_column: Label[Any],
 ) -> Select | CompoundSelect:
     stmt = (
-        _stmt_and_join_attributes(no_attributes, False)
+        _stmt_and_join_attributes(no_attributes, False, attributes_column)
         .filter(
             (
                 (States.last_changed_ts == States.last_updated_ts)
@@ -327,12 +397,23 @@ def _state_changed_during_period_stmt(
         stmt = stmt.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    if limit:
-        stmt = stmt.limit(limit)
-    stmt = stmt.order_by(
-        States.metadata_id,
-        States.last_updated_ts,
-    )
+    if limit and descending:
+        # Limit to the newest states, they are still returned oldest first
+        newest = (
+            stmt.order_by(States.metadata_id, States.last_updated_ts.desc())
+            .limit(limit)
+            .subquery()
+        )
+        stmt = _select_from_subquery(newest, no_attributes, False).order_by(
+            newest.c.last_updated_ts
+        )
+    else:
+        if limit:
+            stmt = stmt.limit(limit)
+        stmt = stmt.order_by(
+            States.metadata_id,
+            States.last_updated_ts,
+        )
     if not include_start_time_state or not run_start_ts:
         return stmt
     return _select_from_subquery(
@@ -343,6 +424,7 @@ def _state_changed_during_period_stmt(
                     single_metadata_id,
                     no_attributes,
                     False,
+                    attributes_column,
                 ).subquery(),
                 no_attributes,
                 False,
@@ -367,6 +449,7 @@ def state_changes_during_period(
     descending: bool = False,
     limit: int | None = None,
     include_start_time_state: bool = True,
+    attribute_keys: Iterable[str] | None = None,
 ) -> MutableMapping[str, list[State]]:
     """Return states changes during UTC period start_time - end_time."""
     if not entity_id:
@@ -392,6 +475,8 @@ def state_changes_during_period(
             include_start_time_state = False
         start_time_ts = dt_util.utc_to_timestamp(start_time)
         end_time_ts = datetime_to_timestamp_or_none(end_time)
+        keys = tuple(attribute_keys) if attribute_keys is not None else None
+        attributes_column = _attributes_column(instance, keys)
         stmt = lambda_stmt(
             lambda: _state_changed_during_period_stmt(
                 start_time_ts,
@@ -399,14 +484,18 @@ def state_changes_during_period(
                 single_metadata_id,
                 no_attributes,
                 limit,
+                descending,
                 include_start_time_state,
                 run_start_ts,
+                attributes_column,
             ),
             track_on=[
                 bool(end_time_ts),
                 no_attributes,
                 bool(limit),
+                descending,
                 include_start_time_state,
+                attributes_column,
             ],
         )
         return cast(
@@ -420,6 +509,7 @@ def state_changes_during_period(
                 entity_id_to_metadata_id,
                 descending=descending,
                 no_attributes=no_attributes,
+                attribute_keys=keys,
             ),
         )
 
@@ -524,12 +614,15 @@ def _get_start_time_state_for_entities_stmt(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    attributes_column: Label[Any] = SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
 ) -> Select:
     """Baked query to get states for specific entities."""
     # We got an include-list of entities, accelerate the query by filtering already
     # in the inner and the outer query.
     stmt = (
-        _stmt_and_join_attributes_for_start_state(no_attributes, include_last_changed)
+        _stmt_and_join_attributes_for_start_state(
+            no_attributes, include_last_changed, attributes_column
+        )
         .join(
             (
                 most_recent_states_for_entities_by_date := (
@@ -587,6 +680,7 @@ def _get_start_time_state_stmt(
     metadata_ids: list[int],
     no_attributes: bool,
     include_last_changed: bool,
+    attributes_column: Label[Any] = SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
 ) -> Select:
     """Return the states at a specific point in time."""
     if single_metadata_id:
@@ -597,6 +691,7 @@ def _get_start_time_state_stmt(
             single_metadata_id,
             no_attributes,
             include_last_changed,
+            attributes_column,
         )
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
@@ -606,6 +701,7 @@ def _get_start_time_state_stmt(
         metadata_ids,
         no_attributes,
         include_last_changed,
+        attributes_column,
     )
 
 
@@ -614,11 +710,14 @@ def _get_single_entity_start_time_stmt(
     metadata_id: int,
     no_attributes: bool,
     include_last_changed: bool,
+    attributes_column: Label[Any] = SHARED_ATTR_OR_LEGACY_ATTRIBUTES,
 ) -> Select:
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     stmt = (
-        _stmt_and_join_attributes_for_start_state(no_attributes, include_last_changed)
+        _stmt_and_join_attributes_for_start_state(
+            no_attributes, include_last_changed, attributes_column
+        )
         .filter(
             States.last_updated_ts < epoch_time,
             States.metadata_id == metadata_id,
@@ -642,6 +741,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    attribute_keys: tuple[str, ...] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -656,7 +756,16 @@ def _sorted_states_to_dict(
     """
     field_map = _FIELD_MAP
     state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
+        [
+            Row,
+            dict[str, dict[str, Any]],
+            float | None,
+            str,
+            str,
+            float | None,
+            bool,
+            tuple[str, ...] | None,
+        ],
         State | dict[str, Any],
     ]
     if compressed_state_format:
@@ -708,6 +817,7 @@ def _sorted_states_to_dict(
                     db_state[state_idx],
                     db_state[last_updated_ts_idx],
                     False,
+                    attribute_keys,
                 )
                 for db_state in group
             )
@@ -731,6 +841,7 @@ def _sorted_states_to_dict(
                     prev_state,  # type: ignore[arg-type]
                     first_state[last_updated_ts_idx],
                     no_attributes,
+                    attribute_keys,
                 )
             )
 
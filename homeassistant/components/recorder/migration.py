@@ -63,7 +63,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -1061,6 +1063,11 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # The rollups are filled by a StatisticsRollupsRebuildTask
+        # once the recorder is running
+        for rollup_table in (StatisticsDaily, StatisticsMonthly):
+            cast(Table, rollup_table.__table__).create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
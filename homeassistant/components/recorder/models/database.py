@@ -32,3 +32,7 @@ class DatabaseOptimizer:
     # https://jira.mariadb.org/browse/MDEV-25020
     #
     slow_range_in_select: bool
+
+    # If the database can extract JSON values from the attributes
+    # in a query while keeping their JSON types
+    json_projection: bool = False
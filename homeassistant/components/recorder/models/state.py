@@ -16,7 +16,10 @@ from homeassistant.const import (
 from homeassistant.core import Context, State
 import homeassistant.util.dt as dt_util
 
-from .state_attributes import decode_attributes_from_source
+from .state_attributes import (
+    decode_attribute_keys_from_source,
+    decode_attributes_from_source,
+)
 from .time import process_timestamp
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +46,7 @@ class LazyState(State):
         "_last_updated_ts",
         "_context",
         "attr_cache",
+        "attribute_keys",
     ]
 
     def __init__(  # pylint: disable=super-init-not-called
@@ -54,6 +58,7 @@ class LazyState(State):
         state: str,
         last_updated_ts: float | None,
         no_attributes: bool,
+        attribute_keys: tuple[str, ...] | None = None,
     ) -> None:
         """Init the lazy state."""
         self._row = row
@@ -64,14 +69,21 @@ class LazyState(State):
         self._last_changed_ts: float | None = None
         self._context: Context | None = None
         self.attr_cache = attr_cache
+        self.attribute_keys = attribute_keys
 
     @property  # type: ignore[override]
     def attributes(self) -> dict[str, Any]:
         """State attributes."""
         if self._attributes is None:
-            self._attributes = decode_attributes_from_source(
-                getattr(self._row, "attributes", None), self.attr_cache
-            )
+            source = getattr(self._row, "attributes", None)
+            if self.attribute_keys is None:
+                self._attributes = decode_attributes_from_source(
+                    source, self.attr_cache
+                )
+            else:
+                self._attributes = decode_attribute_keys_from_source(
+                    source, self.attr_cache, self.attribute_keys
+                )
         return self._attributes
 
     @attributes.setter
@@ -145,13 +157,20 @@ def row_to_compressed_state(
     state: str,
     last_updated_ts: float | None,
     no_attributes: bool,
+    attribute_keys: tuple[str, ...] | None = None,
 ) -> dict[str, Any]:
     """Convert a database row to a compressed state schema 41 and later."""
     comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state}
     if not no_attributes:
-        comp_state[COMPRESSED_STATE_ATTRIBUTES] = decode_attributes_from_source(
-            getattr(row, "attributes", None), attr_cache
-        )
+        source = getattr(row, "attributes", None)
+        if attribute_keys is None:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = decode_attributes_from_source(
+                source, attr_cache
+            )
+        else:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = decode_attribute_keys_from_source(
+                source, attr_cache, attribute_keys
+            )
     row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
     comp_state[COMPRESSED_STATE_LAST_UPDATED] = row_last_updated_ts
     if (
@@ -25,3 +25,35 @@ def decode_attributes_from_source(
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
     return attributes
+
+
+def decode_attribute_keys_from_source(
+    source: Any,
+    attr_cache: dict[str, dict[str, Any]],
+    attribute_keys: tuple[str, ...],
+) -> dict[str, Any]:
+    """Decode only some attributes from a row source.
+
+    The source may already be projected to the attribute keys by the
+    database, and may already be decoded by the database driver.
+    Attributes which are missing or None are left out.
+    """
+    if not source or source == EMPTY_JSON_OBJECT:
+        return {}
+    if isinstance(source, dict):
+        return {
+            key: value
+            for key in attribute_keys
+            if (value := source.get(key)) is not None
+        }
+    if (attributes := attr_cache.get(source)) is not None:
+        return attributes
+    try:
+        decoded = json_loads_object(source)
+    except ValueError:
+        _LOGGER.exception("Error converting row to state attributes: %s", source)
+        decoded = {}
+    attr_cache[source] = attributes = {
+        key: value for key in attribute_keys if (value := decoded.get(key)) is not None
+    }
+    return attributes
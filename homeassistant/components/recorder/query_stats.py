@@ -0,0 +1,273 @@
+"""Profile the statements the recorder runs on the database."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+import logging
+import math
+import re
+import threading
+import time
+from typing import Any, Final
+
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.engine.interfaces import DBAPICursor
+
+from homeassistant.util import dt as dt_util
+
+from .const import SupportedDialect
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS: Final = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+
+# Statements which take longer than this many seconds are slow queries
+SLOW_QUERY_THRESHOLD: Final = 0.5
+
+# At most one slow query of each statement type is logged per interval
+SLOW_QUERY_SAMPLE_INTERVAL: Final = 60
+
+SLOW_QUERY_LOG_SIZE: Final = 25
+
+# Statements in the slow query log are truncated to this many characters
+MAX_STATEMENT_LENGTH: Final = 2000
+
+# Connection info key of the start of the statement being executed
+QUERY_START: Final = "recorder_query_start"
+
+EXPLAIN_SAVEPOINT: Final = "recorder_explain"
+
+_VERB_RE = re.compile(r"\s*(\w+)")
+_TABLE_RE = re.compile(r"\b(?:FROM|INTO|UPDATE|TABLE)\s+[`\"]?(\w+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def statement_type(statement: str) -> str:
+    """Return the type of a statement, its verb and the table it works on."""
+    verb = match.group(1).upper() if (match := _VERB_RE.match(statement)) else ""
+    if match := _TABLE_RE.search(statement):
+        return f"{verb} {match.group(1)}"
+    return verb
+
+
+class _StatementStats:
+    """Latency histogram and row count of a statement type.
+
+    The rows are the row counts the database driver reports after executing
+    a statement. SQLite does not report the rows of SELECT statements before
+    they are fetched, they are not counted and the row count of a statement
+    type is None if no count was reported.
+    """
+
+    __slots__ = ("count", "total", "max", "rows", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows: int | None = None
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats with the cumulative histogram."""
+        buckets: dict[str, int] = {}
+        count = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.buckets):
+            count += bucket_count
+            buckets["+Inf" if bound == math.inf else str(bound)] = count
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "max": self.max,
+            "rows": self.rows,
+            "buckets": buckets,
+        }
+
+
+class QueryStats:
+    """Latency histograms, row counts and a slow query log per statement type.
+
+    The statements are timed with engine events which are only listened
+    to while profiling is enabled. Slow queries are sampled and explained
+    on the connection which ran them.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the query stats."""
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats: dict[str, _StatementStats] = {}
+        self._slow_queries: deque[dict[str, Any]] = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self._sampled_at: dict[str, float] = {}
+        self._engines: set[Engine] = set()
+        # Keep the bound methods to remove the same listeners again
+        self._before = self._before_cursor_execute
+        self._after = self._after_cursor_execute
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the statements of an engine.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if engine in self._engines:
+            return
+        self._engines.add(engine)
+        sqlalchemy_event.listen(engine, "before_cursor_execute", self._before)
+        sqlalchemy_event.listen(engine, "after_cursor_execute", self._after)
+
+    def detach_all(self) -> None:
+        """Stop listening to the statements of all engines.
+
+        SQLAlchemy keeps dispatching the events of an engine once they
+        have been listened to, so an engine which was profiled stays
+        slightly slower until the recorder reconnects.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for engine in self._engines:
+            sqlalchemy_event.remove(engine, "before_cursor_execute", self._before)
+            sqlalchemy_event.remove(engine, "after_cursor_execute", self._after)
+        self._engines.clear()
+
+    def reset(self) -> None:
+        """Clear the collected stats and slow queries."""
+        with self._lock:
+            self._stats.clear()
+            self._slow_queries.clear()
+            self._sampled_at.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats per statement type and the slow query log."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "statements": {
+                    statement_type: stats.as_dict()
+                    for statement_type, stats in self._stats.items()
+                },
+                "slow_queries": list(self._slow_queries),
+            }
+
+    def slowest_statement_type(self) -> tuple[str, float] | None:
+        """Return the statement type with the highest mean latency."""
+        with self._lock:
+            if not self._stats:
+                return None
+            return max(
+                (
+                    (statement_type, stats.total / stats.count)
+                    for statement_type, stats in self._stats.items()
+                ),
+                key=lambda item: item[1],
+            )
+
+    @property
+    def slow_query_count(self) -> int:
+        """Return the number of queries in the slow query log."""
+        return len(self._slow_queries)
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: DefaultExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """Record the start of a statement."""
+        conn.info[QUERY_START] = time.perf_counter()
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: DefaultExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        """Record the latency and row count of a statement."""
+        if (start := conn.info.pop(QUERY_START, None)) is None:
+            return
+        duration = time.perf_counter() - start
+        type_ = statement_type(statement)
+        # The DB-API row count is -1 when the driver doesn't know it
+        rows = cursor.rowcount if cursor.rowcount >= 0 else None
+        with self._lock:
+            if (stats := self._stats.get(type_)) is None:
+                stats = self._stats[type_] = _StatementStats()
+            stats.count += 1
+            stats.total += duration
+            stats.max = max(stats.max, duration)
+            if rows is not None:
+                stats.rows = (stats.rows or 0) + rows
+            stats.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+            if duration < SLOW_QUERY_THRESHOLD or (
+                time.monotonic() - self._sampled_at.get(type_, -math.inf)
+                < SLOW_QUERY_SAMPLE_INTERVAL
+            ):
+                return
+            self._sampled_at[type_] = time.monotonic()
+
+        explain = None
+        if (
+            type_.startswith("SELECT")
+            and not executemany
+            and not (context and context.execution_options.get("stream_results"))
+        ):
+            explain = _explain(conn, statement, parameters)
+        _LOGGER.info("Slow query (%.3f s): %s", duration, statement)
+        slow_query = {
+            "time": dt_util.utcnow(),
+            "statement_type": type_,
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "duration": duration,
+            "rows": rows,
+            "explain": explain,
+        }
+        with self._lock:
+            self._slow_queries.append(slow_query)
+
+
+def _explain(
+    conn: Connection, statement: str, parameters: Any
+) -> list[list[str]] | None:
+    """Return the query plan of a statement.
+
+    On PostgreSQL a failed statement aborts the transaction, the statement
+    is explained in a savepoint to keep the transaction of the recorder
+    usable if explaining it fails.
+    """
+    dialect_name = conn.dialect.name
+    explain = (
+        "EXPLAIN QUERY PLAN " if dialect_name == SupportedDialect.SQLITE else "EXPLAIN "
+    )
+    savepoint = dialect_name == SupportedDialect.POSTGRESQL
+    try:
+        cursor = conn.connection.cursor()
+        try:
+            if savepoint:
+                cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            try:
+                cursor.execute(explain + statement, parameters)
+                plan = [[str(value) for value in row] for row in cursor.fetchall()]
+            except Exception:
+                if savepoint:
+                    cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+                raise
+            if savepoint:
+                cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            return plan
+        finally:
+            cursor.close()
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Error explaining query %s: %s", statement, err)
+        return None
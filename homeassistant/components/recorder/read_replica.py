@@ -0,0 +1,176 @@
+"""Route recorder reads to a read only replica of the database."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import math
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import create_engine, event as sqlalchemy_event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from .db_schema import States
+
+_LOGGER = logging.getLogger(__name__)
+
+# Session info key of the database a session reads from
+READ_TARGET = "recorder_read_target"
+READ_TARGET_PRIMARY = "primary"
+READ_TARGET_REPLICA = "replica"
+
+# Seconds between checks of how far the replica is behind the primary
+REPLICA_LAG_CHECK_INTERVAL = 10
+
+# Seconds to wait for a free connection in the read pool
+READ_POOL_TIMEOUT = 30
+
+
+class ReadQueryTimings:
+    """Latency of the read queries per database they were routed to.
+
+    Reads run in the database executor threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timings."""
+        self._lock = threading.Lock()
+        self._timings: dict[str, list[float]] = {}
+
+    def record(self, target: str, duration: float) -> None:
+        """Record the duration of a read."""
+        with self._lock:
+            if (timing := self._timings.get(target)) is None:
+                self._timings[target] = [1, duration, duration]
+                return
+            timing[0] += 1
+            timing[1] += duration
+            timing[2] = max(timing[2], duration)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the count, mean and max duration of the reads per target."""
+        with self._lock:
+            return {
+                target: {"count": int(count), "mean": total / count, "max": maximum}
+                for target, (count, total, maximum) in self._timings.items()
+            }
+
+
+class ReadReplica:
+    """Bounded pool of connections to a read only replica of the database.
+
+    Reads are only routed to the replica while it is at most max_lag
+    seconds behind the states the recorder committed to the primary,
+    otherwise they fall back to the primary.
+    """
+
+    def __init__(self, db_url: str, pool_size: int, max_lag: float) -> None:
+        """Initialize the replica."""
+        self.db_url = db_url
+        self.pool_size = pool_size
+        self.max_lag = max_lag
+        self.engine: Engine | None = None
+        self._get_session: Callable[[], Session] | None = None
+        # Seconds the replica is behind, None if it is not available
+        self.lag: float | None = None
+        self._checked_at = -math.inf
+        self._check_lock = threading.Lock()
+        self._available: bool | None = None
+
+    def setup(
+        self,
+        dialect_kwargs: dict[str, Any],
+        setup_connection: Callable[[DBAPIConnection, Any], None],
+    ) -> None:
+        """Create the engine and the read pool.
+
+        The engine is created with the same dialect arguments as the
+        engine of the primary, setup_connection is called for every new
+        connection.
+        """
+        kwargs: dict[str, Any] = {
+            **dialect_kwargs,
+            "pool_size": self.pool_size,
+            "max_overflow": 0,
+            "pool_timeout": READ_POOL_TIMEOUT,
+            "pool_pre_ping": True,
+        }
+        self.engine = create_engine(self.db_url, **kwargs, future=True)
+        sqlalchemy_event.listen(self.engine, "connect", setup_connection)
+        self._get_session = scoped_session(
+            sessionmaker(
+                bind=self.engine,
+                future=True,
+                info={READ_TARGET: READ_TARGET_REPLICA},
+            )
+        )
+        self._checked_at = -math.inf
+
+    def close(self) -> None:
+        """Close the read pool."""
+        if self.engine:
+            self.engine.dispose()
+            self.engine = None
+        self._get_session = None
+
+    def get_session(self) -> Session:
+        """Get a new sqlalchemy session reading from the replica."""
+        if self._get_session is None:
+            raise RuntimeError("The read replica connection has not been established")
+        return self._get_session()
+
+    def is_current(self, newest_committed_ts: float | None) -> bool:
+        """Return if the replica is close enough to the primary to read from.
+
+        How far the replica is behind is checked at most every
+        REPLICA_LAG_CHECK_INTERVAL seconds, reads which happen while
+        another thread checks use the previous result. Until the newest
+        committed state of the primary is known, reads use the primary.
+        """
+        if newest_committed_ts is None:
+            return False
+        now = time.monotonic()
+        if (
+            now - self._checked_at >= REPLICA_LAG_CHECK_INTERVAL
+            and self._check_lock.acquire(blocking=False)
+        ):
+            try:
+                self._checked_at = now
+                self._update_lag(newest_committed_ts)
+            finally:
+                self._check_lock.release()
+        return self.lag is not None and self.lag <= self.max_lag
+
+    def _update_lag(self, newest_committed_ts: float) -> None:
+        """Compare the newest state of the replica to the newest committed state."""
+        try:
+            session = self.get_session()
+            try:
+                replica_ts: float | None = session.execute(
+                    select(func.max(States.last_updated_ts))
+                ).scalar()
+            finally:
+                session.close()
+        except (RuntimeError, SQLAlchemyError) as err:
+            if self._available is not False:
+                _LOGGER.warning(
+                    "Read replica is not available, reading from the primary: %s",
+                    err,
+                )
+            self._available = False
+            self.lag = None
+            return
+        if (replica_ts or 0.0) >= newest_committed_ts:
+            self.lag = 0.0
+        elif replica_ts is None:
+            self.lag = math.inf
+        else:
+            self.lag = newest_committed_ts - replica_ts
+        if self._available is False:
+            _LOGGER.info("Read replica is available again")
+        self._available = True
+        _LOGGER.debug("Read replica is %.1f seconds behind", self.lag)
@@ -14,7 +14,7 @@ import re
 from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, delete, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
@@ -57,6 +57,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -122,6 +125,33 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_STATISTICS_ROLLUP_MEAN = (
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+    func.count(Statistics.mean),
+)
+
+QUERY_STATISTICS_ROLLUP_SUM = (
+    Statistics.metadata_id,
+    Statistics.start_ts,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(  # type: ignore[no-untyped-call]
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
+STATISTICS_ROLLUP_TABLES: dict[str, type[StatisticsRollupBase]] = {
+    "day": StatisticsDaily,
+    "month": StatisticsMonthly,
+}
+
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: DataRateConverter for unit in DataRateConverter.VALID_UNITS},
@@ -425,6 +455,235 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        _fold_hour_into_statistics_rollups(session, summary, start_time_ts)
+
+
+def _fold_hour_into_statistics_rollups(
+    session: Session, summary: dict[int, StatisticDataTimestamp], start_time_ts: float
+) -> None:
+    """Fold a newly compiled hour into the daily and monthly rollups.
+
+    Only the rollup rows of the day and month containing the hour are updated.
+    Hours are compiled in order, so last_reset, state and sum of the hour
+    replace those of the rollup rows.
+    """
+    for period, table in STATISTICS_ROLLUP_TABLES.items():
+        period_start_ts, _ = _rollup_period_start_end(period)(start_time_ts)
+        rollups = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(table).filter(table.start_ts == period_start_ts)
+        }
+        for metadata_id, stat in summary.items():
+            _mean = stat.get("mean")
+            if (rollup := rollups.get(metadata_id)) is None:
+                period_stat = stat.copy()
+                period_stat["start_ts"] = period_start_ts
+                rollup = table.from_stats_ts(metadata_id, period_stat)
+                rollup.mean_count = 0 if _mean is None else 1
+                session.add(rollup)
+                continue
+            if _mean is not None:
+                mean_count = rollup.mean_count or 0
+                if rollup.mean is None or not mean_count:
+                    rollup.mean = _mean
+                    mean_count = 0
+                else:
+                    rollup.mean += (_mean - rollup.mean) / (mean_count + 1)
+                rollup.mean_count = mean_count + 1
+            if (_min := stat.get("min")) is not None and (
+                rollup.min is None or _min < rollup.min
+            ):
+                rollup.min = _min
+            if (_max := stat.get("max")) is not None and (
+                rollup.max is None or _max > rollup.max
+            ):
+                rollup.max = _max
+            rollup.last_reset_ts = stat.get("last_reset_ts")
+            rollup.state = stat.get("state")
+            rollup.sum = stat.get("sum")
+
+
+def _compile_statistics_rollup_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for a statistics rollup."""
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_ROLLUP_MEAN)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(Statistics.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.group_by(Statistics.metadata_id)
+    return stmt
+
+
+def _compile_statistics_rollup_last_sum_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the last sum statement for a statistics rollup."""
+    if metadata_ids:
+        return lambda_stmt(
+            lambda: select(
+                subquery := (
+                    select(*QUERY_STATISTICS_ROLLUP_SUM)
+                    .filter(Statistics.start_ts >= start_time_ts)
+                    .filter(Statistics.start_ts < end_time_ts)
+                    .filter(Statistics.metadata_id.in_(metadata_ids))
+                    .subquery()
+                )
+            ).filter(subquery.c.rownum == 1)
+        )
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                select(*QUERY_STATISTICS_ROLLUP_SUM)
+                .filter(Statistics.start_ts >= start_time_ts)
+                .filter(Statistics.start_ts < end_time_ts)
+                .subquery()
+            )
+        ).filter(subquery.c.rownum == 1)
+    )
+
+
+def _delete_statistics_rollup_stmt(
+    table: type[StatisticsBase], start_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the statement to delete one period of a statistics rollup."""
+    stmt = lambda_stmt(lambda: delete(table).where(table.start_ts == start_time_ts))
+    if metadata_ids:
+        stmt += lambda q: q.where(table.metadata_id.in_(metadata_ids))
+    return stmt
+
+
+def _rollup_period_start_end(period: str) -> Callable[[float], tuple[float, float]]:
+    """Return a function to find the start and end of a rollup period."""
+    if period == "day":
+        return reduce_day_ts_factory()[1]
+    return reduce_month_ts_factory()[1]
+
+
+def _compile_statistics_rollup(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    metadata_ids: list[int] | None,
+    start_time_ts: float,
+    end_time_ts: float,
+) -> None:
+    """Compile one period of a statistics rollup from the hourly statistics.
+
+    This mirrors _reduce_statistics:
+    - average, min max is computed by a database query
+    - last_reset, state and sum are taken from the last hourly entry in the period
+    """
+    summary: dict[int, StatisticDataTimestamp] = {}
+    mean_counts: dict[int, int] = {}
+    stmt = _compile_statistics_rollup_mean_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, _mean, _min, _max, mean_count in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary[metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        mean_counts[metadata_id] = mean_count
+
+    stmt = _compile_statistics_rollup_last_sum_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for stat in execute_stmt_lambda_element(session, stmt):
+        metadata_id, _, last_reset_ts, state, _sum, _ = stat
+        summary.setdefault(metadata_id, {"start_ts": start_time_ts}).update(
+            {
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    session.execute(_delete_statistics_rollup_stmt(table, start_time_ts, metadata_ids))
+    for metadata_id, summary_item in summary.items():
+        rollup = table.from_stats_ts(metadata_id, summary_item)
+        rollup.mean_count = mean_counts.get(metadata_id, 0)
+        session.add(rollup)
+
+
+def _update_statistics_rollups(
+    session: Session,
+    metadata_ids: list[int] | None,
+    start_time_ts: float,
+    end_time_ts: float,
+) -> None:
+    """Recompile the daily and monthly rollups overlapping start_time - end_time.
+
+    If metadata_ids is omitted, the rollups are recompiled for all statistics ids.
+    """
+    for period, table in STATISTICS_ROLLUP_TABLES.items():
+        period_start_end = _rollup_period_start_end(period)
+        period_start_ts, period_end_ts = period_start_end(start_time_ts)
+        while period_start_ts < end_time_ts:
+            _compile_statistics_rollup(
+                session, table, metadata_ids, period_start_ts, period_end_ts
+            )
+            period_start_ts, period_end_ts = period_start_end(period_end_ts)
+
+
+def statistics_rollups_are_current(session: Session) -> bool:
+    """Return True if the rollups cover the hourly statistics in the local timezone.
+
+    The rollups are rebuilt newest to oldest, so they are complete when there is
+    a rollup for the days of both the oldest and the newest hourly statistics.
+    """
+    oldest_ts, newest_ts = session.query(
+        func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+    ).one()
+    if oldest_ts is None:
+        return True
+    _, day_start_end = reduce_day_ts_factory()
+    for start_ts in (oldest_ts, newest_ts):
+        day_start_ts, _ = day_start_end(start_ts)
+        if (
+            session.query(StatisticsDaily.id)
+            .filter(StatisticsDaily.start_ts == day_start_ts)
+            .first()
+            is None
+        ):
+            return False
+    return True
+
+
+def rebuild_statistics_rollups(
+    instance: Recorder, end_time_ts: float | None
+) -> float | None:
+    """Rebuild one month of the statistics rollups, newest month first.
+
+    If end_time_ts is omitted, all rollups are deleted and the rebuild starts
+    over with the month of the newest hourly statistics.
+
+    Returns the end of the next month to rebuild, or None when done.
+    """
+    _, month_start_end = reduce_month_ts_factory()
+    with session_scope(session=instance.get_session()) as session:
+        oldest_ts, newest_ts = session.query(
+            func.min(Statistics.start_ts), func.max(Statistics.start_ts)
+        ).one()
+        if end_time_ts is None:
+            session.execute(delete(StatisticsDaily))
+            session.execute(delete(StatisticsMonthly))
+            if newest_ts is None:
+                return None
+            _, end_time_ts = month_start_end(newest_ts)
+        if oldest_ts is None or end_time_ts <= oldest_ts:
+            return None
+        month_start_ts, _ = month_start_end(end_time_ts - 1)
+        _update_statistics_rollups(session, None, month_start_ts, end_time_ts)
+    return month_start_ts if month_start_ts > oldest_ts else None
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -1622,6 +1881,138 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_during_period_from_rollups(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return daily or monthly statistics from the precompiled rollups.
+
+    The rollups are only used for the periods which are entirely within
+    start_time - end_time, the partial periods at the edges are reduced from
+    the hourly statistics.
+
+    Returns None if there is no rollup for the period or the rollups can't
+    be used and the hourly statistics need to be reduced instead.
+    """
+    instance = get_instance(hass)
+    if (
+        table := STATISTICS_ROLLUP_TABLES.get(period)
+    ) is None or not instance.statistics_rollups_active:
+        return None
+
+    period_start_end = _rollup_period_start_end(period)
+    start_time_ts = start_time.timestamp()
+    first_start_ts, first_end_ts = period_start_end(start_time_ts)
+    rollups_start_ts = (
+        start_time_ts if first_start_ts == start_time_ts else first_end_ts
+    )
+    end_time_ts = end_time.timestamp() if end_time else None
+    rollups_end_ts: float | None = None
+    if end_time_ts is not None:
+        rollups_end_ts = max(period_start_end(end_time_ts)[0], rollups_start_ts)
+
+    def _reduce_hourly(edge_start_ts: float, edge_end_ts: float) -> None:
+        """Reduce the hourly statistics of a partial period at an edge."""
+        edge_start_time = dt_util.utc_from_timestamp(edge_start_ts)
+        stmt = _generate_statistics_during_period_stmt(
+            edge_start_time,
+            dt_util.utc_from_timestamp(edge_end_ts),
+            metadata_ids,
+            Statistics,
+            types,
+        )
+        if not (
+            stats := cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(session, stmt, orm_rows=False),
+            )
+        ):
+            return
+        hourly = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            Statistics,
+            edge_start_time,
+            units,
+            types,
+        )
+        reduce = (
+            _reduce_statistics_per_day
+            if period == "day"
+            else _reduce_statistics_per_month
+        )
+        for statistic_id, rows in reduce(hourly, types).items():
+            result[statistic_id].extend(rows)
+
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    if rollups_start_ts != start_time_ts:
+        _reduce_hourly(
+            start_time_ts,
+            rollups_start_ts
+            if end_time_ts is None
+            else min(rollups_start_ts, end_time_ts),
+        )
+
+    rollups_start_time = dt_util.utc_from_timestamp(rollups_start_ts)
+    stmt = _generate_statistics_during_period_stmt(
+        rollups_start_time,
+        None if rollups_end_ts is None else dt_util.utc_from_timestamp(rollups_end_ts),
+        metadata_ids,
+        table,
+        types,
+    )
+    if stats := cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    ):
+        rollups = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            rollups_start_time,
+            units,
+            types,
+        )
+        for statistic_id, rows in rollups.items():
+            for row in rows:
+                period_start_ts, period_end_ts = period_start_end(row["start"])
+                if period_start_ts != row["start"]:
+                    # The rollups were compiled for another time zone
+                    if instance.statistics_rollups_active:
+                        # pylint: disable-next=import-outside-toplevel
+                        from .tasks import StatisticsRollupsRebuildTask
+
+                        instance.statistics_rollups_active = False
+                        instance.queue_task(StatisticsRollupsRebuildTask())
+                    return None
+                row["end"] = period_end_ts
+            result[statistic_id].extend(rows)
+
+    if (
+        end_time_ts is not None
+        and rollups_end_ts is not None
+        and rollups_end_ts < end_time_ts
+    ):
+        _reduce_hourly(rollups_end_ts, end_time_ts)
+
+    return dict(result)
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1692,37 +2083,50 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
+    result = _statistics_during_period_from_rollups(
         hass,
         session,
-        stats,
+        start_time,
+        end_time,
         statistic_ids,
         metadata,
-        True,
-        table,
-        start_time,
+        metadata_ids,
+        period,
         units,
         types,
     )
+    if result is None:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if not stats:
+            return {}
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
+
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
+
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2381,14 +2785,32 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
+    statistics = list(statistics)
     with session_scope(
         session=instance.get_session(),
         exception_filter=_filter_unique_constraint_integrity_error(instance),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    if table == Statistics and statistics:
+        # Recompile the rollups overlapping the imported hours once the import
+        # has been committed, a blocked duplicate must not roll them back
+        start_times_ts = [stat["start"].timestamp() for stat in statistics]
+        with session_scope(session=instance.get_session()) as session:
+            if statistic := instance.statistics_meta_manager.get(
+                session, metadata["statistic_id"]
+            ):
+                _update_statistics_rollups(
+                    session,
+                    [statistic[0]],
+                    min(start_times_ts),
+                    max(start_times_ts) + 1,
+                )
+
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2429,6 +2851,23 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The rollups containing start_time are recompiled from the adjusted
+        # hourly statistics, later rollups are shifted by the adjustment
+        start_time_ts = start_time.replace(minute=0).timestamp()
+        session.flush()
+        _update_statistics_rollups(
+            session, [metadata[statistic_id][0]], start_time_ts, start_time_ts + 1
+        )
+        for period, table in STATISTICS_ROLLUP_TABLES.items():
+            _, period_end_ts = _rollup_period_start_end(period)(start_time_ts)
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                dt_util.utc_from_timestamp(period_end_ts),
+                sum_adjustment,
+            )
+
     return True
 
 
@@ -2489,6 +2928,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -54,6 +54,38 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_read_replica_info(instance: Recorder) -> dict[str, Any]:
+    """Get read replica info."""
+    if not (read_replica := instance.read_replica):
+        return {}
+    read_replica_info: dict[str, Any] = {
+        "read_replica_lag": "unavailable"
+        if (lag := read_replica.lag) is None
+        else f"{lag:.1f} s"
+    }
+    for target, timing in instance.read_query_timings.as_dict().items():
+        read_replica_info[f"{target}_read_latency"] = (
+            f"{timing['mean'] * 1000:.1f} ms mean, {timing['max'] * 1000:.1f} ms max"
+            f" of {timing['count']} reads"
+        )
+    return read_replica_info
+
+
+@callback
+def _async_get_query_stats_info(instance: Recorder) -> dict[str, Any]:
+    """Get query stats info."""
+    query_stats = instance.query_stats
+    if not query_stats.enabled:
+        return {}
+    query_stats_info: dict[str, Any] = {"slow_queries": query_stats.slow_query_count}
+    if slowest := query_stats.slowest_statement_type():
+        statement_type, mean = slowest
+        slowest_statement = f"{statement_type} ({mean * 1000:.1f} ms)"
+        query_stats_info["slowest_statement"] = slowest_statement
+    return query_stats_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -71,4 +103,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_read_replica_info(instance)
+        | _async_get_query_stats_info(instance)
+    )
@@ -1,6 +1,9 @@
 """Support managing States."""
 from __future__ import annotations
 
+from sqlalchemy import func, select
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
 
@@ -11,6 +14,10 @@ class StatesManager:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
+        # last_updated_ts of the newest committed state, read from other
+        # threads to tell how far a read replica is behind. None until it
+        # is loaded from the database, 0 if there are no states.
+        self.newest_committed_ts: float | None = None
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -49,10 +56,30 @@ class StatesManager:
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        newest_committed_ts = self.newest_committed_ts
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+            if (last_updated_ts := db_states.last_updated_ts) is not None and (
+                newest_committed_ts is None or last_updated_ts > newest_committed_ts
+            ):
+                newest_committed_ts = last_updated_ts
+        self.newest_committed_ts = newest_committed_ts
         self._pending.clear()
 
+    def load_newest_committed_ts(self, session: Session) -> None:
+        """Load the last_updated_ts of the newest state in the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        newest_ts: float | None = session.execute(
+            select(func.max(States.last_updated_ts))
+        ).scalar()
+        if self.newest_committed_ts is None or (
+            newest_ts is not None and newest_ts > self.newest_committed_ts
+        ):
+            self.newest_committed_ts = newest_ts or 0.0
+
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
 
@@ -230,6 +230,28 @@ class AdjustStatisticsTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class StatisticsRollupsRebuildTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups.
+
+    The rollups are rebuilt one month at a time, newest month first.
+    """
+
+    end_time_ts: float | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollups rebuild task."""
+        if (
+            end_time_ts := statistics.rebuild_statistics_rollups(
+                instance, self.end_time_ts
+            )
+        ) is not None:
+            # Schedule a new rebuild task for the next month
+            instance.queue_task(StatisticsRollupsRebuildTask(end_time_ts))
+        else:
+            instance.statistics_rollups_active = True
+
+
 @dataclass(slots=True)
 class WaitTask(RecorderTask):
     """An object to insert into the recorder queue.
@@ -372,6 +394,17 @@ class AdjustLRUSizeTask(RecorderTask):
         instance._adjust_lru_size()  # pylint: disable=[protected-access]
 
 
+@dataclass(slots=True)
+class QueryStatsTask(RecorderTask):
+    """An object to insert into the recorder queue to start or stop profiling."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task to update the query stats listeners."""
+        instance._update_query_stats_listeners()  # pylint: disable=[protected-access]
+
+
 @dataclass(slots=True)
 class StatesContextIDMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to migrate states context ids."""
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Collection, Generator, Iterable, Sequence
+import contextlib
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 import functools
@@ -35,6 +36,10 @@ from .const import (
     DATA_INSTANCE,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
+    MARIADB_PYMYSQL_URL_PREFIX,
+    MARIADB_URL_PREFIX,
+    MYSQLDB_PYMYSQL_URL_PREFIX,
+    MYSQLDB_URL_PREFIX,
     SQLITE_MAX_BIND_VARS,
     SQLITE_MODERN_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
@@ -53,6 +58,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .read_replica import READ_TARGET, READ_TARGET_PRIMARY, ReadQueryTimings
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -96,6 +102,7 @@ MIN_VERSION_MYSQL = _simple_version("8.0.0")
 MIN_VERSION_PGSQL = _simple_version("12.0")
 MIN_VERSION_SQLITE = _simple_version("3.31.0")
 MIN_VERSION_SQLITE_MODERN_BIND_VARS = _simple_version("3.32.0")
+MIN_VERSION_SQLITE_JSON_ARROW = _simple_version("3.38.0")
 
 
 # This is the maximum time after the recorder ends the session
@@ -126,15 +133,24 @@ def session_scope(
 
     read_only is used to indicate that the session is only used for reading
     data and that no commit is required. It does not prevent the session
-    from writing and is not a security measure.
+    from writing and is not a security measure. Read only sessions of
+    the recorder of hass may read from the read replica, their latency
+    is recorded.
     """
+    timings: ReadQueryTimings | None = None
     if session is None and hass is not None:
-        session = get_instance(hass).get_session()
+        instance = get_instance(hass)
+        if read_only:
+            session = instance.get_read_session()
+            timings = instance.read_query_timings
+        else:
+            session = instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
 
     need_rollback = False
+    start = time.perf_counter()
     try:
         yield session
         if session.get_transaction() and not read_only:
@@ -148,6 +164,11 @@ def session_scope(
             raise
     finally:
         session.close()
+        if timings is not None:
+            timings.record(
+                session.info.get(READ_TARGET, READ_TARGET_PRIMARY),
+                time.perf_counter() - start,
+            )
 
 
 def execute(
@@ -442,6 +463,33 @@ def build_mysqldb_conv() -> dict:
     return {**conversions, FIELD_TYPE.DATETIME: _datetime_or_none}
 
 
+def build_dialect_engine_kwargs(db_url: str) -> dict[str, Any]:
+    """Build the engine arguments the dialect of a database url needs."""
+    kwargs: dict[str, Any] = {}
+    if db_url.startswith(
+        (
+            MARIADB_URL_PREFIX,
+            MARIADB_PYMYSQL_URL_PREFIX,
+            MYSQLDB_URL_PREFIX,
+            MYSQLDB_PYMYSQL_URL_PREFIX,
+        )
+    ):
+        kwargs["connect_args"] = {"charset": "utf8mb4"}
+        if db_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+            # If they have configured MySQLDB but don't have
+            # the MySQLDB module installed this will throw
+            # an ImportError which we suppress here since
+            # sqlalchemy will give them a better error when
+            # it tried to import it below.
+            with contextlib.suppress(ImportError):
+                kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+
+    # Disable extended logging for non SQLite databases
+    if not db_url.startswith(SQLITE_URL_PREFIX):
+        kwargs["echo"] = False
+    return kwargs
+
+
 @callback
 def _async_create_mariadb_range_index_regression_issue(
     hass: HomeAssistant, version: AwesomeVersion
@@ -479,6 +527,7 @@ def setup_connection_for_dialect(
     """Execute statements needed for dialect connection."""
     version: AwesomeVersion | None = None
     slow_range_in_select = False
+    json_projection = False
     if dialect_name == SupportedDialect.SQLITE:
         max_bind_vars = SQLITE_MAX_BIND_VARS
         if first_connection:
@@ -501,6 +550,9 @@ def setup_connection_for_dialect(
             if version and version > MIN_VERSION_SQLITE_MODERN_BIND_VARS:
                 max_bind_vars = SQLITE_MODERN_MAX_BIND_VARS
 
+            # The -> operator keeps the JSON types of the extracted values
+            json_projection = bool(version and version >= MIN_VERSION_SQLITE_JSON_ARROW)
+
         # The upper bound on the cache size is approximately 16MiB of memory
         execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
 
@@ -549,6 +601,10 @@ def setup_connection_for_dialect(
                     version or version_string, "MySQL", MIN_VERSION_MYSQL
                 )
 
+            # MariaDB has no JSON type, the extracted values would be
+            # embedded as strings
+            json_projection = not is_maria_db
+
             slow_range_in_select = bool(
                 not version
                 or version < MARIADB_WITH_FIXED_IN_QUERIES_105
@@ -570,6 +626,7 @@ def setup_connection_for_dialect(
                 _fail_unsupported_version(
                     version or version_string, "PostgreSQL", MIN_VERSION_PGSQL
                 )
+            json_projection = True
 
     else:
         _fail_unsupported_dialect(dialect_name)
@@ -580,7 +637,10 @@ def setup_connection_for_dialect(
     return DatabaseEngine(
         dialect=SupportedDialect(dialect_name),
         version=version,
-        optimizer=DatabaseOptimizer(slow_range_in_select=slow_range_in_select),
+        optimizer=DatabaseOptimizer(
+            slow_range_in_select=slow_range_in_select,
+            json_projection=json_projection,
+        ),
         max_bind_vars=max_bind_vars,
     )
 
@@ -85,6 +85,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_query_stats)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
 
@@ -512,6 +513,31 @@ def ws_info(
     connection.send_result(msg["id"], recorder_info)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/query_stats",
+        vol.Optional("enable"): bool,
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@callback
+def ws_query_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the stats of the statements run on the database.
+
+    Profiling can be enabled or disabled, with reset the stats are cleared
+    after they are returned.
+    """
+    instance = get_instance(hass)
+    if "enable" in msg:
+        instance.async_set_query_stats_enabled(msg["enable"])
+    connection.send_result(msg["id"], instance.query_stats.as_dict())
+    if msg["reset"]:
+        instance.query_stats.reset()
+
+
 @websocket_api.ws_require_user(only_supervisor=True)
 @websocket_api.websocket_command({vol.Required("type"): "backup/start"})
 @websocket_api.async_response
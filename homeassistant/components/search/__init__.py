@@ -7,8 +7,7 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.components import automation, group, person, script, websocket_api
-from homeassistant.components.homeassistant import scene
+from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback, split_entity_id
 from homeassistant.helpers import (
     config_validation as cv,
@@ -21,6 +20,8 @@ from homeassistant.helpers.entity import (
 )
 from homeassistant.helpers.typing import ConfigType
 
+from .graph import ReferenceGraph, async_get_reference_graph
+
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +67,7 @@ def websocket_search_related(
         dr.async_get(hass),
         er.async_get(hass),
         get_entity_sources(hass),
+        async_get_reference_graph(hass),
     )
     connection.send_result(
         msg["id"], searcher.async_search(msg["item_type"], msg["item_id"])
@@ -101,12 +103,14 @@ class Searcher:
         device_reg: dr.DeviceRegistry,
         entity_reg: er.EntityRegistry,
         entity_sources: dict[str, EntityInfo],
+        graph: ReferenceGraph | None = None,
     ) -> None:
         """Search results."""
         self.hass = hass
         self._device_reg = device_reg
         self._entity_reg = entity_reg
         self._sources = entity_sources
+        self._graph = graph or async_get_reference_graph(hass)
         self.results: defaultdict[str, set[str]] = defaultdict(set)
         self._to_resolve: deque[tuple[str, str]] = deque()
 
@@ -159,10 +163,7 @@ class Searcher:
         for entity_entry in er.async_entries_for_area(self._entity_reg, area_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_area(self.hass, area_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_area(self.hass, area_id):
+        for entity_id in self._graph.async_referenced_by("area", area_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
@@ -171,21 +172,7 @@ class Searcher:
 
         Will only be called if automation is an entry point.
         """
-        for entity in automation.entities_in_automation(
-            self.hass, automation_entity_id
-        ):
-            self._add_or_resolve("entity", entity)
-
-        for device in automation.devices_in_automation(self.hass, automation_entity_id):
-            self._add_or_resolve("device", device)
-
-        for area in automation.areas_in_automation(self.hass, automation_entity_id):
-            self._add_or_resolve("area", area)
-
-        if blueprint := automation.blueprint_in_automation(
-            self.hass, automation_entity_id
-        ):
-            self._add_or_resolve("automation_blueprint", blueprint)
+        self._resolve_references(automation_entity_id)
 
     @callback
     def _resolve_automation_blueprint(self, blueprint_path) -> None:
@@ -193,8 +180,8 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in automation.automations_with_blueprint(
-            self.hass, blueprint_path
+        for entity_id in self._graph.async_referenced_by(
+            "automation_blueprint", blueprint_path
         ):
             self._add_or_resolve("automation", entity_id)
 
@@ -232,30 +219,15 @@ class Searcher:
         for entity_entry in er.async_entries_for_device(self._entity_reg, device_id):
             self._add_or_resolve("entity", entity_entry.entity_id)
 
-        for entity_id in script.scripts_with_device(self.hass, device_id):
-            self._add_or_resolve("entity", entity_id)
-
-        for entity_id in automation.automations_with_device(self.hass, device_id):
+        for entity_id in self._graph.async_referenced_by("device", device_id):
             self._add_or_resolve("entity", entity_id)
 
     @callback
     def _resolve_entity(self, entity_id) -> None:
         """Resolve an entity."""
-        # Extra: Find automations and scripts that reference this entity.
-
-        for entity in scene.scenes_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in group.groups_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in automation.automations_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in script.scripts_with_entity(self.hass, entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for entity in person.persons_with_entity(self.hass, entity_id):
+        # Extra: Find automations, scripts, scenes, groups and persons that
+        # reference this entity.
+        for entity in self._graph.async_referenced_by("entity", entity_id):
             self._add_or_resolve("entity", entity)
 
         # Find devices
@@ -282,8 +254,7 @@ class Searcher:
 
         Will only be called if group is an entry point.
         """
-        for entity_id in group.get_entity_ids(self.hass, group_entity_id):
-            self._add_or_resolve("entity", entity_id)
+        self._resolve_references(group_entity_id)
 
     @callback
     def _resolve_person(self, person_entity_id) -> None:
@@ -291,8 +262,7 @@ class Searcher:
 
         Will only be called if person is an entry point.
         """
-        for entity in person.entities_in_person(self.hass, person_entity_id):
-            self._add_or_resolve("entity", entity)
+        self._resolve_references(person_entity_id)
 
     @callback
     def _resolve_scene(self, scene_entity_id) -> None:
@@ -300,8 +270,7 @@ class Searcher:
 
         Will only be called if scene is an entry point.
         """
-        for entity in scene.entities_in_scene(self.hass, scene_entity_id):
-            self._add_or_resolve("entity", entity)
+        self._resolve_references(scene_entity_id)
 
     @callback
     def _resolve_script(self, script_entity_id) -> None:
@@ -309,17 +278,7 @@ class Searcher:
 
         Will only be called if script is an entry point.
         """
-        for entity in script.entities_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("entity", entity)
-
-        for device in script.devices_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("device", device)
-
-        for area in script.areas_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("area", area)
-
-        if blueprint := script.blueprint_in_script(self.hass, script_entity_id):
-            self._add_or_resolve("script_blueprint", blueprint)
+        self._resolve_references(script_entity_id)
 
     @callback
     def _resolve_script_blueprint(self, blueprint_path) -> None:
@@ -327,5 +286,20 @@ class Searcher:
 
         Will only be called if blueprint is an entry point.
         """
-        for entity_id in script.scripts_with_blueprint(self.hass, blueprint_path):
+        for entity_id in self._graph.async_referenced_by(
+            "script_blueprint", blueprint_path
+        ):
             self._add_or_resolve("script", entity_id)
+
+    @callback
+    def _resolve_references(self, entity_id: str) -> None:
+        """Resolve the items an automation, script, scene, group or person references."""
+        for item_type in (
+            "entity",
+            "device",
+            "area",
+            "automation_blueprint",
+            "script_blueprint",
+        ):
+            for item_id in self._graph.async_references(entity_id, item_type):
+                self._add_or_resolve(item_type, item_id)
@@ -0,0 +1,163 @@
+"""Reference graph between automations, scripts, scenes, groups and persons."""
+from __future__ import annotations
+
+from collections import defaultdict
+
+from homeassistant.components import automation, group, person, script
+from homeassistant.components.homeassistant import scene
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, callback, split_entity_id
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_added_domain,
+    async_track_state_removed_domain,
+)
+from homeassistant.helpers.typing import EventType
+
+DATA_REFERENCE_GRAPH = "search_reference_graph"
+
+# Domains of the entities referencing other items
+SOURCE_DOMAINS = ("automation", "group", "person", "scene", "script")
+
+# Domains of which the references can change without the entity being
+# added again, the references are exposed as state attributes
+ATTRIBUTE_SOURCE_DOMAINS = ("group", "person")
+
+Reference = tuple[str, str]
+
+
+def _source_references(hass: HomeAssistant, entity_id: str) -> set[Reference]:
+    """Return the items an automation, script, scene, group or person references."""
+    domain = split_entity_id(entity_id)[0]
+    references: set[Reference] = set()
+    if domain == "automation":
+        references.update(
+            ("entity", item)
+            for item in automation.entities_in_automation(hass, entity_id)
+        )
+        references.update(
+            ("device", item)
+            for item in automation.devices_in_automation(hass, entity_id)
+        )
+        references.update(
+            ("area", item) for item in automation.areas_in_automation(hass, entity_id)
+        )
+        if blueprint := automation.blueprint_in_automation(hass, entity_id):
+            references.add(("automation_blueprint", blueprint))
+    elif domain == "script":
+        references.update(
+            ("entity", item) for item in script.entities_in_script(hass, entity_id)
+        )
+        references.update(
+            ("device", item) for item in script.devices_in_script(hass, entity_id)
+        )
+        references.update(
+            ("area", item) for item in script.areas_in_script(hass, entity_id)
+        )
+        if blueprint := script.blueprint_in_script(hass, entity_id):
+            references.add(("script_blueprint", blueprint))
+    elif domain == "scene":
+        references.update(
+            ("entity", item) for item in scene.entities_in_scene(hass, entity_id)
+        )
+    elif domain == "group":
+        references.update(
+            ("entity", item) for item in group.get_entity_ids(hass, entity_id)
+        )
+    elif domain == "person":
+        references.update(
+            ("entity", item) for item in person.entities_in_person(hass, entity_id)
+        )
+    return references
+
+
+class ReferenceGraph:
+    """Bidirectional graph of the items referenced by entities.
+
+    The graph is built from the current entities on first use. After
+    that the references of an entity are updated when it is added or
+    removed, which includes reloads, or when the references exposed in
+    its attributes change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the graph."""
+        self.hass = hass
+        self._references: dict[str, set[Reference]] = {}
+        self._referenced_by: defaultdict[Reference, set[str]] = defaultdict(set)
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the graph and keep it up to date."""
+        for entity_id in self.hass.states.async_entity_ids(SOURCE_DOMAINS):
+            self._async_update_source(entity_id)
+        async_track_state_added_domain(
+            self.hass, SOURCE_DOMAINS, self._async_source_changed
+        )
+        async_track_state_removed_domain(
+            self.hass, SOURCE_DOMAINS, self._async_source_changed
+        )
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_source_changed,  # type: ignore[arg-type]
+            event_filter=self._async_references_changed_filter,  # type: ignore[arg-type]
+        )
+
+    @callback
+    def _async_references_changed_filter(
+        self, event: EventType[EventStateChangedData]
+    ) -> bool:
+        """Return if the references exposed in the attributes may have changed."""
+        return (
+            (old_state := event.data["old_state"]) is not None
+            and (new_state := event.data["new_state"]) is not None
+            and new_state.domain in ATTRIBUTE_SOURCE_DOMAINS
+            and old_state.attributes != new_state.attributes
+        )
+
+    @callback
+    def _async_source_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Update the references of an added, removed or changed entity."""
+        self._async_update_source(event.data["entity_id"])
+
+    @callback
+    def _async_update_source(self, entity_id: str) -> None:
+        """Update the references of an entity."""
+        references = (
+            _source_references(self.hass, entity_id)
+            if self.hass.states.get(entity_id) is not None
+            else set()
+        )
+        old_references = self._references.pop(entity_id, set())
+        for reference in old_references - references:
+            referenced_by = self._referenced_by[reference]
+            referenced_by.discard(entity_id)
+            if not referenced_by:
+                del self._referenced_by[reference]
+        for reference in references - old_references:
+            self._referenced_by[reference].add(entity_id)
+        if references:
+            self._references[entity_id] = references
+
+    @callback
+    def async_references(self, entity_id: str, item_type: str) -> list[str]:
+        """Return the items of a type an entity references."""
+        return [
+            item_id
+            for reference_type, item_id in self._references.get(entity_id, ())
+            if reference_type == item_type
+        ]
+
+    @callback
+    def async_referenced_by(self, item_type: str, item_id: str) -> list[str]:
+        """Return the entities referencing an item."""
+        return list(self._referenced_by.get((item_type, item_id), ()))
+
+
+@callback
+def async_get_reference_graph(hass: HomeAssistant) -> ReferenceGraph:
+    """Return the reference graph, building it on first use."""
+    if (graph := hass.data.get(DATA_REFERENCE_GRAPH)) is None:
+        graph = hass.data[DATA_REFERENCE_GRAPH] = ReferenceGraph(hass)
+        graph.async_setup()
+    return graph
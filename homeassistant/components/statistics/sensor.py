@@ -1,7 +1,6 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
@@ -13,7 +12,6 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.sensor import (
     DEVICE_CLASS_STATE_CLASSES,
     PLATFORM_SCHEMA,
@@ -40,19 +38,11 @@ from homeassistant.core import (
 )
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import (
-    EventStateChangedData,
-    async_track_point_in_utc_time,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.start import async_at_start
-from homeassistant.helpers.typing import (
-    ConfigType,
-    DiscoveryInfoType,
-    EventType,
-    StateType,
-)
+from homeassistant.helpers.state_series import StateSeriesWindow, async_get_state_series
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
@@ -257,6 +247,7 @@ async def async_setup_platform(
     async_add_entities(
         new_entities=[
             StatisticsSensor(
+                hass=hass,
                 source_entity_id=config[CONF_ENTITY_ID],
                 name=config[CONF_NAME],
                 unique_id=config.get(CONF_UNIQUE_ID),
@@ -276,6 +267,7 @@ class StatisticsSensor(SensorEntity):
 
     def __init__(
         self,
+        hass: HomeAssistant,
         source_entity_id: str,
         name: str,
         unique_id: str | None,
@@ -303,10 +295,15 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.states: list[float | bool] = []
+        self.ages: list[float] = []
         self.attributes: dict[str, StateType] = {}
 
+        self._series = async_get_state_series(hass, source_entity_id)
+        self._series_window = StateSeriesWindow(
+            samples_max_age, samples_max_buffer_size
+        )
+
         self._state_characteristic_fn: Callable[
             [], StateType | datetime
         ] = self._callable_characteristic_fn(self._state_characteristic)
@@ -317,24 +314,18 @@ class StatisticsSensor(SensorEntity):
         """Register callbacks."""
 
         @callback
-        def async_stats_sensor_state_listener(
-            event: EventType[EventStateChangedData],
-        ) -> None:
+        def async_stats_sensor_state_listener(new_state: State, added: bool) -> None:
             """Handle the sensor state changes."""
-            if (new_state := event.data["new_state"]) is None:
-                return
-            self._add_state_to_queue(new_state)
+            self._process_new_state(new_state, added)
             self.async_schedule_update_ha_state(True)
 
         async def async_stats_sensor_startup(_: HomeAssistant) -> None:
-            """Add listener and get recorded state."""
+            """Attach to the source series and get recorded state."""
             _LOGGER.debug("Startup for %s", self.entity_id)
 
             self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass,
-                    [self._source_entity_id],
-                    async_stats_sensor_state_listener,
+                self._series.async_attach(
+                    self._series_window, async_stats_sensor_state_listener
                 )
             )
 
@@ -343,8 +334,11 @@ class StatisticsSensor(SensorEntity):
 
         self.async_on_remove(async_at_start(self.hass, async_stats_sensor_startup))
 
-    def _add_state_to_queue(self, new_state: State) -> None:
-        """Add the state to the queue."""
+    def _process_new_state(self, new_state: State, added: bool) -> None:
+        """Update availability and unit from a new state of the source.
+
+        The sample itself is added to the shared series of the source.
+        """
         self._available = new_state.state != STATE_UNAVAILABLE
         if new_state.state == STATE_UNAVAILABLE:
             self.attributes[STAT_SOURCE_VALUE_VALID] = None
@@ -353,15 +347,7 @@ class StatisticsSensor(SensorEntity):
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
             return
 
-        try:
-            if self.is_binary:
-                assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
-            else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
-            self.attributes[STAT_SOURCE_VALUE_VALID] = True
-        except ValueError:
+        if not added:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
             _LOGGER.error(
                 "%s: parsing error. Expected number or binary state, but received '%s'",
@@ -370,6 +356,7 @@ class StatisticsSensor(SensorEntity):
             )
             return
 
+        self.attributes[STAT_SOURCE_VALUE_VALID] = True
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
@@ -449,26 +436,14 @@ class StatisticsSensor(SensorEntity):
             key: value for key, value in self.attributes.items() if value is not None
         }
 
-    def _purge_old_states(self, max_age: timedelta) -> None:
-        """Remove states which are older than a given age."""
-        now = dt_util.utcnow()
-
-        _LOGGER.debug(
-            "%s: purging records older then %s(%s)",
-            self.entity_id,
-            dt_util.as_local(now - max_age),
-            self._samples_max_age,
-        )
-
-        while self.ages and (now - self.ages[0]) > max_age:
-            _LOGGER.debug(
-                "%s: purging record with datetime %s(%s)",
-                self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
-            )
-            self.ages.popleft()
-            self.states.popleft()
+    def _load_samples(self) -> None:
+        """Load the samples within the configured boundaries from the series."""
+        ages, values = self._series.async_get_window(self._series_window)
+        self.ages = ages.tolist()
+        if self.is_binary:
+            self.states = [value == 1.0 for value in values]
+        else:
+            self.states = values.tolist()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -476,14 +451,13 @@ class StatisticsSensor(SensorEntity):
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._samples_max_age
+            return dt_util.utc_from_timestamp(self.ages[0]) + self._samples_max_age
         return None
 
     async def async_update(self) -> None:
         """Get the latest data and updates the states."""
         _LOGGER.debug("%s: updating statistics", self.entity_id)
-        if self._samples_max_age is not None:
-            self._purge_old_states(self._samples_max_age)
+        self._load_samples()
 
         self._update_attributes()
         self._update_value()
@@ -506,46 +480,18 @@ class StatisticsSensor(SensorEntity):
                 self.hass, _scheduled_update, timestamp
             )
 
-    def _fetch_states_from_database(self) -> list[State]:
-        """Fetch the states from the database."""
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-        lower_entity_id = self._source_entity_id.lower()
-        if self._samples_max_age is not None:
-            start_date = (
-                dt_util.utcnow() - self._samples_max_age - timedelta(microseconds=1)
-            )
-            _LOGGER.debug(
-                "%s: retrieve records not older then %s",
-                self.entity_id,
-                start_date,
-            )
-        else:
-            start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
-            _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
-            self.hass,
-            start_date,
-            entity_id=lower_entity_id,
-            descending=True,
-            limit=self._samples_max_buffer_size,
-            include_start_time_state=False,
-        ).get(lower_entity_id, [])
-
     async def _initialize_from_database(self) -> None:
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
+        """Initialize the samples from the database.
 
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
+        The recorder is only queried when the series shared by the sensors
+        of the same source does not hold the sampling window yet.
         """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
-        ):
-            for state in reversed(states):
-                self._add_state_to_queue(state)
+        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
+        await self._series.async_warm(self._series_window)
+        if (last_state := self._series.last_state) is not None:
+            self._process_new_state(
+                last_state, self._series.value_from_state(last_state) is not None
+            )
 
         self.async_schedule_update_ha_state(True)
 
@@ -561,7 +507,7 @@ class StatisticsSensor(SensorEntity):
         if self._samples_max_age is not None:
             if len(self.states) >= 1:
                 self.attributes[STAT_AGE_COVERAGE_RATIO] = round(
-                    (self.ages[-1] - self.ages[0]).total_seconds()
+                    (self.ages[-1] - self.ages[0])
                     / self._samples_max_age.total_seconds(),
                     2,
                 )
@@ -604,9 +550,9 @@ class StatisticsSensor(SensorEntity):
                 area += (
                     0.5
                     * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
+                    * (self.ages[i] - self.ages[i - 1])
                 )
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
+            age_range_seconds = self.ages[-1] - self.ages[0]
             return area / age_range_seconds
         return None
 
@@ -614,11 +560,8 @@ class StatisticsSensor(SensorEntity):
         if len(self.states) >= 2:
             area: float = 0
             for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
+                area += self.states[i - 1] * (self.ages[i] - self.ages[i - 1])
+            age_range_seconds = self.ages[-1] - self.ages[0]
             return area / age_range_seconds
         return None
 
@@ -637,7 +580,7 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_change_second(self) -> StateType:
         if len(self.states) > 1:
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
+            age_range_seconds = self.ages[-1] - self.ages[0]
             if age_range_seconds > 0:
                 return (self.states[-1] - self.states[0]) / age_range_seconds
         return None
@@ -647,22 +590,26 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_newest(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[-1]
+            return dt_util.utc_from_timestamp(self.ages[-1])
         return None
 
     def _stat_datetime_oldest(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[0]
+            return dt_util.utc_from_timestamp(self.ages[0])
         return None
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return dt_util.utc_from_timestamp(
+                self.ages[self.states.index(max(self.states))]
+            )
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return dt_util.utc_from_timestamp(
+                self.ages[self.states.index(min(self.states))]
+            )
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -760,8 +707,8 @@ class StatisticsSensor(SensorEntity):
             on_seconds: float = 0
             for i in range(1, len(self.states)):
                 if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
+                    on_seconds += self.ages[i] - self.ages[i - 1]
+            age_range_seconds = self.ages[-1] - self.ages[0]
             return 100 / age_range_seconds * on_seconds
         return None
 
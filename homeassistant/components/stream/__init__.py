@@ -286,9 +286,6 @@ class Stream:
         self._thread_quit = threading.Event()
         self._outputs: dict[str, StreamOutput] = {}
         self._fast_restart_once = False
-        self._keyframe_converter = KeyFrameConverter(
-            hass, stream_settings, dynamic_stream_settings
-        )
         self._available: bool = True
         self._update_callback: Callable[[], None] | None = None
         self._logger = (
@@ -297,6 +294,9 @@ class Stream:
             else _LOGGER
         )
         self._diagnostics = Diagnostics()
+        self._keyframe_converter = KeyFrameConverter(
+            hass, stream_settings, dynamic_stream_settings, self._diagnostics
+        )
 
     def endpoint_url(self, fmt: str) -> str:
         """Start the stream and returns a url for the output format."""
@@ -34,6 +34,7 @@ PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audi
 MAX_TIMESTAMP_GAP = 30  # seconds - anything from 10 to 50000 is probably reasonable
 
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
+MAX_KEYFRAME_IMAGES = 4  # Number of image sizes kept for the latest keyframe
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
 
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -21,16 +22,18 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    MAX_KEYFRAME_IMAGES,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
     from . import Stream
+    from .diagnostics import Diagnostics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -422,9 +425,11 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode the packet into a frame
         _generate_image will clear the packet, so there will only be one attempt per packet
-    If successful, self._image will be updated and returned by get_image
+        _generate_image will encode the frame at the requested size
+    The images encoded from the last decoded frame are kept by size, so requests
+    for a size which was already encoded are served without an executor job.
     If unsuccessful, get_image will return the previous image
     """
 
@@ -433,6 +438,7 @@ class KeyFrameConverter:
         hass: HomeAssistant,
         stream_settings: StreamSettings,
         dynamic_stream_settings: DynamicStreamSettings,
+        diagnostics: Diagnostics,
     ) -> None:
         """Initialize."""
 
@@ -445,11 +451,16 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        self._images: OrderedDict[
+            tuple[int | None, int | None, int], bytes
+        ] = OrderedDict()
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
+        self._diagnostics = diagnostics
 
     def stash_keyframe_packet(self, packet: Packet) -> None:
         """Store the keyframe and set the asyncio.Event from the event loop.
@@ -483,18 +494,20 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
-
-        This is run in an executor thread, but since it is called within an
-        the asyncio lock from the main thread, there will only be one entry
-        at a time per instance.
-        """
-
-        if not (self._turbojpeg and self._packet and self._codec_context):
-            return
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of the image of a size in the current orientation."""
+        if width and height:
+            return (width, height, self._dynamic_stream_settings.orientation)
+        return (None, None, self._dynamic_stream_settings.orientation)
+
+    def _decode_packet(self) -> None:
+        """Decode the stashed keyframe packet into a frame."""
+        assert self._codec_context
         packet = self._packet
         self._packet = None
+        start = time.monotonic()
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -511,18 +524,44 @@ class KeyFrameConverter:
         else:
             _LOGGER.debug("Unable to decode keyframe")
             return
+        self._diagnostics.add_duration("keyframe_decode", time.monotonic() - start)
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._images.clear()
+
+    def _generate_image(self, width: int | None, height: int | None) -> None:
+        """Generate the keyframe image.
+
+        This is run in an executor thread, but since it is called within an
+        the asyncio lock from the main thread, there will only be one entry
+        at a time per instance.
+        """
+
+        if not (self._turbojpeg and self._codec_context):
+            return
+        if self._packet:
+            self._decode_packet()
+        if (frame := self._frame) is None:
+            return
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is not None:
+            self._diagnostics.increment("keyframe_image_hit")
+            self._images.move_to_end(key)
+            self._image = image
+            return
+        self._diagnostics.increment("keyframe_image_miss")
+        if width and height:
+            if self._dynamic_stream_settings.orientation >= 5:
+                frame = frame.reformat(width=height, height=width)
+            else:
+                frame = frame.reformat(width=width, height=height)
+        bgr_array = self.transform_image(
+            frame.to_ndarray(format="bgr24"),
+            self._dynamic_stream_settings.orientation,
+        )
+        self._image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
+        while len(self._images) > MAX_KEYFRAME_IMAGES:
+            self._images.popitem(last=False)
 
     async def async_get_image(
         self,
@@ -537,5 +576,11 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
+            if not self._packet and (
+                image := self._images.get(self._image_key(width, height))
+            ):
+                # The image was already encoded from the latest keyframe
+                self._diagnostics.increment("keyframe_image_hit")
+                return image
             await self._hass.async_add_executor_job(self._generate_image, width, height)
         return self._image
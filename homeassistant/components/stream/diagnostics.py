@@ -17,17 +17,30 @@ class Diagnostics:
         """Initialize Diagnostics."""
         self._counter: Counter = Counter()
         self._values: dict[str, Any] = {}
+        self._durations: dict[str, tuple[int, float, float]] = {}
 
     def increment(self, key: str) -> None:
         """Increment a counter for the specified key/event."""
         self._counter.update(Counter({key: 1}))
 
+    def add_duration(self, key: str, seconds: float) -> None:
+        """Record how many seconds an occurrence of the specified operation took."""
+        count, total, maximum = self._durations.get(key, (0, 0.0, 0.0))
+        self._durations[key] = (count + 1, total + seconds, max(maximum, seconds))
+
     def set_value(self, key: str, value: Any) -> None:
         """Update a key/value pair."""
         self._values[key] = value
 
     def as_dict(self) -> dict[str, Any]:
         """Return diagnostics as a debug dictionary."""
-        result = {k: self._counter[k] for k in self._counter}
+        result: dict[str, Any] = {k: self._counter[k] for k in self._counter}
         result.update(self._values)
+        for key, (count, total, maximum) in self._durations.items():
+            result[f"{key}_count"] = count
+            result[f"{key}_avg_seconds"] = round(total / count, 6)
+            result[f"{key}_max_seconds"] = round(maximum, 6)
+        hits = self._counter["keyframe_image_hit"]
+        if lookups := hits + self._counter["keyframe_image_miss"]:
+            result["keyframe_image_hit_rate"] = round(hits / lookups, 3)
         return result
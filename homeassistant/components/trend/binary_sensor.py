@@ -1,8 +1,9 @@
 """A sensor that monitors trends in other components."""
 from __future__ import annotations
 
-from collections import deque
+from bisect import bisect_left
 from collections.abc import Mapping
+from datetime import timedelta
 import logging
 import math
 from typing import Any
@@ -29,18 +30,14 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import (
-    EventStateChangedData,
-    async_track_state_change_event,
-)
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, EventType
-from homeassistant.util.dt import utcnow
+from homeassistant.helpers.state_series import StateSeriesWindow, async_get_state_series
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import PLATFORMS
 from .const import (
@@ -169,7 +166,15 @@ class SensorTrend(BinarySensorEntity, RestoreEntity):
         self._sample_duration = sample_duration
         self._min_gradient = min_gradient
         self._min_samples = min_samples
-        self.samples: deque = deque(maxlen=max_samples)
+        self._series = async_get_state_series(hass, entity_id, attribute)
+        self._series_window = StateSeriesWindow(
+            timedelta(seconds=sample_duration) if sample_duration > 0 else None,
+            max_samples,
+        )
+        self.samples: list[tuple[float, float]] = []
+        # Timestamp of the first sample of the sensor, it only uses the
+        # samples of the series it has seen itself
+        self._samples_since: float | None = None
 
     @property
     def is_on(self) -> bool | None:
@@ -193,28 +198,25 @@ class SensorTrend(BinarySensorEntity, RestoreEntity):
         """Complete device setup after being added to hass."""
 
         @callback
-        def trend_sensor_state_listener(
-            event: EventType[EventStateChangedData],
-        ) -> None:
+        def trend_sensor_state_listener(new_state: State, added: bool) -> None:
             """Handle state changes on the observed device."""
-            if (new_state := event.data["new_state"]) is None:
+            # Binary states are not converted to numbers for trends
+            if added and not self._series.is_binary:
+                if self._samples_since is None:
+                    self._samples_since = self._series.timestamps[-1]
+                self.async_schedule_update_ha_state(True)
                 return
-            try:
-                if self._attribute:
-                    state = new_state.attributes.get(self._attribute)
-                else:
-                    state = new_state.state
-                if state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-                    sample = (new_state.last_updated.timestamp(), float(state))  # type: ignore[arg-type]
-                    self.samples.append(sample)
-                    self.async_schedule_update_ha_state(True)
-            except (ValueError, TypeError) as ex:
-                _LOGGER.error(ex)
+            if self._attribute:
+                state = new_state.attributes.get(self._attribute)
+            else:
+                state = new_state.state
+            if state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                _LOGGER.error(
+                    "%s: could not convert %s to float", self.entity_id, state
+                )
 
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [self._entity_id], trend_sensor_state_listener
-            )
+            self._series.async_attach(self._series_window, trend_sensor_state_listener)
         )
 
         if not (state := await self.async_get_last_state()):
@@ -225,11 +227,13 @@ class SensorTrend(BinarySensorEntity, RestoreEntity):
 
     async def async_update(self) -> None:
         """Get the latest data and update the states."""
-        # Remove outdated samples
-        if self._sample_duration > 0:
-            cutoff = utcnow().timestamp() - self._sample_duration
-            while self.samples and self.samples[0][0] < cutoff:
-                self.samples.popleft()
+        # Only use the samples within max_samples and sample_duration
+        timestamps, values = self._series.async_get_window(self._series_window)
+        if self._samples_since is None:
+            self.samples = []
+        else:
+            start = bisect_left(timestamps, self._samples_since)
+            self.samples = list(zip(timestamps[start:], values[start:]))
 
         if len(self.samples) < self._min_samples:
             return
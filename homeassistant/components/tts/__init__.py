@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
+from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import datetime
 from functools import partial
@@ -15,6 +16,7 @@ import os
 import re
 import subprocess
 import tempfile
+import time
 from typing import Any, TypedDict, final
 
 from aiohttp import web
@@ -46,6 +48,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -54,6 +57,9 @@ from .const import (
     ATTR_LANGUAGE,
     ATTR_MESSAGE,
     ATTR_OPTIONS,
+    CACHE_INDEX_SAVE_DELAY,
+    CACHE_INDEX_STORAGE_KEY,
+    CACHE_INDEX_STORAGE_VERSION,
     CONF_CACHE,
     CONF_CACHE_DIR,
     CONF_TIME_MEMORY,
@@ -62,6 +68,8 @@ from .const import (
     DEFAULT_CACHE_DIR,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    FILE_CACHE_MAX_SIZE,
+    MEM_CACHE_MAX_SIZE,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -121,6 +129,17 @@ class TTSCache(TypedDict):
     pending: asyncio.Task | None
 
 
+class TTSCacheIndex(TypedDict):
+    """Persisted index of the cache dir.
+
+    The files map cache keys to [filename, size, last access timestamp].
+    """
+
+    cache_dir: str
+    mtime_ns: int
+    files: dict[str, list[Any]]
+
+
 @callback
 def async_default_engine(hass: HomeAssistant) -> str | None:
     """Return the domain or entity id of the default engine.
@@ -498,7 +517,18 @@ class SpeechManager:
         self.cache_dir = cache_dir
         self.time_memory = time_memory
         self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        self.file_cache_size = 0
+        self.file_cache_max_size = FILE_CACHE_MAX_SIZE
+        # Least recently used entries first
+        self.mem_cache: OrderedDict[str, TTSCache] = OrderedDict()
+        self.mem_cache_size = 0
+        self.mem_cache_max_size = MEM_CACHE_MAX_SIZE
+        # Size and last access timestamp of the files in the file cache
+        self._file_cache_usage: dict[str, tuple[int, float]] = {}
+        self._cache_dir_mtime_ns = 0
+        self._index_store = Store[TTSCacheIndex](
+            hass, CACHE_INDEX_STORAGE_VERSION, CACHE_INDEX_STORAGE_KEY
+        )
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
@@ -510,29 +540,102 @@ class SpeechManager:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
         try:
-            cache_files = await self.hass.async_add_executor_job(
-                _get_cache_files, self.cache_dir
+            index = await self._index_store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Can't load cache index, rebuilding it: %s", err)
+            index = None
+
+        try:
+            (
+                cache_files,
+                self._file_cache_usage,
+                self._cache_dir_mtime_ns,
+            ) = await self.hass.async_add_executor_job(
+                _load_cache_files, self.cache_dir, index
             )
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
         if cache_files:
             self.file_cache.update(cache_files)
+        self.file_cache_size = sum(size for size, _ in self._file_cache_usage.values())
+        if index is None or index["mtime_ns"] != self._cache_dir_mtime_ns:
+            self._async_schedule_save_index()
+        await self._async_evict_file_cache()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache = OrderedDict()
+        self.mem_cache_size = 0
+
+        filenames = list(self.file_cache.values())
+        self.file_cache = {}
+        self.file_cache_size = 0
+        self._file_cache_usage = {}
+        await self._async_remove_cache_files(filenames)
+
+    async def _async_remove_cache_files(self, filenames: list[str]) -> None:
+        """Remove files from the cache dir and save the index."""
 
-        def remove_files() -> None:
+        def remove_files() -> int:
             """Remove files from filesystem."""
-            for filename in self.file_cache.values():
+            for filename in filenames:
                 try:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+            return os.stat(self.cache_dir).st_mtime_ns
 
-        await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+        try:
+            self._cache_dir_mtime_ns = await self.hass.async_add_executor_job(
+                remove_files
+            )
+        except OSError as err:
+            _LOGGER.warning("Can't read cache dir: %s", err)
+        self._async_schedule_save_index()
+
+    async def _async_evict_file_cache(self) -> None:
+        """Remove the least recently used files over the file cache budget."""
+        if self.file_cache_size <= self.file_cache_max_size:
+            return
+        evicted: list[str] = []
+        for cache_key, (size, _) in sorted(
+            self._file_cache_usage.items(), key=lambda item: item[1][1]
+        ):
+            if self.file_cache_size <= self.file_cache_max_size:
+                break
+            evicted.append(self.file_cache.pop(cache_key))
+            del self._file_cache_usage[cache_key]
+            self.file_cache_size -= size
+        _LOGGER.debug("Removing %s files from the cache dir", len(evicted))
+        await self._async_remove_cache_files(evicted)
+
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the index of the cache dir."""
+        self._index_store.async_delay_save(self._data_to_save, CACHE_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> TTSCacheIndex:
+        """Return the index of the cache dir to store in a file."""
+        return {
+            "cache_dir": self.cache_dir,
+            "mtime_ns": self._cache_dir_mtime_ns,
+            "files": {
+                cache_key: [filename, *self._file_cache_usage[cache_key]]
+                for cache_key, filename in self.file_cache.items()
+                if cache_key in self._file_cache_usage
+            },
+        }
+
+    @callback
+    def _async_mark_used(self, cache_key: str) -> None:
+        """Mark a cached voice as used now."""
+        if cache_key in self.mem_cache:
+            self.mem_cache.move_to_end(cache_key)
+        if (usage := self._file_cache_usage.get(cache_key)) is not None:
+            self._file_cache_usage[cache_key] = (usage[0], time.time())
+            self._async_schedule_save_index()
 
     @callback
     def async_register_legacy_engine(
@@ -611,6 +714,7 @@ class SpeechManager:
         # Is speech already in memory
         if cache_key in self.mem_cache:
             filename = self.mem_cache[cache_key]["filename"]
+            self._async_mark_used(cache_key)
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
             filename = self.file_cache[cache_key]
@@ -640,19 +744,20 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key in self.mem_cache:
+            self._async_mark_used(cache_key)
+        elif use_cache and cache_key in self.file_cache:
+            await self._async_file_to_mem(cache_key)
+        else:
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
+        extension = os.path.splitext(cached["filename"])[1][1:]
         if pending := cached.get("pending"):
+            # The pending entry is updated in place once the voice is ready
             await pending
-            cached = self.mem_cache[cache_key]
         return extension, cached["voice"]
 
     @callback
@@ -757,7 +862,7 @@ class SpeechManager:
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self._async_remove_from_memcache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
@@ -778,25 +883,61 @@ class SpeechManager:
         """
         voice_file = os.path.join(self.cache_dir, filename)
 
-        def save_speech() -> None:
+        def save_speech() -> int:
             """Store speech to filesystem."""
             with open(voice_file, "wb") as speech:
                 speech.write(data)
+            return os.stat(self.cache_dir).st_mtime_ns
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
+            mtime_ns = await self.hass.async_add_executor_job(save_speech)
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+        self._cache_dir_mtime_ns = max(self._cache_dir_mtime_ns, mtime_ns)
+        self.file_cache[cache_key] = filename
+        if (usage := self._file_cache_usage.get(cache_key)) is not None:
+            self.file_cache_size -= usage[0]
+        self._file_cache_usage[cache_key] = (len(data), time.time())
+        self.file_cache_size += len(data)
+        self._async_schedule_save_index()
+        await self._async_evict_file_cache()
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
 
+        Concurrent loads of the same voice share a single read.
+
         This method is a coroutine.
         """
+        if (cached := self.mem_cache.get(cache_key)) is not None:
+            self._async_mark_used(cache_key)
+            if pending := cached["pending"]:
+                await pending
+            return
+
         if not (filename := self.file_cache.get(cache_key)):
             raise HomeAssistantError(f"Key {cache_key} not in file cache!")
 
+        load_task = self.hass.async_create_task(
+            self._async_load_file(cache_key, filename)
+        )
+
+        def handle_error(_future: asyncio.Future) -> None:
+            """Handle error."""
+            if load_task.exception():
+                self._async_remove_from_memcache(cache_key)
+
+        load_task.add_done_callback(handle_error)
+        self.mem_cache[cache_key] = {
+            "filename": filename,
+            "voice": b"",
+            "pending": load_task,
+        }
+        await load_task
+
+    async def _async_load_file(self, cache_key: str, filename: str) -> None:
+        """Read a voice file of the file cache into memory."""
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
@@ -807,26 +948,50 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            if self.file_cache.pop(cache_key, None) is not None and (
+                usage := self._file_cache_usage.pop(cache_key, None)
+            ):
+                self.file_cache_size -= usage[0]
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
+        self._async_mark_used(cache_key)
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
-        """Store data to memcache and set timer to remove it."""
-        self.mem_cache[cache_key] = {
-            "filename": filename,
-            "voice": data,
-            "pending": None,
-        }
+        """Store data to memcache and set timer to remove it.
+
+        A pending entry is updated in place, so callers waiting for it
+        get the voice even if it is evicted from the memcache meanwhile.
+        """
+        if (cached := self.mem_cache.get(cache_key)) is not None:
+            self.mem_cache_size -= len(cached["voice"])
+            cached["filename"] = filename
+            cached["voice"] = data
+            cached["pending"] = None
+            self.mem_cache.move_to_end(cache_key)
+        else:
+            self.mem_cache[cache_key] = {
+                "filename": filename,
+                "voice": data,
+                "pending": None,
+            }
+        self.mem_cache_size += len(data)
+
+        # Evict the least recently used voices over the budget, but never the
+        # voice which was just stored or voices which are still pending
+        for evict_key in list(self.mem_cache)[:-1]:
+            if self.mem_cache_size <= self.mem_cache_max_size:
+                break
+            if not self.mem_cache[evict_key]["pending"]:
+                self._async_remove_from_memcache(evict_key)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._async_remove_from_memcache(cache_key)
 
         async_call_later(
             self.hass,
@@ -838,6 +1003,12 @@ class SpeechManager:
             ),
         )
 
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove a voice from the memcache."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self.mem_cache_size -= len(cached["voice"])
+
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
@@ -856,11 +1027,12 @@ class SpeechManager:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
+        else:
+            self._async_mark_used(cache_key)
 
         cached = self.mem_cache[cache_key]
         if pending := cached.get("pending"):
             await pending
-            cached = self.mem_cache[cache_key]
 
         content, _ = mimetypes.guess_type(filename)
         return content, cached["voice"]
@@ -944,6 +1116,33 @@ def _get_cache_files(cache_dir: str) -> dict[str, str]:
     return cache
 
 
+def _load_cache_files(
+    cache_dir: str, index: TTSCacheIndex | None
+) -> tuple[dict[str, str], dict[str, tuple[int, float]], int]:
+    """Return the files of the cache dir with their size and last access.
+
+    The persisted index is used when the cache dir was not modified since it
+    was saved, otherwise the cache dir is scanned.
+    """
+    mtime_ns = os.stat(cache_dir).st_mtime_ns
+    if index and index["cache_dir"] == cache_dir and index["mtime_ns"] == mtime_ns:
+        return (
+            {key: filename for key, (filename, _, _) in index["files"].items()},
+            {key: (size, access) for key, (_, size, access) in index["files"].items()},
+            mtime_ns,
+        )
+
+    cache = _get_cache_files(cache_dir)
+    usage: dict[str, tuple[int, float]] = {}
+    for key, filename in cache.items():
+        try:
+            stat = os.stat(os.path.join(cache_dir, filename))
+        except OSError:
+            continue
+        usage[key] = (stat.st_size, max(stat.st_atime, stat.st_mtime))
+    return cache, usage, mtime_ns
+
+
 class TextToSpeechUrlView(HomeAssistantView):
     """TTS view to get a url to a generated speech file."""
 
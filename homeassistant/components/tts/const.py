@@ -13,6 +13,14 @@ DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
 
+# Byte budgets of the generated audio kept in memory and in the cache dir
+MEM_CACHE_MAX_SIZE = 32 * 1024 * 1024
+FILE_CACHE_MAX_SIZE = 1024 * 1024 * 1024
+
+CACHE_INDEX_STORAGE_KEY = "tts.cache_index"
+CACHE_INDEX_STORAGE_VERSION = 1
+CACHE_INDEX_SAVE_DELAY = 60
+
 DOMAIN = "tts"
 
 DATA_TTS_MANAGER = "tts_manager"
@@ -198,6 +198,7 @@ class WebhookView(HomeAssistantView):
     name = "api:webhook"
     requires_auth = False
     cors_allowed = True
+    lightweight = True
 
     async def _handle(self, request: Request, webhook_id: str) -> Response:
         """Handle webhook call."""
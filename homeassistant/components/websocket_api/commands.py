@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 import datetime as dt
 from functools import lru_cache, partial
+import hashlib
 import json
 import logging
 from typing import Any, cast
@@ -14,6 +15,9 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    EVENT_COMPONENT_LOADED,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -47,9 +51,13 @@ from homeassistant.helpers.json import (
     find_paths_unserializable_data,
     json_dumps,
 )
-from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.service import (
+    ALL_SERVICE_DESCRIPTIONS_CACHE,
+    async_get_all_descriptions,
+)
 from homeassistant.helpers.typing import EventType
 from homeassistant.loader import (
+    DATA_IMPORT_TIME,
     Integration,
     IntegrationNotFound,
     async_get_integration,
@@ -62,8 +70,10 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .state_log import StateChangeLog, async_get_state_change_log
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+MANIFEST_LIST_JSON_CACHE = "websocket_api_manifest_list_json"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -363,6 +373,7 @@ def _forward_entity_changes(
     entity_ids: set[str],
     user: User,
     msg_id: int,
+    log: StateChangeLog | None,
     event: Event,
 ) -> None:
     """Forward entity state changed events to websocket."""
@@ -376,7 +387,12 @@ def _forward_entity_changes(
         POLICY_READ
     ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
         return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    if log is None:
+        send_message(messages.cached_state_diff_message(msg_id, event))
+    else:
+        send_message(
+            messages.cached_state_diff_message(msg_id, event, log.async_sequence(event))
+        )
 
 
 @callback
@@ -384,17 +400,33 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("resumable", default=False): bool,
+        vol.Optional("resume"): {
+            vol.Required("log_id"): str,
+            vol.Required("sequence"): cv.positive_int,
+        },
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    Resumable subscriptions number the changes they send. A client which
+    reconnects can resume from the last sequence it received and only
+    gets the entities which changed since, as long as these changes are
+    still in the state change log.
+    """
     entity_ids = set(msg.get("entity_ids", []))
+    resume: dict[str, Any] | None = msg.get("resume")
+    log = (
+        async_get_state_change_log(hass)
+        if msg["resumable"] or resume is not None
+        else None
+    )
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
@@ -403,25 +435,81 @@ def handle_subscribe_entities(
             entity_ids,
             connection.user,
             msg["id"],
+            log,
         ),
         run_immediately=True,
     )
-    connection.send_result(msg["id"])
 
+    if log is None:
+        connection.send_result(msg["id"])
+        _send_handle_entities_init_response(
+            connection,
+            msg["id"],
+            _async_serialize_states(
+                connection, _async_get_allowed_states(hass, connection), entity_ids
+            ),
+        )
+        return
+
+    changed_entity_ids = (
+        log.async_entity_ids_since(resume["log_id"], resume["sequence"])
+        if resume is not None
+        else None
+    )
+    connection.send_result(
+        msg["id"], {"log_id": log.log_id, "resumed": changed_entity_ids is not None}
+    )
+    if changed_entity_ids is None:
+        _send_handle_entities_init_response(
+            connection,
+            msg["id"],
+            _async_serialize_states(
+                connection, _async_get_allowed_states(hass, connection), entity_ids
+            ),
+            sequence=log.sequence,
+        )
+        return
+
+    # The current state of the entities which changed replaces the
+    # state of the client, the changes in between are not replayed
+    permissions = connection.user.permissions
+    access_all_entities = permissions.access_all_entities(POLICY_READ)
+    changed_states: list[State] = []
+    removed_entity_ids: list[str] = []
+    for entity_id in dict.fromkeys(changed_entity_ids):
+        if (entity_ids and entity_id not in entity_ids) or (
+            not access_all_entities
+            and not permissions.check_entity(entity_id, POLICY_READ)
+        ):
+            continue
+        if (state := hass.states.get(entity_id)) is None:
+            removed_entity_ids.append(entity_id)
+        else:
+            changed_states.append(state)
+    _send_handle_entities_init_response(
+        connection,
+        msg["id"],
+        _async_serialize_states(connection, changed_states, entity_ids),
+        removed_entity_ids,
+        log.sequence,
+    )
+
+
+def _async_serialize_states(
+    connection: ActiveConnection, states: list[State], entity_ids: set[str]
+) -> list[str]:
+    """Serialize the compressed states, skipping the unserializable ones."""
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
     try:
-        serialized_states = [
+        return [
             state.as_compressed_state_json
             for state in states
             if not entity_ids or state.entity_id in entity_ids
         ]
     except (ValueError, TypeError):
         pass
-    else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
-        return
 
     serialized_states = []
     for state in states:
@@ -434,42 +522,128 @@ def handle_subscribe_entities(
                     find_paths_unserializable_data(state, dump=JSON_DUMP)
                 ),
             )
-
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    return serialized_states
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
+    connection: ActiveConnection,
+    msg_id: int,
+    serialized_states: list[str],
+    removed_entity_ids: list[str] | None = None,
+    sequence: int | None = None,
 ) -> None:
     """Send handle entities init response."""
-    connection.send_message(
-        f'{{"id":{msg_id},"type":"event","event":{{"a":{{{",".join(serialized_states)}}}}}}}'
+    event = f'"a":{{{",".join(serialized_states)}}}'
+    if removed_entity_ids:
+        event += f',"r":{JSON_DUMP(removed_entity_ids)}'
+    if sequence is not None:
+        event += f',"s":{sequence}'
+    connection.send_message(f'{{"id":{msg_id},"type":"event","event":{{{event}}}}}')
+
+
+class _VersionedPayloadCache:
+    """JSON payload and its version, kept until it is invalidated."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.generation = 0
+        self.payload: str | None = None
+        self.version: str | None = None
+        self.source: Any = None
+
+    @callback
+    def async_invalidate(self, event: Event | None = None) -> None:
+        """Drop the payload."""
+        self.generation += 1
+        self.payload = self.version = self.source = None
+
+    @callback
+    def async_set(self, generation: int, payload: str, source: Any = None) -> str:
+        """Store a payload built at a generation and return its version.
+
+        The payload is not stored when the cache was invalidated while
+        it was built.
+        """
+        version = _payload_version(payload)
+        if generation == self.generation:
+            self.payload, self.version, self.source = payload, version, source
+        return version
+
+
+def _payload_version(payload: str) -> str:
+    """Return the version of a payload."""
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@callback
+def _async_get_payload_cache(
+    hass: HomeAssistant, key: str, invalidate_on: tuple[str, ...]
+) -> _VersionedPayloadCache:
+    """Return a payload cache, invalidated by the events."""
+    if (cache := hass.data.get(key)) is None:
+        cache = hass.data[key] = _VersionedPayloadCache()
+        for event_type in invalidate_on:
+            hass.bus.async_listen(
+                event_type, cache.async_invalidate, run_immediately=True
+            )
+    return cast(_VersionedPayloadCache, cache)
+
+
+def _versioned_result_message(msg: dict[str, Any], payload: str, version: str) -> str:
+    """Return the result message of a versioned payload.
+
+    Clients which send a version get the payload with its version, or
+    only not_modified when they already have this version.
+    """
+    if "version" not in msg:
+        return construct_result_message(msg["id"], payload)
+    if msg["version"] == version:
+        return construct_result_message(
+            msg["id"], f'{{"version":"{version}","not_modified":true}}'
+        )
+    return construct_result_message(
+        msg["id"], f'{{"version":"{version}","not_modified":false,"data":{payload}}}'
     )
 
 
-async def _async_get_all_descriptions_json(hass: HomeAssistant) -> str:
-    """Return JSON of descriptions (i.e. user documentation) for all service calls."""
+async def _async_get_all_descriptions_json(hass: HomeAssistant) -> tuple[str, str]:
+    """Return JSON of descriptions (i.e. user documentation) for all service calls.
+
+    The JSON is returned with its version and kept until a service is
+    registered or removed, an integration is loaded or a service schema
+    is set.
+    """
+    cache = _async_get_payload_cache(
+        hass,
+        ALL_SERVICE_DESCRIPTIONS_JSON_CACHE,
+        (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED, EVENT_COMPONENT_LOADED),
+    )
+    # Setting a service schema replaces the descriptions without an event
+    if (
+        cache.payload is not None
+        and cache.version is not None
+        and cache.source is hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE)
+    ):
+        return cache.payload, cache.version
+    generation = cache.generation
     descriptions = await async_get_all_descriptions(hass)
-    if ALL_SERVICE_DESCRIPTIONS_JSON_CACHE in hass.data:
-        cached_descriptions, cached_json_payload = hass.data[
-            ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
-        ]
-        # If the descriptions are the same, return the cached JSON payload
-        if cached_descriptions is descriptions:
-            return cast(str, cached_json_payload)
     json_payload = json_dumps(descriptions)
-    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
-    return json_payload
+    version = cache.async_set(
+        generation, json_payload, hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE)
+    )
+    return json_payload, version
 
 
-@decorators.websocket_command({vol.Required("type"): "get_services"})
+@decorators.websocket_command(
+    {vol.Required("type"): "get_services", vol.Optional("version"): vol.Any(str, None)}
+)
 @decorators.async_response
 async def handle_get_services(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get services command."""
-    payload = await _async_get_all_descriptions_json(hass)
-    connection.send_message(construct_result_message(msg["id"], payload))
+    payload, version = await _async_get_all_descriptions_json(hass)
+    connection.send_message(_versioned_result_message(msg, payload, version))
 
 
 @callback
@@ -482,7 +656,11 @@ def handle_get_config(
 
 
 @decorators.websocket_command(
-    {vol.Required("type"): "manifest/list", vol.Optional("integrations"): [str]}
+    {
+        vol.Required("type"): "manifest/list",
+        vol.Optional("integrations"): [str],
+        vol.Optional("version"): vol.Any(str, None),
+    }
 )
 @decorators.async_response
 async def handle_manifest_list(
@@ -490,18 +668,35 @@ async def handle_manifest_list(
 ) -> None:
     """Handle integrations command."""
     wanted_integrations = msg.get("integrations")
+    cache: _VersionedPayloadCache | None = None
     if wanted_integrations is None:
-        wanted_integrations = async_get_loaded_integrations(hass)
+        # Platforms of integrations without a component are loaded
+        # without an event, the loaded integrations are compared instead
+        cache = _async_get_payload_cache(hass, MANIFEST_LIST_JSON_CACHE, ())
+        wanted_integrations = frozenset(async_get_loaded_integrations(hass))
+        if (
+            cache.payload is not None
+            and cache.version is not None
+            and cache.source == wanted_integrations
+        ):
+            connection.send_message(
+                _versioned_result_message(msg, cache.payload, cache.version)
+            )
+            return
 
+    generation = cache.generation if cache is not None else 0
     ints_or_excs = await async_get_integrations(hass, wanted_integrations)
     integrations: list[Integration] = []
     for int_or_exc in ints_or_excs.values():
         if isinstance(int_or_exc, Exception):
             raise int_or_exc
         integrations.append(int_or_exc)
-    connection.send_result(
-        msg["id"], [integration.manifest for integration in integrations]
-    )
+    payload = json_dumps([integration.manifest for integration in integrations])
+    if cache is not None:
+        version = cache.async_set(generation, payload, wanted_integrations)
+    else:
+        version = _payload_version(payload)
+    connection.send_message(_versioned_result_message(msg, payload, version))
 
 
 @decorators.websocket_command(
@@ -525,10 +720,15 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_time: dict[str, float] = hass.data.get(DATA_IMPORT_TIME, {})
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
+            {
+                "domain": integration,
+                "seconds": timedelta.total_seconds(),
+                "import_seconds": import_time.get(integration, 0),
+            }
             for integration, timedelta in cast(
                 dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
             ).items()
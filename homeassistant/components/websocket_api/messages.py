@@ -121,7 +121,9 @@ def _partial_cached_event_message(event: Event) -> str:
     )
 
 
-def cached_state_diff_message(iden: int, event: Event) -> str:
+def cached_state_diff_message(
+    iden: int, event: Event, sequence: int | None = None
+) -> str:
     """Return an event message.
 
     Serialize to json once per message.
@@ -129,8 +131,14 @@ def cached_state_diff_message(iden: int, event: Event) -> str:
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+
+    The sequence of the change is added to the event for
+    resumable subscriptions.
     """
-    return f'{_partial_cached_state_diff_message(event)[:-1]},"id":{iden}}}'
+    partial_message = _partial_cached_state_diff_message(event)
+    if sequence is None or partial_message is INVALID_JSON_PARTIAL_MESSAGE:
+        return f'{partial_message[:-1]},"id":{iden}}}'
+    return f'{partial_message[:-2]},"s":{sequence}}},"id":{iden}}}'
 
 
 @lru_cache(maxsize=128)
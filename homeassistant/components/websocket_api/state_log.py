@@ -0,0 +1,68 @@
+"""Log of recent state changes to resume entity subscriptions."""
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Final
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ulid import ulid_now
+
+DATA_STATE_CHANGE_LOG: Final = "websocket_api.state_change_log"
+
+# Number of state changes kept to resume subscriptions, clients which
+# missed more changes than this get a full snapshot again
+STATE_CHANGE_LOG_SIZE: Final = 4096
+
+
+class StateChangeLog:
+    """Bounded log of the entities of state changes, numbered in order.
+
+    The log id changes on every start, sequences of an earlier run
+    can't be resumed.
+    """
+
+    def __init__(self, maxlen: int = STATE_CHANGE_LOG_SIZE) -> None:
+        """Initialize the log."""
+        self.log_id = ulid_now()
+        self.sequence = 0
+        self._last_event: Event | None = None
+        self._changes: deque[tuple[int, str]] = deque(maxlen=maxlen)
+
+    @callback
+    def async_add(self, event: Event) -> None:
+        """Add a state changed event to the log."""
+        if event is self._last_event:
+            return
+        self._last_event = event
+        self.sequence += 1
+        self._changes.append((self.sequence, event.data["entity_id"]))
+
+    @callback
+    def async_sequence(self, event: Event) -> int:
+        """Return the sequence of a state changed event."""
+        self.async_add(event)
+        return self.sequence
+
+    @callback
+    def async_entity_ids_since(self, log_id: str, sequence: int) -> list[str] | None:
+        """Return the entities changed after a sequence.
+
+        Returns None if the changes are not all logged.
+        """
+        oldest = self._changes[0][0] - 1 if self._changes else self.sequence
+        if log_id != self.log_id or not oldest <= sequence <= self.sequence:
+            return None
+        return [
+            entity_id for _, entity_id in islice(self._changes, sequence - oldest, None)
+        ]
+
+
+@callback
+def async_get_state_change_log(hass: HomeAssistant) -> StateChangeLog:
+    """Return the state change log, starting it on first use."""
+    if (log := hass.data.get(DATA_STATE_CHANGE_LOG)) is None:
+        log = hass.data[DATA_STATE_CHANGE_LOG] = StateChangeLog()
+        hass.bus.async_listen(EVENT_STATE_CHANGED, log.async_add, run_immediately=True)
+    return log
@@ -363,7 +363,7 @@ class ConfigEntry:
             )
 
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as err:
             _LOGGER.error(
                 "Error importing integration %s to set up %s configuration entry: %s",
@@ -379,7 +379,7 @@ class ConfigEntry:
 
         if self.domain == integration.domain:
             try:
-                integration.get_platform("config_flow")
+                await integration.async_get_platform("config_flow")
             except ImportError as err:
                 _LOGGER.error(
                     (
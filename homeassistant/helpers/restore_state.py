@@ -4,18 +4,24 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Self, cast
+import os
+import struct
+import tempfile
+from typing import Any, NamedTuple, Self, cast
+
+import orjson
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .storage import Store
 
 DATA_RESTORE_STATE = "restore_state"
@@ -31,6 +37,19 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# The snapshot of the stored states written on a clean shutdown.
+#
+# Layout: header, entity ids joined by newlines, one fixed size index entry
+# per entity id (last seen timestamp, offset and length of its JSON encoded
+# stored state) and the encoded stored states. The header records the
+# modification time and size of the JSON store written at the same time,
+# any other write to the store makes the snapshot stale.
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_MAGIC = b"HARS"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<4sIqqII")
+_SNAPSHOT_INDEX_ENTRY = struct.Struct("<dII")
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -93,6 +112,163 @@ class StoredState:
         )
 
 
+class _SnapshotEntry(NamedTuple):
+    """Location of an encoded stored state in a snapshot."""
+
+    last_seen: float
+    offset: int
+    length: int
+
+
+class _EncodedStoredState(NamedTuple):
+    """JSON encoded stored state carried over from a snapshot."""
+
+    entity_id: str
+    last_seen: float
+    data: bytes
+
+
+def _store_signature(store_path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of the JSON store."""
+    try:
+        stat = os.stat(store_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _write_snapshot(
+    snapshot_path: str,
+    store_path: str,
+    stored_states: list[dict[str, Any]],
+    encoded_states: list[_EncodedStoredState],
+) -> None:
+    """Write the snapshot of the stored states just saved to the JSON store."""
+    if (signature := _store_signature(store_path)) is None:
+        return
+    entity_ids: list[str] = []
+    index = bytearray()
+    blobs = bytearray()
+    for item in stored_states:
+        blob = json_bytes(item)
+        entity_ids.append(item["state"]["entity_id"])
+        index += _SNAPSHOT_INDEX_ENTRY.pack(
+            item["last_seen"].timestamp(), len(blobs), len(blob)
+        )
+        blobs += blob
+    for entity_id, last_seen, blob in encoded_states:
+        entity_ids.append(entity_id)
+        index += _SNAPSHOT_INDEX_ENTRY.pack(last_seen, len(blobs), len(blob))
+        blobs += blob
+    ids = "\n".join(entity_ids).encode()
+    header = _SNAPSHOT_HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, *signature, len(entity_ids), len(ids)
+    )
+    tmp_path = ""
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(snapshot_path), delete=False
+        ) as fdesc:
+            tmp_path = fdesc.name
+            fdesc.write(header)
+            fdesc.write(ids)
+            fdesc.write(index)
+            fdesc.write(blobs)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as err:
+        _LOGGER.error("Error saving last states snapshot: %s", err)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class RestoreStateSnapshot:
+    """Stored states read from a snapshot, decoded when first requested."""
+
+    def __init__(self, data: bytes, blobs_start: int, index: dict[str, _SnapshotEntry]):
+        """Initialize the snapshot."""
+        self._data = memoryview(data)
+        self._blobs_start = blobs_start
+        self.index = index
+
+    @classmethod
+    def read(cls, snapshot_path: str, store_path: str) -> Self | None:
+        """Read the snapshot if it matches the JSON store."""
+        try:
+            with open(snapshot_path, "rb") as fdesc:
+                data = fdesc.read()
+        except OSError:
+            return None
+        try:
+            (
+                magic,
+                version,
+                mtime_ns,
+                size,
+                count,
+                ids_length,
+            ) = _SNAPSHOT_HEADER.unpack_from(data)
+        except struct.error:
+            return None
+        if (
+            magic != SNAPSHOT_MAGIC
+            or version != SNAPSHOT_VERSION
+            or _store_signature(store_path) != (mtime_ns, size)
+        ):
+            return None
+        ids_start = _SNAPSHOT_HEADER.size
+        index_start = ids_start + ids_length
+        blobs_start = index_start + count * _SNAPSHOT_INDEX_ENTRY.size
+        if not count or len(data) < blobs_start:
+            return None
+        entity_ids = data[ids_start:index_start].decode().split("\n")
+        entries = map(
+            _SnapshotEntry._make,
+            _SNAPSHOT_INDEX_ENTRY.iter_unpack(data[index_start:blobs_start]),
+        )
+        return cls(
+            data,
+            blobs_start,
+            {
+                entity_id: entry
+                for entity_id, entry in zip(entity_ids, entries)
+                if valid_entity_id(entity_id)
+            },
+        )
+
+    def pop(self, entity_id: str) -> StoredState | None:
+        """Decode the stored state of an entity and drop it from the snapshot."""
+        if (entry := self.index.pop(entity_id, None)) is None:
+            return None
+        return StoredState.from_dict(
+            cast(dict[str, Any], json_loads(self._encoded(entry)))
+        )
+
+    def encoded_stored_states(
+        self, exclude_entity_ids: set[str], expiration_ts: float
+    ) -> list[_EncodedStoredState]:
+        """Return the stored states which have not expired, without decoding them."""
+        return [
+            _EncodedStoredState(entity_id, entry.last_seen, bytes(self._encoded(entry)))
+            for entity_id, entry in self.index.items()
+            if entity_id not in exclude_entity_ids and entry.last_seen >= expiration_ts
+        ]
+
+    def _encoded(self, entry: _SnapshotEntry) -> memoryview:
+        """Return the JSON encoded stored state of an index entry."""
+        start = self._blobs_start + entry.offset
+        return self._data[start : start + entry.length]
+
+
+@callback
+def _async_current_entity_ids(all_states: list[State]) -> set[str]:
+    """Return the ids of the entities currently backed by an entity object."""
+    return {
+        state.entity_id
+        for state in all_states
+        if not state.attributes.get(ATTR_RESTORED)
+    }
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     restore_state = RestoreStateData(hass)
@@ -136,8 +312,14 @@ class RestoreStateData:
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
+        self.snapshot: RestoreStateSnapshot | None = None
         self.entities: dict[str, RestoreEntity] = {}
 
+    @property
+    def snapshot_path(self) -> str:
+        """Return the path of the snapshot written on shutdown."""
+        return f"{self.store.path}{SNAPSHOT_SUFFIX}"
+
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
         await self.async_load()
@@ -149,7 +331,21 @@ class RestoreStateData:
         start.async_at_start(self.hass, hass_start)
 
     async def async_load(self) -> None:
-        """Load the instance of this data helper."""
+        """Load the instance of this data helper.
+
+        The snapshot written on the last clean shutdown is preferred, the
+        stored states in it are only decoded when they are requested.
+        """
+        self.snapshot = await self.hass.async_add_executor_job(
+            RestoreStateSnapshot.read, self.snapshot_path, self.store.path
+        )
+        if self.snapshot is not None:
+            _LOGGER.debug(
+                "Created cache from snapshot with %s", list(self.snapshot.index)
+            )
+            self.last_states = {}
+            return
+
         try:
             stored_states = await self.store.async_load()
         except HomeAssistantError as exc:
@@ -167,6 +363,19 @@ class RestoreStateData:
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+    @callback
+    def async_get_last_stored_state(self, entity_id: str) -> StoredState | None:
+        """Get the stored state of an entity from the previous run."""
+        if (stored_state := self.last_states.get(entity_id)) is not None:
+            return stored_state
+        if (
+            self.snapshot is None
+            or (stored_state := self.snapshot.pop(entity_id)) is None
+        ):
+            return None
+        self.last_states[entity_id] = stored_state
+        return stored_state
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -174,15 +383,14 @@ class RestoreStateData:
         This includes the states of all registered entities, as well as the
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
+
+        Stored states of the snapshot which were not requested are not
+        included, they are carried over by async_dump_states as they are.
         """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
-        current_entity_ids = {
-            state.entity_id
-            for state in all_states
-            if not state.attributes.get(ATTR_RESTORED)
-        }
+        current_entity_ids = _async_current_entity_ids(all_states)
 
         # Start with the currently registered states
         stored_states = [
@@ -212,18 +420,50 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    @callback
+    def _async_get_encoded_snapshot_states(self) -> list[_EncodedStoredState]:
+        """Get the stored states of the snapshot which should be stored.
+
+        These are the states which were not requested, have not been
+        created as entities on this run, and have not expired.
+        """
+        if self.snapshot is None:
+            return []
+        expiration_time = dt_util.utcnow() - STATE_EXPIRATION
+        return self.snapshot.encoded_stored_states(
+            _async_current_entity_ids(self.hass.states.async_all()),
+            expiration_time.timestamp(),
+        )
+
+    async def async_dump_states(self, write_snapshot: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        When write_snapshot is set, a snapshot for a fast start of the next
+        run is written as well.
+        """
         _LOGGER.debug("Dumping states")
+        stored_states = [
+            stored_state.as_dict() for stored_state in self.async_get_stored_states()
+        ]
+        encoded_states = self._async_get_encoded_snapshot_states()
+        # The stored states of the snapshot are written as they were encoded
+        data: list[Any] = [
+            *stored_states,
+            *(orjson.Fragment(encoded.data) for encoded in encoded_states),
+        ]
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(data)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+        if write_snapshot:
+            await self.hass.async_add_executor_job(
+                _write_snapshot,
+                self.snapshot_path,
+                self.store.path,
+                stored_states,
+                encoded_states,
+            )
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -247,7 +487,7 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_states(write_snapshot=True)
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -276,6 +516,8 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
+            if self.snapshot is not None:
+                self.snapshot.index.pop(entity_id, None)
 
         self.entities.pop(entity_id)
 
@@ -330,7 +572,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_last_stored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
@@ -0,0 +1,286 @@
+"""Shared in-memory time series of numeric entity states."""
+from __future__ import annotations
+
+from array import array
+import asyncio
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import math
+
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
+from homeassistant.util import dt as dt_util
+
+from .event import EventStateChangedData, async_track_state_change_event
+from .typing import EventType
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_SERIES = "state_series"
+
+StateSeriesListener = Callable[[State, bool], None]
+
+
+@dataclass(slots=True, frozen=True)
+class StateSeriesWindow:
+    """The most recent part of a state series a consumer needs.
+
+    A window without max_age and max_samples needs the whole series.
+    """
+
+    max_age: timedelta | None = None
+    max_samples: int | None = None
+
+
+@dataclass(slots=True)
+class _StateSeriesConsumer:
+    """A consumer attached to a state series."""
+
+    window: StateSeriesWindow
+    listener: StateSeriesListener
+
+
+class StateSeries:
+    """Time series of the numeric states of an entity or one of its attributes.
+
+    The samples are kept as compact arrays of timestamps and values which
+    are shared by all consumers of the same source. Samples are retained as
+    long as the widest window of any attached consumer needs them.
+
+    The series holds every sample of the source since complete_since, older
+    samples are loaded from the recorder when a window needs them.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str, attribute: str | None):
+        """Initialize the series."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.attribute = attribute
+        self.timestamps: array[float] = array("d")
+        self.values: array[float] = array("d")
+        self.last_state: State | None = None
+        self.is_binary = (
+            attribute is None and split_entity_id(entity_id)[0] == "binary_sensor"
+        )
+        self.complete_since = math.inf
+        self._consumers: list[_StateSeriesConsumer] = []
+        self._unsub_state_listener: CALLBACK_TYPE | None = None
+        self._warm_lock = asyncio.Lock()
+
+    def value_from_state(self, state: State) -> float | None:
+        """Return the numeric value of a state or None if it has none."""
+        raw = state.attributes.get(self.attribute) if self.attribute else state.state
+        if raw in (STATE_UNKNOWN, STATE_UNAVAILABLE, None, ""):
+            return None
+        if self.is_binary:
+            if raw == STATE_ON:
+                return 1.0
+            if raw == STATE_OFF:
+                return 0.0
+            return None
+        try:
+            return float(raw)  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            return None
+
+    @callback
+    def async_attach(
+        self, window: StateSeriesWindow, listener: StateSeriesListener
+    ) -> CALLBACK_TYPE:
+        """Attach a consumer to the series.
+
+        The listener is called with every new state of the source and
+        whether a sample was added for it.
+        """
+        consumer = _StateSeriesConsumer(window, listener)
+        self._consumers.append(consumer)
+        if self._unsub_state_listener is None:
+            # Samples kept while nothing listened to the source have gaps
+            del self.timestamps[:]
+            del self.values[:]
+            self.complete_since = dt_util.utcnow().timestamp()
+            self._unsub_state_listener = async_track_state_change_event(
+                self.hass, [self.entity_id], self._async_state_listener
+            )
+
+        @callback
+        def _async_detach() -> None:
+            self._consumers.remove(consumer)
+            if self._consumers:
+                return
+            if self._unsub_state_listener:
+                self._unsub_state_listener()
+                self._unsub_state_listener = None
+            self.hass.data[DATA_STATE_SERIES].pop(
+                (self.entity_id, self.attribute), None
+            )
+
+        return _async_detach
+
+    @callback
+    def _async_state_listener(self, event: EventType[EventStateChangedData]) -> None:
+        """Add a sample for the new state and notify the consumers."""
+        if (new_state := event.data["new_state"]) is None:
+            return
+        added = False
+        if (value := self.value_from_state(new_state)) is not None:
+            self.timestamps.append(new_state.last_updated.timestamp())
+            self.values.append(value)
+            self._async_prune()
+            added = True
+        self.last_state = new_state
+        for consumer in list(self._consumers):
+            consumer.listener(new_state, added)
+
+    def _start_index(self, window: StateSeriesWindow, now_ts: float) -> int:
+        """Return the index of the oldest sample within a window."""
+        start = 0
+        if window.max_samples is not None:
+            start = max(0, len(self.values) - window.max_samples)
+        if window.max_age is not None:
+            start = max(
+                start,
+                bisect_left(self.timestamps, now_ts - window.max_age.total_seconds()),
+            )
+        return start
+
+    @callback
+    def _async_prune(self) -> None:
+        """Drop the samples no consumer needs anymore."""
+        if not self._consumers:
+            return
+        now_ts = dt_util.utcnow().timestamp()
+        if start := min(
+            self._start_index(consumer.window, now_ts) for consumer in self._consumers
+        ):
+            self.complete_since = max(
+                self.complete_since,
+                math.nextafter(self.timestamps[start - 1], math.inf),
+            )
+            del self.timestamps[:start]
+            del self.values[:start]
+
+    def _covers(self, window: StateSeriesWindow, now_ts: float) -> bool:
+        """Return if the series holds all samples of a window."""
+        if window.max_samples is not None and len(self.values) >= window.max_samples:
+            return True
+        if window.max_age is None:
+            return self.complete_since == -math.inf
+        return self.complete_since <= now_ts - window.max_age.total_seconds()
+
+    @callback
+    def async_get_window(
+        self, window: StateSeriesWindow
+    ) -> tuple[array[float], array[float]]:
+        """Return the timestamps and values within a window, oldest first."""
+        self._async_prune()
+        start = self._start_index(window, dt_util.utcnow().timestamp())
+        return self.timestamps[start:], self.values[start:]
+
+    async def async_warm(self, window: StateSeriesWindow) -> None:
+        """Load the samples of a window from the recorder.
+
+        Consumers are warmed one at a time, the recorder is not queried
+        when the samples loaded for an earlier window already hold the window.
+        """
+        async with self._warm_lock:
+            if not self._covers(window, dt_util.utcnow().timestamp()):
+                await self._async_warm(window)
+
+    async def _async_warm(self, window: StateSeriesWindow) -> None:
+        """Load the samples of a window from the recorder."""
+        if "recorder" not in self.hass.config.components:
+            return
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.components.recorder import get_instance
+
+        start_time = datetime.fromtimestamp(0, tz=dt_util.UTC)
+        if window.max_age is not None:
+            start_time = dt_util.utcnow() - window.max_age - timedelta(microseconds=1)
+        limit = window.max_samples
+
+        _LOGGER.debug(
+            "%s: loading states since %s (limit %s) from the recorder",
+            self.entity_id,
+            start_time,
+            limit,
+        )
+        states = await get_instance(self.hass).async_add_executor_job(
+            self._fetch_states_from_database, start_time, limit
+        )
+        first_ts = self.timestamps[0] if self.timestamps else None
+        timestamps: array[float] = array("d")
+        values: array[float] = array("d")
+        for state in reversed(states):
+            timestamp = state.last_updated.timestamp()
+            if first_ts is not None and timestamp >= first_ts:
+                break
+            if (value := self.value_from_state(state)) is not None:
+                timestamps.append(timestamp)
+                values.append(value)
+        self.timestamps[:0] = timestamps
+        self.values[:0] = values
+        if limit is not None and len(states) >= limit:
+            # Older states than the last one returned were cut off
+            loaded_since = states[-1].last_updated.timestamp()
+        elif window.max_age is not None:
+            loaded_since = start_time.timestamp()
+        else:
+            loaded_since = -math.inf
+        self.complete_since = min(self.complete_since, loaded_since)
+        if self.last_state is None and states:
+            self.last_state = states[0]
+        self._async_prune()
+
+    def _fetch_states_from_database(
+        self, start_time: datetime, limit: int | None
+    ) -> list[State]:
+        """Fetch the states from the database, newest first."""
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.components.recorder import history
+
+        lower_entity_id = self.entity_id.lower()
+        # The samples of an attribute only need that attribute, the unit
+        # is kept for consumers deriving theirs from the last state
+        attribute_keys = (
+            [self.attribute, ATTR_UNIT_OF_MEASUREMENT] if self.attribute else None
+        )
+        return history.state_changes_during_period(
+            self.hass,
+            start_time,
+            entity_id=lower_entity_id,
+            descending=True,
+            limit=limit,
+            include_start_time_state=False,
+            attribute_keys=attribute_keys,
+        ).get(lower_entity_id, [])
+
+
+@callback
+def async_get_state_series(
+    hass: HomeAssistant, entity_id: str, attribute: str | None = None
+) -> StateSeries:
+    """Return the shared state series of an entity or one of its attributes."""
+    series_by_source: dict[tuple[str, str | None], StateSeries] = hass.data.setdefault(
+        DATA_STATE_SERIES, {}
+    )
+    if (series := series_by_source.get((entity_id, attribute))) is None:
+        series = series_by_source[(entity_id, attribute)] = StateSeries(
+            hass, entity_id, attribute
+        )
+    return series
@@ -14,6 +14,7 @@ import importlib
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -34,6 +35,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
+from .util.package import is_installed
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -48,6 +50,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIME = "import_time"
+# Integrations imported in the executor at the same time ahead of setup
+MAX_CONCURRENT_PREIMPORTS = 4
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,6 +66,8 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_BUNDLE_VERSION = 1
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -554,6 +561,16 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        if root_module.__name__ == PACKAGE_BUILTIN and (
+            manifest := _load_manifest_bundle().get(domain)
+        ):
+            return cls(
+                hass,
+                f"{PACKAGE_BUILTIN}.{domain}",
+                pathlib.Path(root_module.__path__[0]) / domain,
+                cast(Manifest, dict(manifest)),
+            )
+
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
@@ -640,6 +657,8 @@ class Integration:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
 
+        self._import_futures: dict[str, asyncio.Future[None]] = {}
+        self._running_imports: set[str] = set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @property
@@ -803,12 +822,96 @@ class Integration:
 
         return self._all_dependencies_resolved
 
+    async def async_import_in_executor(self, platform_names: Iterable[str]) -> None:
+        """Import the component and existing platforms in the executor.
+
+        The imported modules end up in sys.modules, so get_component and
+        get_platform only pick them up on the event loop. Import errors are
+        left for get_component and get_platform to report.
+        """
+        names = self._async_reserve_imports(platform_names)
+        try:
+            await self._async_import_reserved(names)
+        finally:
+            self._async_release_imports(names)
+
+    @callback
+    def _async_reserve_imports(self, platform_names: Iterable[str]) -> list[str]:
+        """Reserve the modules to import so setup waits for them."""
+        if self.domain in self.hass.data[DATA_COMPONENTS]:
+            return []
+        names = [
+            name
+            for name in (
+                self.pkg_path,
+                *(f"{self.pkg_path}.{platform}" for platform in platform_names),
+            )
+            if name not in sys.modules and name not in self._import_futures
+        ]
+        for name in names:
+            self._import_futures[name] = self.hass.loop.create_future()
+        return names
+
+    async def _async_import_reserved(self, names: list[str]) -> None:
+        """Import reserved modules in the executor.
+
+        Modules setup already took over while they were waiting to be
+        imported are skipped.
+        """
+        if not (names := [name for name in names if name in self._import_futures]):
+            return
+        self._running_imports.update(names)
+        try:
+            import_time = await self.hass.async_add_executor_job(
+                _import_modules, self.pkg_path, self.file_path, self.requirements, names
+            )
+        finally:
+            self._running_imports.difference_update(names)
+            self._async_release_imports(names)
+        self._add_import_time(import_time)
+
+    @callback
+    def _async_release_imports(self, names: list[str]) -> None:
+        """Release reserved modules so setup can continue."""
+        for name in names:
+            if future := self._import_futures.pop(name, None):
+                future.set_result(None)
+
+    async def _async_wait_for_import(self, name: str) -> None:
+        """Wait for a running executor import of a module.
+
+        A module which is still waiting for other imports to finish is
+        released, so it is imported right away instead.
+        """
+        if (future := self._import_futures.get(name)) is None:
+            return
+        if name in self._running_imports:
+            await future
+        else:
+            self._async_release_imports([name])
+
+    async def async_get_component(self) -> ComponentProtocol:
+        """Return the component once a running executor import is done."""
+        await self._async_wait_for_import(self.pkg_path)
+        return self.get_component()
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform once a running executor import is done."""
+        await self._async_wait_for_import(f"{self.pkg_path}.{platform_name}")
+        return self.get_platform(platform_name)
+
+    def _add_import_time(self, seconds: float) -> None:
+        """Add time spent importing modules of this integration."""
+        import_time: dict[str, float] = self.hass.data.setdefault(DATA_IMPORT_TIME, {})
+        import_time[self.domain] = import_time.get(self.domain, 0) + seconds
+
     def get_component(self) -> ComponentProtocol:
         """Return the component."""
         cache: dict[str, ComponentProtocol] = self.hass.data[DATA_COMPONENTS]
         if self.domain in cache:
             return cache[self.domain]
 
+        start = time.monotonic()
         try:
             cache[self.domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -820,6 +923,8 @@ class Integration:
                 "Unexpected exception importing component %s", self.pkg_path
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
+        finally:
+            self._add_import_time(time.monotonic() - start)
 
         return cache[self.domain]
 
@@ -830,6 +935,7 @@ class Integration:
         if full_name in cache:
             return cache[full_name]
 
+        start = time.monotonic()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ImportError:
@@ -843,6 +949,8 @@ class Integration:
             raise ImportError(
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
+        finally:
+            self._add_import_time(time.monotonic() - start)
 
         return cache[full_name]
 
@@ -855,6 +963,114 @@ class Integration:
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _import_modules(
+    pkg_path: str, file_path: pathlib.Path, requirements: list[str], names: list[str]
+) -> float:
+    """Import the modules of an integration and return the time it took.
+
+    Nothing is imported when requirements still have to be installed or
+    upgraded, that is done by setup before it imports the integration.
+    Platforms that do not exist are skipped.
+    """
+    start = time.monotonic()
+    if not all(is_installed(requirement) for requirement in requirements):
+        _LOGGER.debug("Not importing %s ahead of setup, requirements missing", pkg_path)
+        return 0
+    for name in names:
+        if name != pkg_path:
+            platform = name.rpartition(".")[2]
+            if not (
+                (file_path / f"{platform}.py").exists()
+                or (file_path / platform).is_dir()
+            ):
+                continue
+        try:
+            importlib.import_module(name)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to import %s ahead of setup", name, exc_info=True)
+    return time.monotonic() - start
+
+
+async def _async_preimport_integration(
+    integration: Integration,
+    names: list[str],
+    dependency_imports: list[asyncio.Task[None]],
+    semaphore: asyncio.Semaphore,
+) -> None:
+    """Import an integration once the imports of its dependencies are done."""
+    # pylint: disable=protected-access
+    try:
+        if dependency_imports:
+            await asyncio.wait(dependency_imports)
+        async with semaphore:
+            await integration._async_import_reserved(names)
+    finally:
+        integration._async_release_imports(names)
+
+
+async def async_preimport_integrations(
+    hass: HomeAssistant, platforms_by_integration: dict[Integration, set[str]]
+) -> None:
+    """Import integrations and their platforms in the executor ahead of setup.
+
+    The integrations must be ordered with dependencies first. An integration
+    is imported once the imports of its dependencies and after dependencies
+    are done, independent integrations are imported in parallel.
+
+    All modules are reserved first. Setting up an integration waits for the
+    import of its modules if it is running, modules still waiting for other
+    imports are imported by setup right away. Custom integrations are
+    imported on the event loop when they are set up.
+    """
+    # pylint: disable=protected-access
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PREIMPORTS)
+    imports: dict[str, asyncio.Task[None]] = {}
+    for integration, platform_names in platforms_by_integration.items():
+        if not integration.is_built_in:
+            continue
+        imports[integration.domain] = hass.async_create_background_task(
+            _async_preimport_integration(
+                integration,
+                integration._async_reserve_imports(platform_names),
+                [
+                    imports[domain]
+                    for domain in (
+                        *integration.dependencies,
+                        *integration.after_dependencies,
+                    )
+                    if domain in imports
+                ],
+                semaphore,
+            ),
+            f"preimport {integration.domain}",
+        )
+    if imports:
+        await asyncio.wait(imports.values())
+
+
+@ft.cache
+def _load_manifest_bundle() -> dict[str, Manifest]:
+    """Load the generated bundle of built-in integration manifests.
+
+    Built-in integrations missing from the bundle fall back to reading
+    their manifest.json.
+    """
+    bundle_path = pathlib.Path(generated.__path__[0]) / "manifests.json"
+    try:
+        bundle = cast(dict[str, Any], json_loads(bundle_path.read_bytes()))
+    except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+        _LOGGER.warning("Unable to load manifest bundle %s: %s", bundle_path, err)
+        return {}
+    if bundle.get("version") != MANIFEST_BUNDLE_VERSION:
+        _LOGGER.warning(
+            "Ignoring manifest bundle %s with version %s",
+            bundle_path,
+            bundle.get("version"),
+        )
+        return {}
+    return cast(dict[str, Manifest], bundle["manifests"])
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: list[str]
 ) -> dict[str, Integration]:
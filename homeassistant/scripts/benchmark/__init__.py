@@ -6,19 +6,29 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import secrets
+import tempfile
 from timeit import default_timer as timer
 from typing import TypeVar
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import auth, config_entries, core, loader
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    recorder,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -292,6 +302,125 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def validate_access_tokens(hass):
+    """Validate 100k access tokens of 30 clients with 1000 refresh tokens."""
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    access_tokens = []
+    for user_index in range(100):
+        user = await manager.async_create_system_user(f"Benchmark {user_index}")
+        for _ in range(10):
+            refresh_token = await manager.async_create_refresh_token(user)
+            if len(access_tokens) < 30:
+                access_tokens.append(manager.async_create_access_token(refresh_token))
+
+    start = timer()
+
+    for index in range(10**5):
+        assert await manager.async_validate_access_token(
+            access_tokens[index % len(access_tokens)]
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def mobile_app_sensor_updates(hass):
+    """Decrypt and validate 10k sensor update webhooks of 6 phones."""
+    # pylint: disable=import-outside-toplevel
+    from nacl.encoding import Base64Encoder, HexEncoder
+    from nacl.secret import SecretBox
+
+    from homeassistant.components.mobile_app.helpers import decrypt_payload
+    from homeassistant.components.mobile_app.webhook import validate_sensor_update
+
+    payloads = []
+    for device_index in range(6):
+        key = secrets.token_hex(SecretBox.KEY_SIZE)
+        sensors = [
+            {
+                "attributes": {"source": f"sensor {sensor_index}"},
+                "icon": "mdi:battery",
+                "state": sensor_index * device_index,
+                "type": "sensor",
+                "unique_id": f"sensor_{sensor_index}",
+            }
+            for sensor_index in range(25)
+        ]
+        ciphertext = SecretBox(key, encoder=HexEncoder).encrypt(
+            JSON_DUMP(sensors).encode("utf-8"), encoder=Base64Encoder
+        )
+        payloads.append((key, ciphertext))
+
+    start = timer()
+
+    for index in range(10**4):
+        key, ciphertext = payloads[index % len(payloads)]
+        for sensor in decrypt_payload(key, ciphertext):
+            validate_sensor_update(sensor)
+
+    return timer() - start
+
+
+@benchmark
+async def compile_sensor_statistics(hass):
+    """Compile 5-minute statistics of 1k, 5k and 10k recorded sensors."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.setup import async_setup_component
+
+    loader.async_setup(hass)
+    entity.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    recorder.async_initialize_recorder(hass)
+    db_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, lambda _: db_dir.cleanup())
+    await async_setup_component(
+        hass,
+        "recorder",
+        {"recorder": {"db_url": f"sqlite:///{db_dir.name}/benchmark.db"}},
+    )
+    await hass.async_start()
+    instance = get_instance(hass)
+    runtime = 0.0
+
+    def _compile(start, end):
+        with session_scope(hass=hass, read_only=True) as session:
+            return sensor_recorder.compile_statistics(hass, session, start, end)
+
+    for count in (1000, 5000, 10000):
+        start = dt_util.utcnow()
+        for change in range(12):
+            for index in range(count):
+                hass.states.async_set(
+                    f"sensor.temperature_{index}",
+                    str(20 + (index + change) % 7 / 3),
+                    {
+                        "device_class": "temperature",
+                        "friendly_name": f"Temperature {index}",
+                        "state_class": "measurement",
+                        "unit_of_measurement": "°F" if change % 5 == 0 else "°C",
+                    },
+                )
+            await instance.async_block_till_done()
+        end = dt_util.utcnow() + timedelta(seconds=1)
+
+        begin = timer()
+        await instance.async_add_executor_job(_compile, start, end)
+        duration = timer() - begin
+        print(f"{count} sensors compiled in {duration}s")
+        runtime += duration
+
+        for index in range(count):
+            hass.states.async_remove(f"sensor.temperature_{index}")
+
+    return runtime
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
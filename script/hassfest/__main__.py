@@ -19,6 +19,7 @@ from . import (
     docker,
     json,
     manifest,
+    manifest_bundle,
     metadata,
     mqtt,
     mypy_config,
@@ -40,6 +41,7 @@ INTEGRATION_PLUGINS = [
     dhcp,
     json,
     manifest,
+    manifest_bundle,
     mqtt,
     requirements,
     services,
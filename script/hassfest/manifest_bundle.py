@@ -0,0 +1,45 @@
+"""Generate the bundle of all built-in integration manifests."""
+from __future__ import annotations
+
+import json
+
+from homeassistant.loader import MANIFEST_BUNDLE_VERSION
+
+from .model import Config, Integration
+
+
+def _generate_and_validate(integrations: dict[str, Integration]) -> str:
+    """Validate and generate the manifest bundle."""
+    manifests = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest_path is not None
+    }
+    return json.dumps(
+        {"version": MANIFEST_BUNDLE_VERSION, "manifests": manifests}, indent=2
+    )
+
+
+def validate(integrations: dict[str, Integration], config: Config) -> None:
+    """Validate the manifest bundle."""
+    bundle_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifest_bundle"] = content = _generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    if (
+        not bundle_path.is_file()
+        or bundle_path.read_text(encoding="utf-8") != content + "\n"
+    ):
+        config.add_error(
+            "manifest_bundle",
+            "File manifests.json is not up to date. Run python3 -m script.hassfest",
+            fixable=True,
+        )
+
+
+def generate(integrations: dict[str, Integration], config: Config) -> None:
+    """Generate the manifest bundle."""
+    bundle_path = config.root / "homeassistant/generated/manifests.json"
+    bundle_path.write_text(f"{config.cache['manifest_bundle']}\n", encoding="utf-8")
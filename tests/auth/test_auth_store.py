@@ -258,3 +258,44 @@ async def test_loading_race_condition(hass: HomeAssistant) -> None:
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_refresh_token_indexes(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test refresh tokens are found by id and token after changes and loading."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Test User")
+    refresh_token = await store.async_create_refresh_token(user, "client")
+    other_token = await store.async_create_refresh_token(user, "other")
+
+    assert await store.async_get_refresh_token(refresh_token.id) is refresh_token
+    assert (
+        await store.async_get_refresh_token_by_token(refresh_token.token)
+        is refresh_token
+    )
+    assert await store.async_get_refresh_token_by_token("invalid") is None
+
+    await store.async_remove_refresh_token(refresh_token)
+    assert await store.async_get_refresh_token(refresh_token.id) is None
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is None
+    assert refresh_token.id not in user.refresh_tokens
+
+    hass_storage[auth_store.STORAGE_KEY] = {
+        "version": 1,
+        "data": store._data_to_save(),
+    }
+    loaded_store = auth_store.AuthStore(hass)
+    loaded_token = await loaded_store.async_get_refresh_token(other_token.id)
+    assert loaded_token is not None
+    assert loaded_token.token == other_token.token
+    assert (
+        await loaded_store.async_get_refresh_token_by_token(other_token.token)
+        is loaded_token
+    )
+
+    await loaded_store.async_remove_user(loaded_token.user)
+    assert await loaded_store.async_get_refresh_token(other_token.id) is None
+    assert (
+        await loaded_store.async_get_refresh_token_by_token(other_token.token) is None
+    )
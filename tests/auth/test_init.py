@@ -630,6 +630,38 @@ async def test_create_access_token(mock_hass) -> None:
     )
 
 
+async def test_verified_access_tokens_cached(mock_hass) -> None:
+    """Test verified access tokens are cached until revoked or expired."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=auth.jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+        assert mock_verify.call_count == 1
+
+        with freeze_time(
+            dt_util.utcnow() + timedelta(seconds=auth.ACCESS_TOKEN_CACHE_TIME + 1)
+        ):
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+        assert mock_verify.call_count == 2
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_create_long_lived_access_token(mock_hass) -> None:
     """Test refresh_token's jwt_key changed for long-lived access token."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
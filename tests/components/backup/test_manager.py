@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import tarfile
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -268,3 +270,83 @@ async def test_exception_plaform_post(hass: HomeAssistant) -> None:
 
     with pytest.raises(HomeAssistantError):
         await _mock_backup_generation(manager)
+
+
+async def test_snapshot_platform(hass: HomeAssistant) -> None:
+    """Test a platform snapshot releases the platform before archiving."""
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+    calls: list[str] = []
+
+    async def _mock_pre(hass: HomeAssistant) -> None:
+        calls.append("pre")
+
+    async def _mock_post(hass: HomeAssistant) -> None:
+        calls.append("post")
+
+    async def _mock_snapshot(
+        hass: HomeAssistant, snapshot_dir: Path
+    ) -> dict[str, Path]:
+        calls.append("snapshot")
+        return {"test.db": snapshot_dir / "test.db"}
+
+    def _mock_generate(*args: Any) -> int:
+        calls.append("archive")
+        return 0
+
+    await _setup_mock_domain(
+        hass,
+        Mock(
+            async_pre_backup=_mock_pre,
+            async_post_backup=_mock_post,
+            async_snapshot_backup=_mock_snapshot,
+        ),
+    )
+
+    with patch("pathlib.Path.mkdir") as mock_mkdir, patch(
+        "homeassistant.components.backup.manager.shutil.rmtree"
+    ) as mock_rmtree, patch.object(
+        manager, "_mkdir_and_generate_backup_contents", side_effect=_mock_generate
+    ) as mock_generate:
+        backup = await manager.generate_backup()
+
+    assert calls == ["pre", "snapshot", "post", "archive"]
+    snapshot_dir = manager.backup_dir / f"{backup.slug}.snapshot"
+    assert mock_mkdir.called
+    assert mock_generate.call_args[0][2] == {"test.db": snapshot_dir / "test.db"}
+    assert mock_rmtree.call_args[0][0] == snapshot_dir
+
+
+async def test_generate_backup_contents_with_snapshot(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test snapshots replace the original files and their journals."""
+    hass.config.config_dir = tmp_path.as_posix()
+    manager = BackupManager(hass)
+    tmp_path.joinpath("test.txt").write_text("text")
+    tmp_path.joinpath("test.db").write_text("live")
+    tmp_path.joinpath("test.db-wal").write_text("wal")
+    snapshot_dir = manager.backup_dir / "abc123.snapshot"
+    snapshot_dir.mkdir(parents=True)
+    snapshot_dir.joinpath("test.db").write_text("snapshot")
+    tar_file_path = manager.backup_dir / "abc123.tar"
+
+    await hass.async_add_executor_job(
+        manager._mkdir_and_generate_backup_contents,
+        tar_file_path,
+        {"slug": "abc123"},
+        {"test.db": snapshot_dir / "test.db"},
+    )
+
+    with tarfile.open(tar_file_path) as outer_tar:
+        inner = outer_tar.extractfile("./homeassistant.tar.gz")
+        assert inner is not None
+        with tarfile.open(fileobj=inner, mode="r:gz") as core_tar:
+            names = core_tar.getnames()
+            db_file = core_tar.extractfile("data/test.db")
+            assert db_file is not None
+            assert db_file.read() == b"snapshot"
+    assert "data/test.txt" in names
+    assert "data/test.db-wal" not in names
+    assert not any("snapshot" in name for name in names)
+    assert names.count("data/test.db") == 1
@@ -1,14 +1,19 @@
 """The tests for the camera component."""
 import asyncio
+from datetime import timedelta
 from http import HTTPStatus
 import io
 from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import (
+    DEFAULT_IMAGE_CACHE_TTL,
     DOMAIN,
+    MAX_IMAGE_CACHE_TTL,
+    PREF_IMAGE_CACHE_TTL,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
 )
@@ -971,3 +976,145 @@ async def test_use_stream_for_stills(
         mock_stream.async_get_image.assert_called_once()
         assert resp.status == HTTPStatus.OK
         assert await resp.read() == b"stream_keyframe_image"
+
+
+async def test_camera_proxy_image_cache(
+    hass: HomeAssistant,
+    mock_camera,
+    hass_client: ClientSessionGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test requests share a snapshot for the ttl and sizes are scaled from it."""
+    client = await hass_client()
+    fetching = asyncio.Event()
+    release = asyncio.Event()
+    turbo_jpeg = mock_turbo_jpeg(first_width=16, first_height=12)
+
+    async def _camera_image(width=None, height=None):
+        fetching.set()
+        await release.wait()
+        return b"Valid jpeg"
+
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+        return_value=turbo_jpeg,
+    ), patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ) as mock_camera_image:
+        requests = [
+            hass.async_create_task(client.get("/api/camera_proxy/camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await fetching.wait()
+        release.set()
+        for response in await asyncio.gather(*requests):
+            assert response.status == HTTPStatus.OK
+            assert await response.read() == b"Valid jpeg"
+        assert mock_camera_image.call_count == 1
+
+        # Sizes are scaled from the full size snapshot
+        for _ in range(2):
+            response = await client.get(
+                "/api/camera_proxy/camera.demo_camera?width=4&height=3"
+            )
+            assert response.status == HTTPStatus.OK
+            assert await response.read() == EMPTY_8_6_JPEG
+        assert mock_camera_image.call_count == 1
+        assert turbo_jpeg.scale_with_quality.call_count == 1
+        mock_camera_image.assert_called_once_with(width=None, height=None)
+
+        freezer.tick(timedelta(seconds=DEFAULT_IMAGE_CACHE_TTL))
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert response.status == HTTPStatus.OK
+        assert mock_camera_image.call_count == 2
+
+
+async def test_camera_proxy_image_cache_ttl_prefs(
+    hass: HomeAssistant,
+    mock_camera,
+    hass_client: ClientSessionGenerator,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test the image cache ttl can be set in the camera preferences."""
+    client = await hass_client()
+    ws_client = await hass_ws_client(hass)
+    await ws_client.send_json(
+        {"id": 7, "type": "camera/get_prefs", "entity_id": "camera.demo_camera"}
+    )
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_IMAGE_CACHE_TTL] is None
+
+    await ws_client.send_json(
+        {
+            "id": 8,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            PREF_IMAGE_CACHE_TTL: MAX_IMAGE_CACHE_TTL + 1,
+        }
+    )
+    msg = await ws_client.receive_json()
+    assert not msg["success"]
+
+    await ws_client.send_json(
+        {
+            "id": 9,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            PREF_IMAGE_CACHE_TTL: 0,
+        }
+    )
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert msg["result"][PREF_IMAGE_CACHE_TTL] == 0
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        for _ in range(2):
+            response = await client.get("/api/camera_proxy/camera.demo_camera")
+            assert response.status == HTTPStatus.OK
+        assert mock_camera_image.call_count == 2
+
+        # Clearing the preference restores the default of the camera
+        await ws_client.send_json(
+            {
+                "id": 10,
+                "type": "camera/update_prefs",
+                "entity_id": "camera.demo_camera",
+                PREF_IMAGE_CACHE_TTL: None,
+            }
+        )
+        msg = await ws_client.receive_json()
+        assert msg["success"]
+        assert msg["result"][PREF_IMAGE_CACHE_TTL] is None
+        for _ in range(2):
+            response = await client.get("/api/camera_proxy/camera.demo_camera")
+            assert response.status == HTTPStatus.OK
+        assert mock_camera_image.call_count == 3
+
+
+async def test_camera_proxy_snapshot_from_running_stream(
+    hass: HomeAssistant,
+    mock_camera,
+    mock_stream,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test snapshots are decoded from the keyframes of a running stream."""
+    stream = Mock()
+    stream.outputs.return_value = {"hls": Mock()}
+    stream.async_get_image = AsyncMock(return_value=EMPTY_8_6_JPEG)
+    camera._get_camera_from_entity_id(hass, "camera.demo_camera").stream = stream
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+    ) as mock_camera_image:
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+
+    assert response.status == HTTPStatus.OK
+    assert response.content_type == "image/jpeg"
+    assert await response.read() == EMPTY_8_6_JPEG
+    stream.async_get_image.assert_called_once_with()
+    assert not mock_camera_image.called
@@ -1319,10 +1319,11 @@ async def test_measure_from_end_going_backwards(
         async_fire_time_changed(hass, past_next_update)
         await hass.async_block_till_done()
 
-    assert hass.states.get("sensor.sensor1").state == "0.83"
-    assert hass.states.get("sensor.sensor2").state == "0.833333333333333"
-    assert hass.states.get("sensor.sensor3").state == "2"
-    assert hass.states.get("sensor.sensor4").state == "83.3"
+    # The state change at t2 is after the end of the moved period
+    assert hass.states.get("sensor.sensor1").state == "1.0"
+    assert hass.states.get("sensor.sensor2").state == "1.0"
+    assert hass.states.get("sensor.sensor3").state == "1"
+    assert hass.states.get("sensor.sensor4").state == "100.0"
 
 
 async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None:
@@ -1688,3 +1689,85 @@ async def test_unique_id(
         entity_registry.async_get("sensor.test").unique_id
         == "some_history_stats_unique_id"
     )
+
+
+async def test_sliding_periods_share_history(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sliding periods of the same entity are updated from a shared history."""
+    start_time = dt_util.utcnow()
+    history = [
+        ("off", start_time - timedelta(minutes=180)),
+        ("on", start_time - timedelta(minutes=90)),
+        ("off", start_time - timedelta(minutes=30)),
+        ("on", start_time - timedelta(minutes=10)),
+    ]
+    query_starts = []
+
+    def _fake_states(hass, period_start, period_end=None, entity_id=None, **kwargs):
+        query_starts.append(period_start)
+        states = []
+        for state, last_changed in history:
+            if last_changed <= period_start:
+                states = [ha.State(entity_id, state, last_changed=period_start)]
+            elif period_end is None or last_changed <= period_end:
+                states.append(ha.State(entity_id, state, last_changed=last_changed))
+        return {entity_id: states}
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        _fake_states,
+    ):
+        with freeze_time(start_time):
+            await async_setup_component(
+                hass,
+                "sensor",
+                {
+                    "sensor": [
+                        {
+                            "platform": "history_stats",
+                            "entity_id": "binary_sensor.state",
+                            "name": "sensor1",
+                            "state": "on",
+                            "duration": {"hours": 1},
+                            "end": "{{ utcnow() }}",
+                            "type": "time",
+                        },
+                        {
+                            "platform": "history_stats",
+                            "entity_id": "binary_sensor.state",
+                            "name": "sensor2",
+                            "state": "on",
+                            "duration": {"hours": 2},
+                            "end": "{{ utcnow() }}",
+                            "type": "time",
+                        },
+                    ]
+                },
+            )
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.67"
+        assert hass.states.get("sensor.sensor2").state == "1.17"
+
+        five_minutes_in = start_time + timedelta(minutes=5)
+        with freeze_time(five_minutes_in):
+            async_fire_time_changed(hass, five_minutes_in)
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "0.67"
+        assert hass.states.get("sensor.sensor2").state == "1.25"
+        query_count = len(query_starts)
+
+        with freeze_time(five_minutes_in):
+            hass.states.async_set("binary_sensor.state", "off")
+            await hass.async_block_till_done()
+
+        ten_minutes_in = start_time + timedelta(minutes=10)
+        with freeze_time(ten_minutes_in):
+            async_fire_time_changed(hass, ten_minutes_in)
+            await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "0.58"
+    assert hass.states.get("sensor.sensor2").state == "1.25"
+    assert len(query_starts) == query_count
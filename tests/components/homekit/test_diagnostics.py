@@ -138,6 +138,7 @@ async def test_config_entry_running(
             "version": 1,
         },
         "config_version": 2,
+        "connections": {},
         "pairing_id": ANY,
         "status": 1,
     }
@@ -149,6 +150,46 @@ async def test_config_entry_running(
         await hass.async_block_till_done()
 
 
+async def test_config_entry_connections(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hk_driver,
+    mock_async_zeroconf: None,
+) -> None:
+    """Test generating diagnostics with events queued on a connection."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_NAME: "mock_name", CONF_PORT: 12345}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    driver = hass.data[DOMAIN][entry.entry_id].homekit.driver
+    idle = MagicMock(_event_queue={}, _event_timer=None)
+    busy = MagicMock(
+        _event_queue={(1, 9): {}, (1, 10): {}},
+        _event_timer=MagicMock(when=MagicMock(return_value=hass.loop.time() + 60)),
+    )
+    driver.http_server.connections = {
+        ("192.168.1.2", 50000): idle,
+        ("192.168.1.3", 50001): busy,
+    }
+    diag = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    assert diag["connections"] == {
+        "('192.168.1.2', 50000)": {"next_flush": None, "queued_events": 0},
+        "('192.168.1.3', 50001)": {"next_flush": ANY, "queued_events": 2},
+    }
+    assert 0 < diag["connections"]["('192.168.1.3', 50001)"]["next_flush"] <= 60
+
+    driver.http_server.connections = {}
+    with patch("pyhap.accessory_driver.AccessoryDriver.async_start"), patch(
+        "homeassistant.components.homekit.HomeKit.async_stop"
+    ), patch("homeassistant.components.homekit.async_port_is_available"):
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
 async def test_config_entry_accessory(
     hass: HomeAssistant,
     hass_client: ClientSessionGenerator,
@@ -284,6 +325,7 @@ async def test_config_entry_accessory(
             "version": 1,
         },
         "config_version": 2,
+        "connections": {},
         "pairing_id": ANY,
         "iid_storage": {
             "1": {
@@ -617,6 +659,7 @@ async def test_config_entry_with_trigger_accessory(
             "version": 1,
         },
         "config_version": 2,
+        "connections": {},
         "pairing_id": ANY,
         "status": 1,
     }
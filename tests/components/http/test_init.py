@@ -7,12 +7,14 @@ import logging
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from aiohttp import web
 import pytest
 
 from homeassistant.auth.providers.legacy_api_password import (
     LegacyApiPasswordAuthProvider,
 )
 import homeassistant.components.http as http
+from homeassistant.components.http.const import KEY_AUTHENTICATED
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.network import NoURLAvailableError
 from homeassistant.setup import async_setup_component
@@ -499,3 +501,67 @@ async def test_logging(
     response = await client.get("/api/states/logging.entity")
     assert response.status == HTTPStatus.OK
     assert "GET /api/states/logging.entity" not in caplog.text
+
+
+async def test_lightweight_route_skips_auth(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test lightweight views skip the auth middleware."""
+
+    class AuthenticatedView(http.HomeAssistantView):
+        url = "/api/test_authenticated"
+        name = "api:test_authenticated"
+        requires_auth = False
+
+        async def get(self, request: web.Request) -> web.Response:
+            return self.json({"authenticated": request.get(KEY_AUTHENTICATED)})
+
+    class LightweightView(AuthenticatedView):
+        url = "/api/test_lightweight"
+        name = "api:test_lightweight"
+        lightweight = True
+
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_view(AuthenticatedView)
+    hass.http.register_view(LightweightView)
+    client = await hass_client()
+
+    response = await client.get("/api/test_authenticated")
+    assert await response.json() == {"authenticated": True}
+    response = await client.get("/api/test_lightweight")
+    assert await response.json() == {"authenticated": None}
+
+
+async def test_middleware_timings(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the middleware timings are recorded when enabled."""
+    assert await async_setup_component(
+        hass, "http", {"http": {"middleware_timings": True}}
+    )
+    assert await async_setup_component(hass, "api", {})
+    client = await hass_client()
+
+    response = await client.get("/api/")
+    assert response.status == HTTPStatus.OK
+    response = await client.get("/api/http/middleware_timings")
+    assert response.status == HTTPStatus.OK
+    timings = await response.json()
+    assert timings["auth_middleware"]["count"] >= 1
+    assert (
+        timings["auth_middleware"]["buckets"]["+Inf"]
+        == (timings["auth_middleware"]["count"])
+    )
+    assert timings["auth_middleware"]["sum"] >= 0
+
+
+async def test_middleware_timings_disabled(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the middleware timings view is not registered by default."""
+    assert await async_setup_component(hass, "http", {})
+    client = await hass_client()
+
+    response = await client.get("/api/http/middleware_timings")
+    assert response.status == HTTPStatus.NOT_FOUND
+    assert hass.http.middleware_timings is None
@@ -7,7 +7,14 @@ from aiohttp.test_utils import TestClient
 from aiohttp.web_exceptions import HTTPForbidden
 import pytest
 
-from homeassistant.components.http.static import CachingStaticResource, _get_file_path
+from homeassistant.components.http.static import (
+    CachingStaticResource,
+    InMemoryStaticResource,
+    StaticFile,
+    StaticFileCache,
+    StaticFileVariant,
+    _get_file_path,
+)
 from homeassistant.core import EVENT_HOMEASSISTANT_START, HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -59,3 +66,83 @@ async def test_static_path_blocks_anchors(
     # changes we still block it.
     with pytest.raises(HTTPForbidden):
         _get_file_path(canonical_url, tmp_path, False)
+
+
+async def test_in_memory_static_resource(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator, tmp_path: Path
+) -> None:
+    """Test files are served from memory with their pre-built variants."""
+    (tmp_path / "app.js").write_text("console.log('app');")
+    (tmp_path / "app.js.gz").write_bytes(b"gzip variant")
+    (tmp_path / "app.js.br").write_bytes(b"brotli variant")
+    (tmp_path / "plain.txt").write_text("plain")
+
+    resource = InMemoryStaticResource("/memory", str(tmp_path))
+    hass.http.app.router.register_resource(resource)
+    client = await aiohttp_client(hass.http.app, auto_decompress=False)
+
+    resp = await client.get("/memory/app.js", headers={"Accept-Encoding": "gzip, br"})
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "br"
+    assert resp.headers["Content-Type"] == "text/javascript"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert await resp.read() == b"brotli variant"
+    brotli_etag = resp.headers["ETag"]
+
+    resp = await client.get(
+        "/memory/app.js", headers={"Accept-Encoding": "gzip, br;q=0"}
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == b"gzip variant"
+
+    resp = await client.get("/memory/app.js", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.read() == b"console.log('app');"
+
+    resp = await client.get("/memory/plain.txt")
+    assert resp.status == 200
+    assert "Vary" not in resp.headers
+    assert await resp.text() == "plain"
+
+    # Conditional requests are answered without accessing the disk
+    (tmp_path / "app.js").unlink()
+    (tmp_path / "app.js.br").unlink()
+    resp = await client.get(
+        "/memory/app.js",
+        headers={"Accept-Encoding": "br", "If-None-Match": brotli_etag},
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == brotli_etag
+
+    resp = await client.get(
+        "/memory/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": brotli_etag},
+    )
+    assert resp.status == 200
+    assert await resp.read() == b"gzip variant"
+
+    resp = await client.get("/memory/missing.js")
+    assert resp.status == 404
+
+
+async def test_static_file_cache_limits_size() -> None:
+    """Test the least recently used files are dropped to fit the cache size."""
+    cache = StaticFileCache(10)
+
+    def _static_file(body: bytes) -> StaticFile:
+        return StaticFile(
+            "text/plain", {None: StaticFileVariant(body, "etag", 0)}, len(body)
+        )
+
+    key_1 = ("1", Path("/"), False)
+    key_2 = ("2", Path("/"), False)
+    key_3 = ("3", Path("/"), False)
+    cache.set(key_1, _static_file(b"1234"))
+    cache.set(key_2, _static_file(b"1234"))
+    assert cache.get(key_1) is not None
+    cache.set(key_3, _static_file(b"1234"))
+
+    assert cache.get(key_2) is None
+    assert cache.get(key_1) is not None
+    assert cache.get(key_3) is not None
+    assert cache.size == 8
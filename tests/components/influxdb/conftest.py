@@ -0,0 +1,10 @@
+"""Fixtures for the InfluxDB tests."""
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture(autouse=True)
+def mock_config_dir(hass: HomeAssistant, tmp_path) -> None:
+    """Keep the spool of each test in its own config dir."""
+    hass.config.config_dir = str(tmp_path)
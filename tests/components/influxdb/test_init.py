@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
+import os
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
@@ -1361,14 +1362,15 @@ async def test_event_listener_scheduled_write(
         assert mock_sleep.called
     assert write_api.call_count == 2
 
-    # Write works again
+    # Write works again, the failed write is written from the spool
     write_api.side_effect = None
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", "2")
         await hass.async_block_till_done()
         hass.data[influxdb.DOMAIN].block_till_done()
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert len(hass.data[influxdb.DOMAIN].spool) == 0
 
 
 @pytest.mark.parametrize(
@@ -1392,7 +1394,7 @@ async def test_event_listener_scheduled_write(
 async def test_event_listener_backlog_full(
     hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
 ) -> None:
-    """Test the event listener drops old events when backlog gets full."""
+    """Test the event listener spools old events when backlog gets full."""
     await _setup(hass, mock_client, config_ext, get_write_api)
 
     monotonic_time = 0
@@ -1403,12 +1405,17 @@ async def test_event_listener_backlog_full(
         monotonic_time += 60
         return monotonic_time
 
-    with patch("homeassistant.components.influxdb.time.monotonic", new=fast_monotonic):
+    with patch(
+        "homeassistant.components.influxdb.time.monotonic", new=fast_monotonic
+    ), patch.object(hass.data[influxdb.DOMAIN].spool, "put") as mock_put:
         hass.states.async_set("entity.id", 1)
         await hass.async_block_till_done()
         hass.data[influxdb.DOMAIN].block_till_done()
 
         assert get_write_api(mock_client).call_count == 0
+        assert mock_put.call_count == 1
+        (line,) = mock_put.call_args[0][0]
+        assert line.startswith("entity.id,domain=entity,entity_id=id value=1.0 ")
 
 
 @pytest.mark.parametrize(
@@ -1676,3 +1683,140 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_spool_survives_restart(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+) -> None:
+    """Test events that could not be written are written after a restart."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = ConnectionError("down")
+
+    hass.states.async_set("fake.entity_id", 1)
+    await hass.async_block_till_done()
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_count == 1
+    hass.data[influxdb.DOMAIN].queue.put(None)
+    hass.data[influxdb.DOMAIN].join()
+
+    spool_dir = hass.config.path(influxdb.SPOOL_DIR)
+    spool = influxdb.InfluxSpool(spool_dir, influxdb.SPOOL_MAX_SIZE)
+    spool.load()
+    assert len(spool) == 1
+    lines = spool.peek()
+    assert len(lines) == 1
+    assert lines[0].startswith(
+        "fake.entity_id,domain=fake,entity_id=entity_id value=1.0 "
+    )
+
+    # Set up again with InfluxDB available
+    write_api.side_effect = None
+    hass.data.pop(influxdb.DOMAIN)
+    hass.config.components.remove(influxdb.DOMAIN)
+    await _setup(hass, mock_client, config_ext, get_write_api)
+
+    hass.states.async_set("fake.entity_id", 2)
+    await hass.async_block_till_done()
+    hass.data[influxdb.DOMAIN].block_till_done()
+    assert write_api.call_count == 2
+    if config_ext == BASE_V1_CONFIG:
+        assert write_api.call_args == call(lines, time_precision=None, protocol="line")
+    else:
+        assert write_api.call_args == get_mock_call(lines)
+    assert len(hass.data[influxdb.DOMAIN].spool) == 0
+
+
+def test_spool_max_size(tmp_path) -> None:
+    """Test the oldest batches are dropped when the spool is full."""
+    spool = influxdb.InfluxSpool(str(tmp_path), 100)
+    spool.load()
+    assert spool.put(["m value=1 1"]) == 0
+    assert spool.put(["m value=2 2"]) == 0
+    large_batch = [f'm value="{os.urandom(50).hex()}" 3']
+    assert spool.put(large_batch) == 2
+    assert len(spool) == 1
+    assert spool.peek() == large_batch
+    spool.pop()
+    assert len(spool) == 0
+    assert spool.size == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_truncated_batch(tmp_path) -> None:
+    """Test a batch cut short on disk is dropped instead of written."""
+    spool = influxdb.InfluxSpool(str(tmp_path), influxdb.SPOOL_MAX_SIZE)
+    spool.load()
+    spool.put(["m value=1 1"])
+    spool.put(["m value=2 2"])
+    first = sorted(tmp_path.iterdir())[0]
+    first.write_bytes(first.read_bytes()[:-8])
+    # A batch which was being written during a crash
+    (tmp_path / "1.lp.gz.tmp").write_bytes(b"")
+
+    spool = influxdb.InfluxSpool(str(tmp_path), influxdb.SPOOL_MAX_SIZE)
+    spool.load()
+    assert len(spool) == 2
+    thread = influxdb.InfluxThread(MagicMock(), MagicMock(), None, 0, spool)
+
+    thread.write_spooled()
+    assert thread.influx.write_lines.call_count == 0
+    assert len(spool) == 1
+    thread.write_spooled()
+    assert thread.influx.write_lines.call_args == call(["m value=2 2"])
+    assert len(spool) == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_connection_error_while_draining(tmp_path) -> None:
+    """Test a spooled batch is kept when InfluxDB goes down while draining."""
+    spool = influxdb.InfluxSpool(str(tmp_path), influxdb.SPOOL_MAX_SIZE)
+    spool.load()
+    spool.put(["m value=1 1"])
+    thread = influxdb.InfluxThread(MagicMock(), MagicMock(), None, 0, spool)
+    thread.connected = True
+    thread.influx.write_lines.side_effect = ConnectionError("down")
+
+    thread.write_spooled()
+    assert not thread.connected
+    assert len(spool) == 1
+
+    thread.influx.write_lines.side_effect = None
+    thread.write_spooled()
+    assert thread.influx.write_lines.call_args == call(["m value=1 1"])
+    assert len(spool) == 0
+
+
+def test_adapt_batch_size() -> None:
+    """Test the batch size follows the write latency."""
+    thread = influxdb.InfluxThread(MagicMock(), MagicMock(), None, 0)
+    assert thread.batch_size == influxdb.BATCH_BUFFER_SIZE
+
+    # Fast full batches grow the batch size
+    thread.adapt_batch_size(influxdb.BATCH_BUFFER_SIZE, 0.01)
+    assert thread.batch_size == influxdb.BATCH_BUFFER_SIZE * 2
+    # Batches which are not full keep it
+    thread.adapt_batch_size(10, 0.01)
+    assert thread.batch_size == influxdb.BATCH_BUFFER_SIZE * 2
+    # Slow writes shrink it
+    for _ in range(10):
+        thread.adapt_batch_size(10, 1)
+    assert thread.batch_size == influxdb.MIN_BATCH_BUFFER_SIZE
@@ -5,7 +5,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -219,6 +219,54 @@ async def test_filter_sensor(
     _assert_entry(entries[2], name="ble", entity_id=entity_id4, state="10")
 
 
+async def test_entity_name_cache_invalidated(
+    hass_: ha.HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test cached entity names follow renames and removals."""
+    registry = er.async_get(hass_)
+    entity_id = registry.async_get_or_create(
+        "switch", "test", "unique_1", suggested_object_id="bla"
+    ).entity_id
+
+    hass_.states.async_set(entity_id, STATE_OFF, {ATTR_FRIENDLY_NAME: "Old name"})
+    hass_.states.async_set(entity_id, STATE_ON, {ATTR_FRIENDLY_NAME: "Old name"})
+    await async_wait_recording_done(hass_)
+    client = await hass_client()
+    entries = await _async_fetch_logbook(client)
+    assert len(entries) == 1
+    _assert_entry(entries[0], name="Old name", entity_id=entity_id)
+
+    # The friendly name changes without a registry update
+    hass_.states.async_set(entity_id, STATE_ON, {ATTR_FRIENDLY_NAME: "New name"})
+    await async_wait_recording_done(hass_)
+    entries = await _async_fetch_logbook(client)
+    _assert_entry(entries[0], name="New name", entity_id=entity_id)
+
+    # The registry is updated before the state is written again
+    for event_type, name in (
+        (er.EVENT_ENTITY_REGISTRY_UPDATED, "Newer name"),
+        (dr.EVENT_DEVICE_REGISTRY_UPDATED, "Newest name"),
+    ):
+        with patch.object(
+            ha.StateMachine,
+            "get",
+            return_value=ha.State(entity_id, STATE_ON, {ATTR_FRIENDLY_NAME: name}),
+        ):
+            hass_.bus.async_fire(
+                event_type,
+                {"action": "update", "entity_id": entity_id, "device_id": "1234"},
+            )
+            await hass_.async_block_till_done()
+            entries = await _async_fetch_logbook(client)
+        _assert_entry(entries[0], name=name, entity_id=entity_id)
+
+    # The state is removed
+    hass_.states.async_remove(entity_id)
+    await async_wait_recording_done(hass_)
+    entries = await _async_fetch_logbook(client)
+    _assert_entry(entries[0], name="bla", entity_id=entity_id)
+
+
 async def test_home_assistant_start_stop_not_grouped(hass_) -> None:
     """Test if HA start and stop events are no longer grouped."""
     await async_setup_component(hass_, "homeassistant", {})
@@ -1740,6 +1740,63 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.processor.LOGBOOK_PAGE_SIZE", 2)
+async def test_subscribe_logbook_stream_entities_past_only_paged(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are streamed in pages for a past only stream."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_OFF)
+    await hass.async_block_till_done()
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.small", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    pages = []
+    while True:
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        pages.append(msg["event"])
+        if not msg["event"].get("partial"):
+            break
+
+    assert len(pages) > 1
+    assert all(page["partial"] for page in pages[:-1])
+    assert [event["state"] for page in pages for event in page["events"]] == [
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+    ]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -0,0 +1,35 @@
+"""Tests for the MJPEG IP Camera camera platform."""
+from datetime import timedelta
+from http import HTTPStatus
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.camera.const import DEFAULT_IMAGE_CACHE_TTL
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+from tests.test_util.aiohttp import AiohttpClientMocker
+from tests.typing import ClientSessionGenerator
+
+
+async def test_camera_image_cache(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    hass_client: ClientSessionGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test still images are shared between requests for a short time."""
+    aioclient_mock.get("http://example.com/still", content=b"still")
+    client = await hass_client()
+
+    for _ in range(3):
+        response = await client.get("/api/camera_proxy/camera.my_mjpeg_camera")
+        assert response.status == HTTPStatus.OK
+        assert await response.read() == b"still"
+    assert aioclient_mock.call_count == 1
+
+    freezer.tick(timedelta(seconds=DEFAULT_IMAGE_CACHE_TTL))
+    response = await client.get("/api/camera_proxy/camera.my_mjpeg_camera")
+    assert response.status == HTTPStatus.OK
+    assert aioclient_mock.call_count == 2
@@ -4,9 +4,14 @@ from http import HTTPStatus
 from unittest.mock import patch
 
 import pytest
+import voluptuous as vol
 
 from homeassistant.components.camera import CameraEntityFeature
 from homeassistant.components.mobile_app.const import CONF_SECRET, DOMAIN
+from homeassistant.components.mobile_app.webhook import (
+    SENSOR_SCHEMA_FULL,
+    validate_sensor_update,
+)
 from homeassistant.components.tag import EVENT_TAG_SCANNED
 from homeassistant.components.zone import DOMAIN as ZONE_DOMAIN
 from homeassistant.const import (
@@ -1156,3 +1161,88 @@ async def test_sending_sensor_state(
     state = hass.states.get("sensor.test_1_battery_health")
     assert state is not None
     assert state.state == "okay-ish"
+
+
+async def test_update_sensor_states_coalesced(
+    hass: HomeAssistant,
+    create_registrations,
+    webhook_client,
+) -> None:
+    """Test sensor updates are written once per webhook and only when changed."""
+    webhook_id = create_registrations[1]["webhook_id"]
+    webhook_url = f"/api/webhook/{webhook_id}"
+
+    reg_resp = await webhook_client.post(
+        webhook_url,
+        json={
+            "type": "register_sensor",
+            "data": {
+                "name": "Battery State",
+                "state": 100,
+                "type": "sensor",
+                "unique_id": "abcd",
+            },
+        },
+    )
+    assert reg_resp.status == HTTPStatus.CREATED
+    await hass.async_block_till_done()
+
+    events = async_capture_events(hass, "state_changed")
+    update = {
+        "type": "update_sensor_states",
+        "data": [
+            {"state": 90, "type": "sensor", "unique_id": "abcd"},
+            {"state": 80, "type": "sensor", "unique_id": "abcd"},
+        ],
+    }
+    resp = await webhook_client.post(webhook_url, json=update)
+    assert resp.status == HTTPStatus.OK
+    assert await resp.json() == {"abcd": {"success": True}}
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["new_state"].state == "80"
+
+    # Sensors resent without changes are not written again
+    with patch(
+        "homeassistant.components.mobile_app.entity.MobileAppEntity.async_write_ha_state"
+    ) as mock_write:
+        resp = await webhook_client.post(webhook_url, json=update)
+        assert resp.status == HTTPStatus.OK
+        await hass.async_block_till_done()
+    assert not mock_write.called
+    assert len(events) == 1
+
+
+@pytest.mark.parametrize(
+    "sensor",
+    [
+        {"state": 1, "type": "sensor", "unique_id": "abcd"},
+        {"state": None, "type": "binary_sensor", "unique_id": "abcd"},
+        {
+            "attributes": {"level": 5},
+            "icon": None,
+            "state": "on",
+            "type": "sensor",
+            "unique_id": "abcd",
+        },
+        {"icon": "mdi:battery", "state": True, "type": "sensor", "unique_id": "abcd"},
+        {"state": [1], "type": "sensor", "unique_id": "abcd"},
+        {"icon": "battery", "state": 1, "type": "sensor", "unique_id": "abcd"},
+        {"attributes": [], "state": 1, "type": "sensor", "unique_id": "abcd"},
+        {"state": 1, "type": "sensor", "unique_id": 5},
+        {"state": 1, "type": "light", "unique_id": "abcd"},
+        {"type": "sensor", "unique_id": "abcd"},
+        {"name": "Battery", "state": 1, "type": "sensor", "unique_id": "abcd"},
+    ],
+)
+def test_validate_sensor_update(sensor: dict) -> None:
+    """Test sensor updates are validated like the full sensor schema."""
+    try:
+        expected = SENSOR_SCHEMA_FULL(sensor)
+    except vol.Invalid as err:
+        with pytest.raises(vol.Invalid) as exc_info:
+            validate_sensor_update(sensor)
+        assert str(exc_info.value) == str(err)
+    else:
+        assert validate_sensor_update(sensor) == expected
@@ -76,8 +76,14 @@ class FilterTest:
     should_pass: bool
 
 
+@pytest.fixture(name="collector_mode", params=[False, True], ids=["event", "collector"])
+def collector_mode_fixture(request: pytest.FixtureRequest) -> bool:
+    """Return if metrics are derived at scrape time."""
+    return request.param
+
+
 @pytest.fixture(name="client")
-async def setup_prometheus_client(hass, hass_client, namespace):
+async def setup_prometheus_client(hass, hass_client, namespace, collector_mode):
     """Initialize an hass_client with Prometheus component."""
     # Reset registry
     prometheus_client.REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
@@ -85,7 +91,7 @@ async def setup_prometheus_client(hass, hass_client, namespace):
     prometheus_client.PlatformCollector(registry=prometheus_client.REGISTRY)
     prometheus_client.GCCollector(registry=prometheus_client.REGISTRY)
 
-    config = {}
+    config = {prometheus.CONF_COLLECTOR_MODE: collector_mode}
     if namespace is not None:
         config[prometheus.CONF_PROM_NAMESPACE] = namespace
     assert await async_setup_component(
@@ -1000,6 +1006,55 @@ async def test_disabling_entity(
     )
 
 
+@pytest.mark.parametrize(("namespace", "collector_mode"), [("", True)])
+async def test_collector_mode_renders_changed_entities(
+    hass: HomeAssistant, client, sensor_entities
+) -> None:
+    """Test gauges are only derived at scrape time for changed entities."""
+    await generate_latest_metrics(client)
+
+    with mock.patch.object(
+        prometheus.PrometheusMetrics,
+        "_handle_sensor",
+        autospec=True,
+        side_effect=prometheus.PrometheusMetrics._handle_sensor,
+    ) as handle_sensor:
+        set_state_with_entry(
+            hass,
+            sensor_entities["sensor_1"],
+            16.2,
+            sensor_entities["sensor_1_attributes"],
+        )
+        await hass.async_block_till_done()
+        assert handle_sensor.call_count == 0
+
+        body = await generate_latest_metrics(client)
+        assert handle_sensor.call_count == 1
+        assert (
+            'sensor_temperature_celsius{domain="sensor",'
+            'entity="sensor.outside_temperature",'
+            'friendly_name="Outside Temperature"} 16.2' in body
+        )
+        assert (
+            'state_change_total{domain="sensor",'
+            'entity="sensor.outside_temperature",'
+            'friendly_name="Outside Temperature"} 2.0' in body
+        )
+
+        await generate_latest_metrics(client)
+        assert handle_sensor.call_count == 1
+
+        set_state_with_entry(hass, sensor_entities["sensor_2"], 55.0)
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+        assert handle_sensor.call_count == 2
+        assert (
+            'sensor_humidity_percent{domain="sensor",'
+            'entity="sensor.outside_humidity",'
+            'friendly_name="Outside Humidity"} 55.0' in body
+        )
+
+
 @pytest.fixture(name="sensor_entities")
 async def sensor_fixture(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
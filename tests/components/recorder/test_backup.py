@@ -1,10 +1,16 @@
 """Test backup platform for the Recorder integration."""
+from pathlib import Path
+import sqlite3
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.backup import async_post_backup, async_pre_backup
+from homeassistant.components.recorder.backup import (
+    async_post_backup,
+    async_pre_backup,
+    async_snapshot_backup,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
@@ -60,3 +66,35 @@ async def test_async_post_backup_failure(
     ) as unlock_mock, pytest.raises(HomeAssistantError):
         await async_post_backup(hass)
         assert unlock_mock.called
+
+
+async def test_async_snapshot_backup(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test copying the database for a backup."""
+    snapshot_dir = tmp_path / "snapshot"
+    snapshot_dir.mkdir()
+
+    # The in-memory test database can't be copied
+    assert await async_snapshot_backup(hass, snapshot_dir) == {}
+
+    hass.config.config_dir = tmp_path.as_posix()
+    db_path = tmp_path / "home-assistant_v2.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE test (value INTEGER)")
+    connection.execute("INSERT INTO test VALUES (42)")
+    connection.commit()
+    connection.close()
+
+    with patch.object(recorder_mock, "db_url", f"sqlite:///{db_path}"):
+        snapshots = await async_snapshot_backup(hass, snapshot_dir)
+
+    assert snapshots == {"home-assistant_v2.db": snapshot_dir / db_path.name}
+    connection = sqlite3.connect(snapshots["home-assistant_v2.db"])
+    assert connection.execute("SELECT value FROM test").fetchall() == [(42,)]
+    connection.close()
+
+    # Databases outside the config directory are not part of the backup
+    hass.config.config_dir = snapshot_dir.as_posix()
+    with patch.object(recorder_mock, "db_url", f"sqlite:///{db_path}"):
+        assert await async_snapshot_backup(hass, snapshot_dir) == {}
@@ -5,14 +5,16 @@ from collections.abc import Callable
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import patch, sentinel
+from unittest.mock import Mock, patch, sentinel
 
 from freezegun import freeze_time
 import pytest
 from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, get_instance, history
+from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
     RecorderRuns,
@@ -22,7 +24,12 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.history.modern import _attributes_column
+from homeassistant.components.recorder.models import (
+    DatabaseEngine,
+    DatabaseOptimizer,
+    process_timestamp,
+)
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
     LegacyLazyStatePreSchema31,
@@ -298,6 +305,11 @@ def test_state_changes_during_period_descending(
         states, list(reversed(list(hist[entity_id])))
     )
 
+    hist = history.state_changes_during_period(
+        hass, start, end, entity_id, no_attributes=False, descending=True, limit=2
+    )
+    assert_multiple_states_equal_without_context(states[:1:-1], hist[entity_id])
+
     start_time = point2 + timedelta(microseconds=10)
     hist = history.state_changes_during_period(
         hass,
@@ -1198,3 +1210,77 @@ def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty(
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     hass = hass_recorder()
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+@pytest.mark.parametrize("json_projection", [True, False])
+def test_state_changes_during_period_attribute_keys(
+    hass_recorder: Callable[..., HomeAssistant], json_projection: bool
+) -> None:
+    """Test only the requested attributes are returned with their types."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    assert instance.database_engine is not None
+    assert instance.database_engine.optimizer.json_projection is True
+    instance.database_engine.optimizer.json_projection = json_projection
+    entity_id = "sensor.test"
+    attributes = {
+        "level": 5,
+        "enabled": True,
+        "nested": {"a": [1, 2]},
+        "name": "test",
+        "empty": None,
+    }
+    start = dt_util.utcnow()
+    hass.states.set(entity_id, "on", attributes)
+    hass.states.set(entity_id, "off", {**attributes, "level": 6})
+    wait_recording_done(hass)
+
+    hist = history.state_changes_during_period(
+        hass,
+        start,
+        entity_id=entity_id,
+        attribute_keys=["level", "enabled", "nested", "empty", "missing"],
+    )
+    assert [state.attributes for state in hist[entity_id]] == [
+        {"level": 5, "enabled": True, "nested": {"a": [1, 2]}},
+        {"level": 6, "enabled": True, "nested": {"a": [1, 2]}},
+    ]
+
+    # A different set of keys must not reuse the cached statement
+    hist = history.state_changes_during_period(
+        hass, start, entity_id=entity_id, attribute_keys=["name"]
+    )
+    assert [state.attributes for state in hist[entity_id]] == [
+        {"name": "test"},
+        {"name": "test"},
+    ]
+
+    hist = history.get_significant_states(
+        hass,
+        dt_util.utcnow(),
+        entity_ids=[entity_id],
+        attribute_keys=["level"],
+        compressed_state_format=True,
+    )
+    assert hist[entity_id][0]["a"] == {"level": 6}
+
+    hist = history.state_changes_during_period(hass, start, entity_id=entity_id)
+    assert hist[entity_id][0].attributes == attributes
+
+
+def test_attributes_column_postgresql_is_text() -> None:
+    """Test the PostgreSQL projection is selected as text, not decoded json."""
+    instance = Mock(
+        database_engine=DatabaseEngine(
+            dialect=SupportedDialect.POSTGRESQL,
+            version=None,
+            optimizer=DatabaseOptimizer(
+                slow_range_in_select=False, json_projection=True
+            ),
+            max_bind_vars=100,
+        )
+    )
+    column = _attributes_column(instance, ("unit_of_measurement",))
+    compiled = str(column.compile(dialect=postgresql.dialect()))
+    assert compiled.startswith("CAST(json_build_object(")
+    assert compiled.endswith("AS TEXT)")
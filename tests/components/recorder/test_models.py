@@ -20,6 +20,9 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
     ulid_to_bytes_or_none,
 )
+from homeassistant.components.recorder.models.state_attributes import (
+    decode_attribute_keys_from_source,
+)
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
@@ -464,3 +467,20 @@ def test_bytes_to_ulid_or_none(caplog: pytest.LogCaptureFixture) -> None:
     assert bytes_to_ulid_or_none(b"invalid") is None
     assert "invalid" in caplog.text
     assert bytes_to_ulid_or_none(None) is None
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        '{"level": 5, "nested": {"a": [1]}, "empty": null}',
+        # PostgreSQL drivers can return a decoded json projection
+        {"level": 5, "nested": {"a": [1]}, "empty": None},
+    ],
+)
+def test_decode_attribute_keys_from_source(source: str | dict) -> None:
+    """Test decoding some attributes from a string or decoded source."""
+    attr_cache: dict = {}
+    keys = ("level", "nested", "empty", "missing")
+    expected = {"level": 5, "nested": {"a": [1]}}
+    assert decode_attribute_keys_from_source(source, attr_cache, keys) == expected
+    assert decode_attribute_keys_from_source(source, attr_cache, keys) == expected
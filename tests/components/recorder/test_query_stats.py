@@ -0,0 +1,167 @@
+"""Test the recorder query profiler."""
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.query_stats import (
+    QueryStats,
+    _explain,
+    statement_type,
+)
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import MockUser
+from tests.typing import WebSocketGenerator
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT states.state FROM states WHERE states.state_id = ?", "SELECT states"),
+        (
+            "SELECT anon_1.state FROM (SELECT states.state FROM states) AS anon_1",
+            "SELECT states",
+        ),
+        ("INSERT INTO states (state) VALUES (?)", "INSERT states"),
+        ('UPDATE "statistics" SET sum=%(sum)s', "UPDATE statistics"),
+        ("\n DELETE FROM event_data WHERE data_id IN (?)", "DELETE event_data"),
+        ("PRAGMA journal_mode=WAL", "PRAGMA"),
+    ],
+)
+def test_statement_type(statement: str, expected: str) -> None:
+    """Test the type of statements."""
+    assert statement_type(statement) == expected
+
+
+def test_query_stats_engine() -> None:
+    """Test the stats of an engine are only recorded while attached."""
+    engine = create_engine("sqlite://")
+    query_stats = QueryStats(enabled=True)
+    query_stats.attach(engine)
+    query_stats.attach(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT)"))
+        conn.execute(text("INSERT INTO items VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+        conn.execute(text("UPDATE items SET name = 'd' WHERE id < 3"))
+        conn.execute(text("SELECT * FROM items")).fetchall()
+
+    statements = query_stats.as_dict()["statements"]
+    assert statements["INSERT items"]["count"] == 1
+    assert statements["INSERT items"]["rows"] == 3
+    assert statements["UPDATE items"]["rows"] == 2
+    # SQLite doesn't report the rows of a SELECT before they are fetched
+    assert statements["SELECT items"]["count"] == 1
+    assert statements["SELECT items"]["rows"] is None
+    assert query_stats.slowest_statement_type()[0] in statements
+
+    query_stats.detach_all()
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM items"))
+    assert "DELETE items" not in query_stats.as_dict()["statements"]
+
+
+def test_explain_failure_keeps_transaction() -> None:
+    """Test a failed explain rolls back to a savepoint on PostgreSQL."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER)"))
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO items VALUES (1)"))
+        cursor = Mock(wraps=conn.connection.cursor())
+        with patch.object(conn.dialect, "name", "postgresql"), patch.object(
+            conn.connection, "cursor", return_value=cursor
+        ):
+            assert _explain(conn, "SELECT * FROM missing", ()) is None
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        assert executed[0] == "SAVEPOINT recorder_explain"
+        assert executed[-1] == "ROLLBACK TO SAVEPOINT recorder_explain"
+        assert conn.execute(text("SELECT count(*) FROM items")).scalar() == 1
+
+
+async def test_query_stats(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test profiling the statements of the recorder."""
+    client = await hass_ws_client()
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/query_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "enabled": False,
+        "statements": {},
+        "slow_queries": [],
+    }
+
+    await client.send_json_auto_id({"type": "recorder/query_stats", "enable": True})
+    response = await client.receive_json()
+    assert response["result"]["enabled"] is True
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    with patch("homeassistant.components.recorder.query_stats.SLOW_QUERY_THRESHOLD", 0):
+        await recorder_mock.async_add_executor_job(
+            history.get_significant_states,
+            hass,
+            dt_util.utcnow() - timedelta(hours=1),
+            None,
+            ["sensor.test"],
+        )
+
+    await client.send_json_auto_id({"type": "recorder/query_stats", "reset": True})
+    response = await client.receive_json()
+    result = response["result"]
+    insert_states = result["statements"]["INSERT states"]
+    assert insert_states["count"] == 1
+    assert insert_states["buckets"]["+Inf"] == 1
+    assert insert_states["mean"] <= insert_states["max"]
+    slow_query = next(
+        slow_query
+        for slow_query in result["slow_queries"]
+        if slow_query["statement_type"] == "SELECT states"
+    )
+    assert slow_query["statement"].startswith("SELECT")
+    assert slow_query["explain"]
+
+    await client.send_json_auto_id({"type": "recorder/query_stats"})
+    response = await client.receive_json()
+    assert response["result"] == {
+        "enabled": True,
+        "statements": {},
+        "slow_queries": [],
+    }
+
+    await client.send_json_auto_id({"type": "recorder/query_stats", "enable": False})
+    response = await client.receive_json()
+    assert response["result"]["enabled"] is False
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+    await client.send_json_auto_id({"type": "recorder/query_stats"})
+    response = await client.receive_json()
+    assert "INSERT states" not in response["result"]["statements"]
+
+
+async def test_query_stats_requires_admin(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the query stats are only available to admins."""
+    hass_admin_user.groups = []
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/query_stats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
@@ -0,0 +1,197 @@
+"""Test routing reads to a read replica."""
+from datetime import timedelta
+from pathlib import Path
+import sqlite3
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from sqlalchemy import text
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import history
+from homeassistant.components.recorder.read_replica import (
+    READ_TARGET,
+    READ_TARGET_PRIMARY,
+    READ_TARGET_REPLICA,
+)
+from homeassistant.components.recorder.util import get_instance, session_scope
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture(autouse=True)
+def check_replica_lag_every_read():
+    """Check how far the replica is behind on every read."""
+    with patch(
+        "homeassistant.components.recorder.read_replica.REPLICA_LAG_CHECK_INTERVAL", 0
+    ):
+        yield
+
+
+def _copy_database(source: Path, target: Path) -> None:
+    """Copy a sqlite database, like a replica catching up."""
+    source_connection = sqlite3.connect(source)
+    target_connection = sqlite3.connect(target)
+    source_connection.backup(target_connection)
+    target_connection.close()
+    source_connection.close()
+
+
+async def _async_get_states(hass: HomeAssistant, entity_id: str) -> list[str]:
+    """Return the states of an entity in the last day."""
+    states = await get_instance(hass).async_add_executor_job(
+        history.get_significant_states,
+        hass,
+        dt_util.utcnow() - timedelta(days=1),
+        None,
+        [entity_id],
+    )
+    return [state.state for state in states.get(entity_id, [])]
+
+
+async def test_reads_from_replica(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test reads go to the replica until it falls too far behind."""
+    if recorder_db_url != "sqlite://":
+        pytest.skip("Replica is copied with the sqlite backup API")
+    primary_path = tmp_path / "primary.db"
+    replica_path = tmp_path / "replica.db"
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: f"sqlite:///{primary_path}",
+            recorder.CONF_DB_READ_URL: f"sqlite:///{replica_path}",
+            recorder.CONF_DB_READ_MAX_LAG: 60,
+            recorder.CONF_COMMIT_INTERVAL: 0,
+        },
+    )
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    await instance.async_add_executor_job(_copy_database, primary_path, replica_path)
+
+    freezer.tick(30)
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+
+    # The replica is 30 seconds behind, the new state is not on it yet
+    assert await _async_get_states(hass, "sensor.test") == ["1"]
+    assert instance.read_replica.lag == pytest.approx(30, abs=1)
+
+    freezer.tick(60)
+    hass.states.async_set("sensor.test", "3")
+    await async_wait_recording_done(hass)
+
+    # The replica is 90 seconds behind, reads fall back to the primary
+    assert await _async_get_states(hass, "sensor.test") == ["1", "2", "3"]
+    assert instance.read_replica.lag == pytest.approx(90, abs=1)
+
+    await instance.async_add_executor_job(_copy_database, primary_path, replica_path)
+    assert await _async_get_states(hass, "sensor.test") == ["1", "2", "3"]
+    assert instance.read_replica.lag == 0
+
+    timings = instance.read_query_timings.as_dict()
+    assert timings[READ_TARGET_PRIMARY]["count"] == 1
+    assert timings[READ_TARGET_REPLICA]["count"] == 2
+
+    # Sessions which are not read only always use the primary
+    def _get_write_session_target() -> str:
+        with session_scope(hass=hass) as session:
+            return session.info.get(READ_TARGET, READ_TARGET_PRIMARY)
+
+    assert (
+        await instance.async_add_executor_job(_get_write_session_target)
+        == READ_TARGET_PRIMARY
+    )
+
+    # Replica connections are set up for the dialect like the primary ones
+    def _get_replica_foreign_keys() -> int:
+        session = instance.read_replica.get_session()
+        try:
+            return session.execute(text("PRAGMA foreign_keys")).scalar()
+        finally:
+            session.close()
+
+    assert await instance.async_add_executor_job(_get_replica_foreign_keys) == 1
+
+
+async def test_stale_replica_before_first_commit(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test reads use the primary until its newest state is known."""
+    if recorder_db_url != "sqlite://":
+        pytest.skip("Replica is copied with the sqlite backup API")
+    primary_path = tmp_path / "primary.db"
+    replica_path = tmp_path / "replica.db"
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: f"sqlite:///{primary_path}",
+            recorder.CONF_DB_READ_URL: f"sqlite:///{replica_path}",
+            recorder.CONF_DB_READ_MAX_LAG: 60,
+            recorder.CONF_COMMIT_INTERVAL: 0,
+        },
+    )
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    await instance.async_add_executor_job(_copy_database, primary_path, replica_path)
+    freezer.tick(90)
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+
+    # Like right after a restart, before the recorder committed anything
+    instance.states_manager.newest_committed_ts = None
+    assert await _async_get_states(hass, "sensor.test") == ["1", "2"]
+    assert instance.read_replica.lag is None
+
+    def _load_newest_committed_ts() -> None:
+        with session_scope(session=instance.get_session()) as session:
+            instance.states_manager.load_newest_committed_ts(session)
+
+    await instance.async_add_executor_job(_load_newest_committed_ts)
+    assert await _async_get_states(hass, "sensor.test") == ["1", "2"]
+    assert instance.read_replica.lag == pytest.approx(90, abs=1)
+
+
+async def test_replica_not_available(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test reads fall back to the primary when the replica can't be reached."""
+    if recorder_db_url != "sqlite://":
+        pytest.skip("Replica is a sqlite database")
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: f"sqlite:///{tmp_path / 'primary.db'}",
+            recorder.CONF_DB_READ_URL: f"sqlite:///{tmp_path / 'missing' / 'replica.db'}",
+            recorder.CONF_COMMIT_INTERVAL: 0,
+        },
+    )
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    assert await _async_get_states(hass, "sensor.test") == ["1"]
+    assert instance.read_replica.lag is None
+    assert "Read replica is not available" in caplog.text
+    assert instance.read_query_timings.as_dict()[READ_TARGET_PRIMARY]["count"] == 1
+
+    caplog.clear()
+    assert await _async_get_states(hass, "sensor.test") == ["1"]
+    assert "Read replica is not available" not in caplog.text
@@ -8,7 +8,12 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1743,6 +1748,196 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test daily and monthly statistics are served from the rollups."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_active is True
+
+    zero = dt_util.utcnow()
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-29 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour,
+            "min": hour - 1,
+            "max": hour + 1,
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(96)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 4
+        assert session.query(StatisticsMonthly).count() == 2
+
+    def _stats_from_rollups_and_hourly(
+        period: str,
+    ) -> tuple[dict[str, list[dict]], dict[str, list[dict]]]:
+        from_rollups = statistics_during_period(hass, zero, period=period)
+        instance.statistics_rollups_active = False
+        from_hourly = statistics_during_period(hass, zero, period=period)
+        instance.statistics_rollups_active = True
+        return from_rollups, from_hourly
+
+    for period in ("day", "month"):
+        from_rollups, from_hourly = _stats_from_rollups_and_hourly(period)
+        assert from_rollups == from_hourly
+
+    stats = statistics_during_period(hass, zero, period="month")
+    assert stats["test:total_energy_import"][0]["sum"] == pytest.approx(94.0)
+    assert stats["test:total_energy_import"][0]["mean"] == pytest.approx(23.5)
+    assert stats["test:total_energy_import"][1]["max"] == pytest.approx(96.0)
+
+    # Adjusting the sum updates the rollups
+    recorder.get_instance(hass).async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(hours=30), 100, "kWh"
+    )
+    wait_recording_done(hass)
+    for period in ("day", "month"):
+        from_rollups, from_hourly = _stats_from_rollups_and_hourly(period)
+        assert from_rollups == from_hourly
+    stats = statistics_during_period(hass, zero, period="day")
+    assert [row["sum"] for row in stats["test:total_energy_import"]] == [
+        pytest.approx(46.0),
+        pytest.approx(194.0),
+        pytest.approx(242.0),
+        pytest.approx(290.0),
+    ]
+
+    # Changing the time zone makes the rollups fall back to the hourly
+    # statistics until they have been rebuilt
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+    try:
+        instance.statistics_rollups_active = False
+        expected = statistics_during_period(hass, zero, period="day")
+        instance.statistics_rollups_active = True
+
+        assert statistics_during_period(hass, zero, period="day") == expected
+        assert instance.statistics_rollups_active is False
+        # The rollups are rebuilt one month per recorder task
+        wait_recording_done(hass)
+        wait_recording_done(hass)
+        assert instance.statistics_rollups_active is True
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.query(StatisticsDaily).count() == 5
+        assert statistics_during_period(hass, zero, period="day") == expected
+    finally:
+        dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+def _assert_statistics_approx(
+    stats: dict[str, list[dict]], expected: dict[str, list[dict]]
+) -> None:
+    """Assert statistics rows are equal, up to rounding of the floats."""
+    assert stats.keys() == expected.keys()
+    for statistic_id, rows in stats.items():
+        assert rows == [pytest.approx(row) for row in expected[statistic_id]]
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_statistics_rollups_compile_hourly(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test compiling an hour folds it into the rollups containing it."""
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    types = {"max", "mean", "min", "state", "sum"}
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-08-30 12:00:00"))
+    with session_scope(hass=hass) as session:
+        session.add(
+            meta := StatisticsMeta.from_meta(
+                {
+                    "has_mean": True,
+                    "has_sum": True,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": "sensor.test",
+                    "unit_of_measurement": "kWh",
+                }
+            )
+        )
+        session.flush()
+        metadata_id = meta.id
+        for minutes in range(0, 48 * 60, 5):
+            value = minutes * 7 % 31 / 3
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    metadata_id,
+                    {
+                        "start": start + timedelta(minutes=minutes),
+                        "mean": value,
+                        "min": value - 1,
+                        "max": value + 1,
+                        "state": value,
+                        "sum": minutes / 5,
+                    },
+                )
+            )
+
+    # The rollups are not compiled again from the hourly statistics
+    with patch.object(
+        statistics, "_compile_statistics_rollup"
+    ) as compile_rollup_mock, session_scope(hass=hass) as session:
+        for hour in range(48):
+            statistics._compile_hourly_statistics(
+                session, start + timedelta(hours=hour)
+            )
+    assert compile_rollup_mock.call_count == 0
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 3
+        assert session.query(StatisticsMonthly).count() == 2
+
+    for period in ("day", "month"):
+        from_rollups = statistics_during_period(hass, start, period=period, types=types)
+        instance.statistics_rollups_active = False
+        from_hourly = statistics_during_period(hass, start, period=period, types=types)
+        instance.statistics_rollups_active = True
+        _assert_statistics_approx(from_rollups, from_hourly)
+
+    # Partial periods at the edges are reduced from the hourly statistics
+    start_time = start + timedelta(hours=6)
+    end_time = start + timedelta(hours=48)
+    hourly = statistics_during_period(hass, start_time, end_time, types=types)
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata = instance.statistics_meta_manager.get_many(session)
+        stats = statistics._statistics_during_period_from_rollups(
+            hass,
+            session,
+            start_time,
+            end_time,
+            None,
+            metadata,
+            None,
+            "day",
+            None,
+            types,
+        )
+    # A partial day, a day from the rollups and another partial day
+    assert len(stats["sensor.test"]) == 3
+    _assert_statistics_approx(
+        stats, statistics._reduce_statistics_per_day(hourly, types)
+    )
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -1,12 +1,16 @@
 """Test recorder system health."""
+from datetime import timedelta
+from pathlib import Path
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder, get_instance, history
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -116,3 +120,70 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
     }
+
+
+async def test_recorder_system_health_read_replica(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test recorder system health with a read replica which is not available."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: f"sqlite:///{tmp_path / 'primary.db'}",
+            recorder.CONF_DB_READ_URL: f"sqlite:///{tmp_path / 'missing' / 'replica.db'}",
+        },
+    )
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    await instance.async_add_executor_job(
+        history.get_significant_states,
+        hass,
+        dt_util.utcnow() - timedelta(hours=1),
+        None,
+        ["sensor.test"],
+    )
+    info = await get_system_health_info(hass, "recorder")
+    assert info == {
+        "current_recorder_run": instance.recorder_runs_manager.current.start,
+        "oldest_recorder_run": instance.recorder_runs_manager.first.start,
+        "estimated_db_size": ANY,
+        "database_engine": SupportedDialect.SQLITE.value,
+        "database_version": ANY,
+        "read_replica_lag": "unavailable",
+        "primary_read_latency": ANY,
+    }
+
+
+async def test_recorder_system_health_query_stats(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+) -> None:
+    """Test recorder system health with the query profiler enabled."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_PROFILE_QUERIES: True}
+    )
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info == {
+        "current_recorder_run": instance.recorder_runs_manager.current.start,
+        "oldest_recorder_run": instance.recorder_runs_manager.first.start,
+        "estimated_db_size": ANY,
+        "database_engine": SupportedDialect.SQLITE.value,
+        "database_version": ANY,
+        "slow_queries": 0,
+        "slowest_statement": ANY,
+    }
@@ -587,3 +587,70 @@ async def test_ws_api(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -
         "config_entry": [hue_config_entry.entry_id],
         "area": [kitchen_area.id],
     }
+
+
+async def test_reference_graph_updates(hass: HomeAssistant) -> None:
+    """Test the reference graph follows reloaded, changed and removed entities."""
+    assert await async_setup_component(
+        hass,
+        "group",
+        {"group": {"test": {"name": "test", "entities": ["light.one"]}}},
+    )
+    await hass.async_block_till_done()
+
+    device_reg = dr.async_get(hass)
+    entity_reg = er.async_get(hass)
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.one") == {
+        "group": {"group.test"},
+    }
+
+    await hass.services.async_call(
+        "group",
+        "set",
+        {"object_id": "test", "entities": ["light.two"]},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.one") == {}
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.two") == {
+        "group": {"group.test"},
+    }
+
+    assert await async_setup_component(
+        hass,
+        "script",
+        {
+            "script": {
+                "wled": {
+                    "sequence": [
+                        {
+                            "service": "light.turn_on",
+                            "target": {"entity_id": "light.two"},
+                        }
+                    ]
+                }
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.two") == {
+        "group": {"group.test"},
+        "script": {"script.wled"},
+    }
+
+    await hass.services.async_call(
+        "group", "remove", {"object_id": "test"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    searcher = search.Searcher(hass, device_reg, entity_reg, MOCK_ENTITY_SOURCES)
+    assert searcher.async_search("entity", "light.two") == {
+        "script": {"script.wled"},
+    }
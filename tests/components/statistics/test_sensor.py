@@ -18,7 +18,6 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.components.statistics import DOMAIN as STATISTICS_DOMAIN
-from homeassistant.components.statistics.sensor import StatisticsSensor
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -31,6 +30,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.state_series import StateSeries
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -1333,6 +1333,58 @@ async def test_initialize_from_database(
     assert state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) == UnitOfTemperature.CELSIUS
 
 
+async def test_initialize_from_database_shared_by_source(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test sensors of the same source share one recorder query."""
+    # enable and pre-fill the recorder
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    for value in VALUES_NUMERIC:
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.helpers.state_series.StateSeries._fetch_states_from_database",
+        autospec=True,
+        side_effect=StateSeries._fetch_states_from_database,
+    ) as fetch_states_mock:
+        assert await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "statistics",
+                        "name": "test_mean",
+                        "entity_id": "sensor.test_monitored",
+                        "state_characteristic": "mean",
+                        "sampling_size": 100,
+                    },
+                    {
+                        "platform": "statistics",
+                        "name": "test_count",
+                        "entity_id": "sensor.test_monitored",
+                        "state_characteristic": "count",
+                        "sampling_size": 3,
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert fetch_states_mock.call_count == 1
+    state = hass.states.get("sensor.test_mean")
+    assert state.state == str(round(sum(VALUES_NUMERIC) / len(VALUES_NUMERIC), 2))
+    assert hass.states.get("sensor.test_count").state == "3"
+
+
 @pytest.mark.freeze_time(
     datetime(dt_util.utcnow().year + 1, 8, 2, 12, 23, 42, tzinfo=dt_util.UTC)
 )
@@ -1342,18 +1394,11 @@ async def test_initialize_from_database_with_maxage(
     """Test initializing the statistics from the database."""
     current_time = dt_util.utcnow()
 
-    # Testing correct retrieval from recorder, thus we do not
-    # want purging to occur within the class itself.
-    def mock_purge(self, *args):
-        return
-
     # enable and pre-fill the recorder
     await hass.async_block_till_done()
     await async_wait_recording_done(hass)
 
-    with freeze_time(current_time) as freezer, patch.object(
-        StatisticsSensor, "_purge_old_states", mock_purge
-    ):
+    with freeze_time(current_time) as freezer:
         for value in VALUES_NUMERIC:
             hass.states.async_set(
                 "sensor.test_monitored",
@@ -290,7 +290,9 @@ def run_worker(hass, stream, stream_source, stream_settings=None):
         {},
         stream_settings or hass.data[DOMAIN][ATTR_SETTINGS],
         stream_state,
-        KeyFrameConverter(hass, stream_settings, dynamic_stream_settings()),
+        KeyFrameConverter(
+            hass, stream_settings, dynamic_stream_settings(), stream._diagnostics
+        ),
         threading.Event(),
     )
 
@@ -1006,6 +1008,40 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_sizes_share_keyframe(
+    hass: HomeAssistant, h264_video, filename
+) -> None:
+    """Test images of several sizes are generated from a single decoded keyframe."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, h264_video, {}, dynamic_stream_settings())
+
+    with patch.object(hass.config, "is_allowed_path", return_value=True):
+        await stream.async_record(filename)
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+
+    converter = stream._keyframe_converter
+    for _ in range(2):
+        assert await converter.async_get_image() == EMPTY_8_6_JPEG
+        assert await converter.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert encode.call_count == 2
+    assert encode.call_args_list[0][0][0].shape == (320, 480, 3)
+    assert encode.call_args_list[1][0][0].shape == (3, 4, 3)
+
+    diagnostics = stream.get_diagnostics()
+    assert diagnostics["keyframe_decode_count"] == 1
+    assert diagnostics["keyframe_image_hit"] == 2
+    assert diagnostics["keyframe_image_miss"] == 2
+    assert diagnostics["keyframe_image_hit_rate"] == 0.5
+
+    await stream.stop()
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
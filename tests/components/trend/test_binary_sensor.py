@@ -11,6 +11,7 @@ from homeassistant import config as hass_config, setup
 from homeassistant.components.trend.const import DOMAIN
 from homeassistant.const import SERVICE_RELOAD, STATE_OFF, STATE_ON, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.state_series import StateSeriesWindow, async_get_state_series
 from homeassistant.setup import async_setup_component
 
 from tests.common import assert_setup_component, get_fixture_path, mock_restore_cache
@@ -180,6 +181,39 @@ async def test_non_numeric(hass: HomeAssistant):
     assert state.state == STATE_UNKNOWN
 
 
+async def test_binary_source(hass: HomeAssistant, caplog: pytest.LogCaptureFixture):
+    """Test binary states are not used as samples."""
+    await _setup_component(hass, {"entity_id": "binary_sensor.test_state"})
+
+    for val in [STATE_OFF, STATE_ON]:
+        hass.states.async_set("binary_sensor.test_state", val)
+        await hass.async_block_till_done()
+
+    assert (state := hass.states.get("binary_sensor.test_trend_sensor"))
+    assert state.state == STATE_UNKNOWN
+    assert state.attributes["sample_count"] == 0
+    assert "could not convert on to float" in caplog.text
+
+
+async def test_samples_since_added(hass: HomeAssistant):
+    """Test samples the shared series had before the sensor was added are ignored."""
+    series = async_get_state_series(hass, "sensor.test_state")
+    series.async_attach(StateSeriesWindow(), lambda state, added: None)
+    for val in [3, 2, 1]:
+        hass.states.async_set("sensor.test_state", val)
+        await hass.async_block_till_done()
+
+    await _setup_component(hass, {"entity_id": "sensor.test_state"})
+    for val in [2, 3]:
+        hass.states.async_set("sensor.test_state", val)
+        await hass.async_block_till_done()
+
+    assert series.values.tolist() == [3.0, 2.0, 1.0, 2.0, 3.0]
+    assert (state := hass.states.get("binary_sensor.test_trend_sensor"))
+    assert state.state == STATE_ON
+    assert state.attributes["sample_count"] == 2
+
+
 async def test_missing_attribute(hass: HomeAssistant):
     """Test for missing attribute."""
     await _setup_component(
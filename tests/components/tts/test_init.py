@@ -1768,3 +1768,134 @@ async def test_async_convert_audio_error(hass: HomeAssistant) -> None:
     with pytest.raises(RuntimeError):
         # Simulate a bad WAV file
         await tts.async_convert_audio(hass, "wav", bytes(0), "mp3")
+
+
+class MockEntitySized(MockTTSEntity):
+    """Mock entity returning audio of 10 bytes."""
+
+    def get_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tts.TtsAudioType:
+        """Load TTS dat."""
+        return ("mp3", b"0123456789")
+
+
+@pytest.mark.parametrize("mock_tts_entity", [MockEntitySized(DEFAULT_LANG)])
+async def test_cache_budgets(
+    hass: HomeAssistant, mock_tts_cache_dir, mock_tts_entity: MockTTSEntity
+) -> None:
+    """Test the least recently used voices are evicted over the cache budgets."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    manager.mem_cache_max_size = 20
+    manager.file_cache_max_size = 25
+
+    keys = []
+    for message in ("one", "two", "one", "three"):
+        media_source_id = tts.generate_media_source_id(
+            hass, message, "tts.test", "en_US", cache=True
+        )
+        assert await tts.async_get_media_source_audio(hass, media_source_id) == (
+            "mp3",
+            b"0123456789",
+        )
+        await hass.async_block_till_done()
+        if message not in keys:
+            keys.append(message)
+
+    one, two, three = (
+        manager._generate_cache_key(message, "en_US", None, "tts.test")
+        for message in keys
+    )
+    # "two" is the least recently used voice
+    assert list(manager.mem_cache) == [one, three]
+    assert manager.mem_cache_size == 20
+    assert set(manager.file_cache) == {one, three}
+    assert manager.file_cache_size == 20
+    assert sorted(path.name for path in mock_tts_cache_dir.iterdir()) == sorted(
+        (manager.file_cache[one], manager.file_cache[three])
+    )
+
+
+async def test_cache_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files: MagicMock,
+    mock_tts_entity: MockTTSEntity,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test the cache dir is not scanned when the persisted index is current."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    (mock_tts_cache_dir / filename).write_bytes(b"test")
+    cache_key = filename[:-4]
+
+    hass_storage["tts.cache_index"] = {
+        "version": 1,
+        "key": "tts.cache_index",
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "mtime_ns": mock_tts_cache_dir.stat().st_mtime_ns,
+            "files": {cache_key: [filename, 4, 1000.0]},
+        },
+    }
+
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    assert not mock_tts_get_cache_files.called
+    assert manager.file_cache == {cache_key: filename}
+    assert manager.file_cache_size == 4
+
+    client = await hass_client()
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"test"
+
+    # Reading the voice updates its last access time in the index
+    index = manager._data_to_save()
+    assert index["files"][cache_key][:2] == [filename, 4]
+    assert index["files"][cache_key][2] > 1000.0
+
+
+async def test_cache_index_outdated(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files: MagicMock,
+    mock_tts_entity: MockTTSEntity,
+) -> None:
+    """Test the cache dir is scanned when it changed after the index was saved."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    (mock_tts_cache_dir / filename).write_bytes(b"test")
+
+    hass_storage["tts.cache_index"] = {
+        "version": 1,
+        "key": "tts.cache_index",
+        "data": {"cache_dir": str(mock_tts_cache_dir), "mtime_ns": 0, "files": {}},
+    }
+
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    assert mock_tts_get_cache_files.called
+    assert manager.file_cache == {filename[:-4]: filename}
+    assert manager.file_cache_size == 4
+
+
+async def test_file_cache_single_read(
+    hass: HomeAssistant, mock_tts_cache_dir, mock_tts_entity: MockTTSEntity
+) -> None:
+    """Test concurrent requests for a cached voice share a single file read."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    (mock_tts_cache_dir / filename).write_bytes(b"test")
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+
+    with patch.object(
+        manager, "_async_load_file", wraps=manager._async_load_file
+    ) as mock_load_file:
+        results = await asyncio.gather(
+            *(manager.async_read_tts(filename) for _ in range(3))
+        )
+
+    assert results == [("audio/mpeg", b"test")] * 3
+    assert mock_load_file.call_count == 1
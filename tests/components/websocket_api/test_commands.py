@@ -17,12 +17,20 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.state_log import StateChangeLog
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
-from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    HomeAssistant,
+    State,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import DATA_IMPORT_TIME, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 from homeassistant.util.json import json_loads
 
@@ -705,6 +713,37 @@ async def test_get_services(
         assert msg["result"] == hass.services.async_services()
 
 
+async def test_get_services_versioned(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_services only sends the services when the version changed."""
+    await websocket_client.send_json({"id": 5, "type": "get_services", "version": None})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "version": ANY,
+        "not_modified": False,
+        "data": hass.services.async_services(),
+    }
+    version = msg["result"]["version"]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "get_services", "version": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"version": version, "not_modified": True}
+
+    # Registering a service invalidates the cached descriptions
+    hass.services.async_register("websocket_api", "test_service", lambda call: None)
+    await websocket_client.send_json(
+        {"id": 7, "type": "get_services", "version": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["not_modified"] is False
+    assert msg["result"]["version"] != version
+    assert "test_service" in msg["result"]["data"]["websocket_api"]
+
+
 async def test_get_config(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -909,6 +948,92 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_resume(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test resuming an entities subscription after a reconnect."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "resumable": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {"log_id": ANY, "resumed": False}
+    log_id = msg["result"]["log_id"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two"}
+    sequence = msg["event"]["s"]
+
+    hass.states.async_set("light.one", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.one"]["+"]["s"] == "on"
+    assert msg["event"]["s"] == sequence + 1
+    sequence = msg["event"]["s"]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Changes missed by the client
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.two", "off", {"color": "red"})
+    hass.states.async_remove("light.one")
+    hass.states.async_set("light.three", "on")
+
+    await websocket_client.send_json(
+        {
+            "id": 9,
+            "type": "subscribe_entities",
+            "resume": {"log_id": log_id, "sequence": sequence},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"log_id": log_id, "resumed": True}
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "light.two": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "off"},
+            "light.three": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+        },
+        "r": ["light.one"],
+        "s": sequence + 4,
+    }
+
+    # Sequences of another log or not logged get a full snapshot
+    for msg_id, resume in (
+        (10, {"log_id": "unknown", "sequence": sequence}),
+        (11, {"log_id": log_id, "sequence": sequence + 100}),
+    ):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", "resume": resume}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["result"] == {"log_id": log_id, "resumed": False}
+        msg = await websocket_client.receive_json()
+        assert set(msg["event"]["a"]) == {"light.two", "light.three"}
+        assert msg["event"]["s"] == sequence + 4
+
+
+def test_state_change_log() -> None:
+    """Test the state change log only resumes logged sequences."""
+    log = StateChangeLog(maxlen=2)
+    events = [
+        Event("state_changed", {"entity_id": f"light.{index}"}) for index in range(3)
+    ]
+    for event in events:
+        assert log.async_sequence(event) == log.async_sequence(event)
+    assert log.sequence == 3
+    assert log.async_entity_ids_since(log.log_id, 0) is None
+    assert log.async_entity_ids_since(log.log_id, 1) == ["light.1", "light.2"]
+    assert log.async_entity_ids_since(log.log_id, 3) == []
+    assert log.async_entity_ids_since(log.log_id, 4) is None
+    assert log.async_entity_ids_since("other", 3) is None
+
+
 async def test_subscribe_entities_with_unserializable_state(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2044,6 +2169,45 @@ async def test_manifest_list(
     ]
 
 
+async def test_manifest_list_versioned(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the manifests are only sent when the loaded integrations changed."""
+    await websocket_client.send_json({"id": 5, "type": "manifest/list", "version": ""})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["not_modified"] is False
+    version = msg["result"]["version"]
+    assert {manifest["domain"] for manifest in msg["result"]["data"]} == {
+        "http",
+        "websocket_api",
+    }
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "manifest/list", "version": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"version": version, "not_modified": True}
+
+    assert await async_setup_component(hass, "zone", {})
+    await websocket_client.send_json(
+        {"id": 7, "type": "manifest/list", "version": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["not_modified"] is False
+    assert "zone" in {manifest["domain"] for manifest in msg["result"]["data"]}
+    version = msg["result"]["version"]
+
+    # Platforms of integrations without a component don't fire an event
+    hass.config.components.add("bayesian.binary_sensor")
+    await websocket_client.send_json(
+        {"id": 8, "type": "manifest/list", "version": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["not_modified"] is False
+    assert "bayesian" in {manifest["domain"] for manifest in msg["result"]["data"]}
+
+
 async def test_manifest_list_specific_integrations(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2496,6 +2660,7 @@ async def test_integration_setup_info(
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": 0.5}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -2503,8 +2668,8 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 0.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": 0},
     ]
 
 
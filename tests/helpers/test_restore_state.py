@@ -2,6 +2,7 @@
 from collections.abc import Coroutine
 from datetime import datetime, timedelta
 import logging
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -65,6 +66,9 @@ async def test_caching_data(hass: HomeAssistant) -> None:
 
     data = async_get(hass)
     assert data.last_states == {}
+    # Let the startup dump of the failed load finish
+    await hass.async_block_till_done()
+    await data.store.async_save([state.as_dict() for state in stored_states])
 
     await async_load(hass)
     data = async_get(hass)
@@ -87,6 +91,85 @@ async def test_caching_data(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test the stored states are lazily restored from the shutdown snapshot."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    now = dt_util.utcnow()
+    stored_states = [
+        StoredState(State("input_boolean.b0", "on"), None, now),
+        StoredState(State("input_boolean.b1", "off", {"a": 1}), None, now),
+        StoredState(State("input_boolean.b2", "on"), None, now - timedelta(days=8)),
+    ]
+    await hass.async_block_till_done()
+    data = async_get(hass)
+    for stored_state in stored_states:
+        data.last_states[stored_state.state.entity_id] = stored_state
+
+    # Storage is mocked, the JSON store only has to exist on disk
+    store_path = Path(data.store.path)
+    store_path.write_text("{}")
+    await data.async_dump_states(write_snapshot=True)
+    assert Path(data.snapshot_path).exists()
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    assert data.last_states == {}
+    assert data.snapshot is not None
+    assert set(data.snapshot.index) == {"input_boolean.b0", "input_boolean.b1"}
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    state = await entity.async_get_last_state()
+    assert state is not None
+    assert state.state == "off"
+    assert state.attributes == {"a": 1}
+    assert list(data.last_states) == ["input_boolean.b1"]
+    assert set(data.snapshot.index) == {"input_boolean.b0"}
+
+    # States not requested yet are saved without decoding them
+    assert [
+        stored_state.state.entity_id for stored_state in data.async_get_stored_states()
+    ] == ["input_boolean.b1"]
+    with patch(
+        "homeassistant.helpers.restore_state.StoredState.from_dict"
+    ) as mock_from_dict:
+        await data.async_dump_states(write_snapshot=True)
+    assert not mock_from_dict.called
+    assert {
+        item["state"]["entity_id"] for item in hass_storage[STORAGE_KEY]["data"]
+    } == {"input_boolean.b0", "input_boolean.b1"}
+
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    assert set(data.snapshot.index) == {"input_boolean.b0", "input_boolean.b1"}
+    entity.entity_id = "input_boolean.b0"
+    state = await entity.async_get_last_state()
+    assert state is not None
+    assert state.state == "on"
+
+    # Any other write to the JSON store makes the snapshot stale
+    await hass.async_block_till_done()
+    store_path.write_text("{ }")
+    hass_storage[STORAGE_KEY]["data"] = [
+        {
+            "state": {"entity_id": "input_boolean.b3", "state": "on"},
+            "last_seen": now.isoformat(),
+        }
+    ]
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+    assert data.snapshot is None
+    assert list(data.last_states) == ["input_boolean.b3"]
+
+
 async def test_async_get_instance_backwards_compatibility(hass: HomeAssistant) -> None:
     """Test async_get_instance backwards compatibility."""
     await async_load(hass)
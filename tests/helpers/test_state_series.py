@@ -0,0 +1,138 @@
+"""Test the state series helper."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.state_series import (
+    DATA_STATE_SERIES,
+    StateSeriesWindow,
+    async_get_state_series,
+)
+
+from tests.components.recorder.common import async_wait_recording_done
+
+
+async def test_series_shared_by_consumers(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test consumers of the same source share one series."""
+    series = async_get_state_series(hass, "sensor.source")
+    assert async_get_state_series(hass, "sensor.source") is series
+    assert async_get_state_series(hass, "sensor.source", "attr") is not series
+
+    calls: list[tuple[str, bool]] = []
+
+    def _listener(state: State, added: bool) -> None:
+        calls.append((state.state, added))
+
+    window_samples = StateSeriesWindow(max_samples=2)
+    window_age = StateSeriesWindow(max_age=timedelta(seconds=45))
+    detach_samples = series.async_attach(window_samples, _listener)
+    detach_age = series.async_attach(window_age, lambda state, added: None)
+
+    for value in ("1", "2", "unknown", "3", "4"):
+        hass.states.async_set("sensor.source", value)
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(seconds=10))
+
+    assert calls == [
+        ("1", True),
+        ("2", True),
+        ("unknown", False),
+        ("3", True),
+        ("4", True),
+    ]
+    timestamps, values = series.async_get_window(window_samples)
+    assert values.tolist() == [3.0, 4.0]
+    timestamps, values = series.async_get_window(window_age)
+    assert values.tolist() == [2.0, 3.0, 4.0]
+    assert timestamps[-1] - timestamps[0] == 30
+    # The oldest sample is not needed by any consumer anymore
+    assert series.values.tolist() == [2.0, 3.0, 4.0]
+
+    detach_age()
+    hass.states.async_set("sensor.source", "5")
+    await hass.async_block_till_done()
+    assert series.values.tolist() == [4.0, 5.0]
+
+    detach_samples()
+    assert DATA_STATE_SERIES in hass.data
+    assert ("sensor.source", None) not in hass.data[DATA_STATE_SERIES]
+    hass.states.async_set("sensor.source", "6")
+    await hass.async_block_till_done()
+    assert series.values.tolist() == [4.0, 5.0]
+
+
+async def test_series_values(hass: HomeAssistant) -> None:
+    """Test states are converted to numeric values."""
+    binary_series = async_get_state_series(hass, "binary_sensor.source")
+    assert binary_series.value_from_state(State("binary_sensor.source", "on")) == 1.0
+    assert binary_series.value_from_state(State("binary_sensor.source", "off")) == 0.0
+    assert binary_series.value_from_state(State("binary_sensor.source", "x")) is None
+
+    attribute_series = async_get_state_series(hass, "sensor.source", "level")
+    assert (
+        attribute_series.value_from_state(State("sensor.source", "on", {"level": 5}))
+        == 5.0
+    )
+    assert attribute_series.value_from_state(State("sensor.source", "on")) is None
+    assert (
+        attribute_series.value_from_state(
+            State("sensor.source", "on", {"level": "high"})
+        )
+        is None
+    )
+
+
+async def test_series_warm(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test windows are only loaded when the series does not hold them yet."""
+    for value in ("1", "2", "3", "4"):
+        hass.states.async_set("sensor.source", value)
+        await hass.async_block_till_done()
+        freezer.tick(timedelta(seconds=10))
+    await async_wait_recording_done(hass)
+
+    series = async_get_state_series(hass, "sensor.source")
+    window_age = StateSeriesWindow(max_age=timedelta(seconds=25))
+    window_samples = StateSeriesWindow(max_samples=3)
+    window_all = StateSeriesWindow()
+    for window in (window_age, window_samples, window_all):
+        series.async_attach(window, lambda state, added: None)
+
+    with patch.object(
+        series,
+        "_fetch_states_from_database",
+        wraps=series._fetch_states_from_database,
+    ) as fetch_states:
+        await asyncio.gather(
+            series.async_warm(window_age), series.async_warm(window_age)
+        )
+        assert fetch_states.call_count == 1
+        assert series.values.tolist() == [3.0, 4.0]
+
+        await series.async_warm(window_age)
+        assert fetch_states.call_count == 1
+
+        await series.async_warm(window_samples)
+        assert fetch_states.call_count == 2
+        assert series.values.tolist() == [2.0, 3.0, 4.0]
+
+        await series.async_warm(window_samples)
+        assert fetch_states.call_count == 2
+
+        await series.async_warm(window_all)
+        assert fetch_states.call_count == 3
+        assert series.values.tolist() == [1.0, 2.0, 3.0, 4.0]
+
+        await series.async_warm(StateSeriesWindow(max_age=timedelta(days=1)))
+        assert fetch_states.call_count == 3
+
+    hass.states.async_set("sensor.source", "5")
+    await hass.async_block_till_done()
+    assert series.values.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -1030,3 +1030,42 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_platforms_to_preimport(hass: HomeAssistant) -> None:
+    """Test integrations are imported ahead of setup in dependency order."""
+    integrations = {
+        domain: mock_integration(
+            hass,
+            MockModule(
+                domain,
+                dependencies=dependencies,
+                partial_manifest={"after_dependencies": after_dependencies},
+            ),
+        )
+        for domain, dependencies, after_dependencies in (
+            ("comp_a", [], ["comp_c"]),
+            ("comp_b", [], []),
+            ("comp_c", ["comp_b", "comp_missing"], []),
+            ("comp_d", ["comp_e"], []),
+            ("comp_e", ["comp_d"], []),
+        )
+    }
+    MockConfigEntry(domain="comp_b").add_to_hass(hass)
+
+    platforms_by_integration = bootstrap._async_get_platforms_to_preimport(
+        hass, integrations, {*integrations, "comp_missing"}
+    )
+
+    assert [integration.domain for integration in platforms_by_integration] == [
+        "comp_b",
+        "comp_c",
+        "comp_a",
+        "comp_e",
+        "comp_d",
+    ]
+    assert platforms_by_integration[integrations["comp_a"]] == {"config"}
+    assert {"config", "config_flow", "sensor", "light"} <= platforms_by_integration[
+        integrations["comp_b"]
+    ]
@@ -1,4 +1,8 @@
 """Test to verify that we can load components."""
+import asyncio
+import pathlib
+import sys
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -206,6 +210,114 @@ async def test_get_integration_custom_component(
     assert integration.name == "Test Package"
 
 
+async def test_import_in_executor(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test importing an integration in the executor ahead of setup."""
+    integration = await loader.async_get_integration(hass, "test_package")
+    for name in (
+        "custom_components.test_package",
+        "custom_components.test_package.const",
+    ):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        wraps=loader.importlib.import_module,
+    ) as mock_import:
+        await integration.async_import_in_executor(["const", "missing"])
+
+    assert [call.args[0] for call in mock_import.call_args_list] == [
+        "custom_components.test_package",
+        "custom_components.test_package.const",
+    ]
+    assert "custom_components.test_package.const" in sys.modules
+    assert hass.data[loader.DATA_IMPORT_TIME]["test_package"] > 0
+    assert (await integration.async_get_component()).DOMAIN == "test_package"
+
+    # Nothing is imported when requirements are missing
+    monkeypatch.delitem(hass.data[loader.DATA_COMPONENTS], "test_package")
+    monkeypatch.delitem(sys.modules, "custom_components.test_package.const")
+    monkeypatch.setitem(integration.manifest, "requirements", ["missing-package==1.0"])
+    with patch("homeassistant.loader.is_installed", return_value=False):
+        await integration.async_import_in_executor(["const"])
+    assert "custom_components.test_package.const" not in sys.modules
+
+
+async def test_preimport_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are imported in dependency order without blocking setup."""
+    integrations = {
+        domain: loader.Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            {"name": domain, "domain": domain, "dependencies": dependencies},
+        )
+        for domain, dependencies in (
+            ("comp_a", []),
+            ("comp_b", ["comp_a"]),
+            ("comp_c", []),
+        )
+    }
+    imported: list[str] = []
+    import_started = asyncio.Event()
+    finish_import = threading.Event()
+
+    def _mock_import_modules(pkg_path, file_path, requirements, names):
+        imported.append(pkg_path)
+        hass.loop.call_soon_threadsafe(import_started.set)
+        assert finish_import.wait(5)
+        return 0.1
+
+    with patch("homeassistant.loader._import_modules", _mock_import_modules), patch(
+        "homeassistant.loader.MAX_CONCURRENT_PREIMPORTS", 1
+    ):
+        preimport = hass.async_create_task(
+            loader.async_preimport_integrations(
+                hass,
+                {integration: set() for integration in integrations.values()},
+            )
+        )
+        await import_started.wait()
+        assert imported == ["homeassistant.components.comp_a"]
+
+        # comp_c is still waiting for the import of comp_a, setup imports it
+        with patch.object(integrations["comp_c"], "get_component") as mock_get:
+            assert await integrations["comp_c"].async_get_component() is (
+                mock_get.return_value
+            )
+
+        finish_import.set()
+        await preimport
+
+    assert imported == [
+        "homeassistant.components.comp_a",
+        "homeassistant.components.comp_b",
+    ]
+    assert hass.data[loader.DATA_IMPORT_TIME] == {"comp_a": 0.1, "comp_b": 0.1}
+
+
+async def test_resolve_built_in_from_manifest_bundle(hass: HomeAssistant) -> None:
+    """Test built-in manifests are read from the bundle."""
+    components = sys.modules["homeassistant.components"]
+    with patch("pathlib.Path.read_text") as mock_read_text:
+        integration = loader.Integration.resolve_from_root(hass, components, "http")
+    assert not mock_read_text.called
+    assert integration is not None
+    assert integration.pkg_path == "homeassistant.components.http"
+    assert integration.file_path == pathlib.Path(http.__file__).parent
+    assert integration.name == "HTTP"
+    assert integration.is_built_in
+
+    # Integrations missing from the bundle fall back to their manifest.json
+    with patch.object(loader, "_load_manifest_bundle", return_value={}):
+        fallback = loader.Integration.resolve_from_root(hass, components, "http")
+    assert fallback is not None
+    assert fallback.manifest == integration.manifest
+
+
 def test_integration_properties(hass: HomeAssistant) -> None:
     """Test integration properties."""
     integration = loader.Integration(